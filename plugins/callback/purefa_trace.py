@@ -0,0 +1,215 @@
+# -*- coding: utf-8 -*-
+
+# (c) 2026, Simon Dodsley (simon@purestorage.com)
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+DOCUMENTATION = r"""
+---
+name: purefa_trace
+type: aggregate
+short_description: Summarize FlashArray REST API cost across a playbook run
+description:
+- Collects the C(_purefa_api_trace) returned by FlashArray modules run with
+  I(debug_timing=true), including the trace of each array returned by
+  M(purestorage.flasharray.purefa_info) with I(arrays).
+- At the end of the run prints calls and time per module, per REST endpoint
+  and per array, and the slowest tasks.
+- Optionally writes the collected data as JSON or CSV.
+version_added: '1.43.0'
+author:
+- Everpure Ansible Team (@sdodsley) <pure-ansible-team@purestorage.com>
+requirements:
+- Enable in ansible.cfg with C(callbacks_enabled = purestorage.flasharray.purefa_trace)
+- Set I(debug_timing=true) on the FlashArray tasks to trace, for example
+  with C(module_defaults)
+options:
+  output_file:
+    description:
+    - File to write the collected data to.
+    type: path
+    env:
+    - name: PUREFA_TRACE_OUTPUT_FILE
+    ini:
+    - section: callback_purefa_trace
+      key: output_file
+  output_format:
+    description:
+    - Format of I(output_file).
+    - C(json) writes the summary and every task trace.
+    - C(csv) writes one row per REST call.
+    type: str
+    choices: [ json, csv ]
+    default: json
+    env:
+    - name: PUREFA_TRACE_OUTPUT_FORMAT
+    ini:
+    - section: callback_purefa_trace
+      key: output_format
+  top:
+    description:
+    - Number of slowest tasks to show.
+    type: int
+    default: 10
+    env:
+    - name: PUREFA_TRACE_TOP
+    ini:
+    - section: callback_purefa_trace
+      key: top
+"""
+
+import csv
+import json
+
+from ansible.plugins.callback import CallbackBase
+
+TRACE_KEY = "_purefa_api_trace"
+CSV_FIELDS = (
+    "task",
+    "host",
+    "module",
+    "array",
+    "method",
+    "status",
+    "latency_ms",
+    "items",
+)
+
+
+def _add(totals, key, calls, time_ms):
+    entry = totals.setdefault(key, {"calls": 0, "time_ms": 0})
+    entry["calls"] += calls
+    entry["time_ms"] = round(entry["time_ms"] + time_ms, 3)
+
+
+class CallbackModule(CallbackBase):
+    CALLBACK_VERSION = 2.0
+    CALLBACK_TYPE = "aggregate"
+    CALLBACK_NAME = "purestorage.flasharray.purefa_trace"
+    CALLBACK_NEEDS_ENABLED = True
+
+    def __init__(self):
+        super(CallbackModule, self).__init__()
+        self.tasks = []
+
+    def _record(self, result):
+        results = result._result.get("results")
+        traces = [
+            item.get(TRACE_KEY)
+            for item in (results if isinstance(results, list) else [result._result])
+            if isinstance(item, dict)
+        ]
+        # purefa_info with several arrays returns a list of array traces
+        traces = [
+            trace
+            for entry in traces
+            for trace in (entry if isinstance(entry, list) else [entry])
+        ]
+        for trace in traces:
+            if trace:
+                self.tasks.append(
+                    {
+                        "task": result._task.get_name(),
+                        "host": result._host.get_name(),
+                        "module": result._task.action,
+                        "trace": trace,
+                    }
+                )
+
+    def v2_runner_on_ok(self, result):
+        self._record(result)
+
+    def v2_runner_on_failed(self, result, ignore_errors=False):
+        self._record(result)
+
+    def summarize(self):
+        """Return calls and time per module, endpoint and array"""
+        summary = {"modules": {}, "endpoints": {}, "arrays": {}}
+        for task in self.tasks:
+            trace = task["trace"]
+            _add(
+                summary["modules"],
+                task["module"],
+                trace["total_calls"],
+                trace["total_time_ms"],
+            )
+            _add(
+                summary["arrays"],
+                trace.get("array") or "unknown",
+                trace["total_calls"],
+                trace["total_time_ms"],
+            )
+            for method, totals in trace["by_method"].items():
+                _add(summary["endpoints"], method, totals["calls"], totals["time_ms"])
+        summary["slowest_tasks"] = [
+            {
+                "task": task["task"],
+                "host": task["host"],
+                "module": task["module"],
+                "calls": task["trace"]["total_calls"],
+                "time_ms": task["trace"]["total_time_ms"],
+            }
+            for task in sorted(
+                self.tasks,
+                key=lambda task: task["trace"]["total_time_ms"],
+                reverse=True,
+            )[: self.get_option("top")]
+        ]
+        return summary
+
+    def _display_totals(self, title, totals):
+        self._display.display("%s:" % title)
+        for name, entry in sorted(
+            totals.items(), key=lambda item: item[1]["time_ms"], reverse=True
+        ):
+            self._display.display(
+                "  %-50s %6d calls %12.1f ms" % (name, entry["calls"], entry["time_ms"])
+            )
+
+    def _write_output(self, summary):
+        output_file = self.get_option("output_file")
+        if self.get_option("output_format") == "csv":
+            with open(output_file, "w") as output:
+                writer = csv.DictWriter(output, fieldnames=CSV_FIELDS)
+                writer.writeheader()
+                for task in self.tasks:
+                    for call in task["trace"].get("calls", []):
+                        writer.writerow(
+                            {
+                                "task": task["task"],
+                                "host": task["host"],
+                                "module": task["module"],
+                                "array": task["trace"].get("array"),
+                                "method": call["method"],
+                                "status": call.get("status"),
+                                "latency_ms": call["latency_ms"],
+                                "items": call.get("items"),
+                            }
+                        )
+        else:
+            with open(output_file, "w") as output:
+                json.dump({"summary": summary, "tasks": self.tasks}, output, indent=2)
+
+    def v2_playbook_on_stats(self, stats):
+        if not self.tasks:
+            return
+        summary = self.summarize()
+        self._display.banner("FLASHARRAY API TRACE")
+        self._display_totals("Calls per module", summary["modules"])
+        self._display_totals("Time per endpoint", summary["endpoints"])
+        self._display_totals("Per array", summary["arrays"])
+        self._display.display("Slowest tasks:")
+        for task in summary["slowest_tasks"]:
+            self._display.display(
+                "  %-50s %6d calls %12.1f ms"
+                % (
+                    "%s (%s)" % (task["task"], task["host"]),
+                    task["calls"],
+                    task["time_ms"],
+                )
+            )
+        if self.get_option("output_file"):
+            self._write_output(summary)
@@ -36,6 +36,32 @@ options:
     type: bool
     default: false
     version_added: '1.29.0'
+  debug_timing:
+    description:
+     - Record every REST call made by the module with its HTTP status,
+       latency and item count.
+     - The calls and aggregate timings, including the slowest calls, are
+       returned in C(_purefa_api_trace).
+     - Only selector arguments such as names and filters are recorded,
+       never request bodies or credentials.
+    type: bool
+    default: false
+    version_added: '1.43.0'
+  api_retries:
+    description:
+     - Maximum number of times a REST call is retried when the array is
+       still throttling requests (HTTP 429 or 503) or the connection is
+       reset or times out.
+     - Retries wait as long as the C(Retry-After) header asks, otherwise
+       use exponential backoff with jitter.
+     - Only reads and writes that set absolute state are retried.
+     - When any call was retried, or I(debug_timing=true), the retries made
+       are returned in C(api_retry_stats).
+     - Retries are disabled by default. Set to a positive number, for
+       example C(3), to enable them.
+    type: int
+    default: 0
+    version_added: '1.43.0'
 notes:
   - This module requires the C(purestorage) and C(py-pure-client) Python libraries.
   - Additional Python libraries may be required for specific modules.
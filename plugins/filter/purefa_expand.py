@@ -0,0 +1,127 @@
+# -*- coding: utf-8 -*-
+
+# (c) 2026, Simon Dodsley (simon@purestorage.com)
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+DOCUMENTATION = r"""
+---
+name: purefa_expand
+short_description: Expand columnar purefa_info output into dictionaries
+description:
+- Converts subsets returned by M(purestorage.flasharray.purefa_info) with
+  I(output_format=columnar) back into dictionaries keyed by object name.
+- Accepts either one columnar subset or a whole C(purefa_info) result, in
+  which case every columnar subset is expanded and all other subsets are
+  returned unchanged.
+- A C(purefa_info) result collected with I(arrays), keyed by array name, is
+  expanded array by array.
+- Keys listed in the C(absent) entry of a subset are left out of the
+  expanded objects, so the original dictionaries are restored exactly.
+version_added: '1.43.0'
+author:
+- Everpure Ansible Team (@sdodsley) <pure-ansible-team@purestorage.com>
+options:
+  _input:
+    description:
+    - A columnar subset, or a C(purefa_info) result containing them,
+      optionally keyed by array name.
+    type: dict
+    required: true
+"""
+
+EXAMPLES = r"""
+- name: Collect volumes in the compact columnar format
+  purestorage.flasharray.purefa_info:
+    gather_subset:
+      - volumes
+    output_format: columnar
+  register: array_info
+
+- name: Show the serial number of one volume
+  debug:
+    msg: "{{ (array_info.purefa_info.volumes | purestorage.flasharray.purefa_expand)['vol1'].serial }}"
+
+- name: Expand every subset
+  set_fact:
+    purefa_info: "{{ array_info.purefa_info | purestorage.flasharray.purefa_expand }}"
+
+- name: Expand the subsets of every array of a multi-array result
+  set_fact:
+    fleet_info: "{{ fleet.purefa_info | purestorage.flasharray.purefa_expand }}"
+"""
+
+RETURN = r"""
+_value:
+  description:
+  - The subset as a dictionary of objects keyed by name, or the
+    C(purefa_info) result with every columnar subset expanded.
+  type: dict
+"""
+
+from ansible.errors import AnsibleFilterError
+
+COLUMNAR_KEYS = {"columns", "rows"}
+OPTIONAL_KEYS = {"absent"}
+
+
+def _is_columnar(data):
+    return (
+        isinstance(data, dict)
+        and COLUMNAR_KEYS <= set(data)
+        and set(data) <= COLUMNAR_KEYS | OPTIONAL_KEYS
+    )
+
+
+def _expand_subset(data):
+    columns = data["columns"]
+    try:
+        absent = {}
+        for row_index, column_index in data.get("absent") or []:
+            absent.setdefault(row_index, set()).add(column_index)
+        return dict(
+            (
+                row[0],
+                dict(
+                    (columns[column_index], row[column_index])
+                    for column_index in range(1, len(columns))
+                    if column_index not in absent.get(row_index, ())
+                ),
+            )
+            for row_index, row in enumerate(data["rows"])
+        )
+    except (IndexError, TypeError, ValueError) as err:
+        raise AnsibleFilterError("Invalid columnar purefa_info subset: %s" % err)
+
+
+def _expand_result(data):
+    expanded = {}
+    for key, value in data.items():
+        if _is_columnar(value):
+            value = _expand_subset(value)
+        elif isinstance(value, dict) and any(
+            _is_columnar(subset) for subset in value.values()
+        ):
+            # The information of one array of a result collected with arrays
+            value = _expand_result(value)
+        expanded[key] = value
+    return expanded
+
+
+def purefa_expand(data):
+    """Expand a columnar subset, or every columnar subset of a purefa_info result"""
+    if not isinstance(data, dict):
+        raise AnsibleFilterError(
+            "purefa_expand expects a dictionary, got %s" % type(data).__name__
+        )
+    if _is_columnar(data):
+        return _expand_subset(data)
+    return _expand_result(data)
+
+
+class FilterModule(object):
+    def filters(self):
+        return {"purefa_expand": purefa_expand}
@@ -0,0 +1,152 @@
+# -*- coding: utf-8 -*-
+
+# (c) 2026, Simon Dodsley (simon@purestorage.com)
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+DOCUMENTATION = r"""
+---
+name: purefa
+short_description: HttpApi plugin for Everpure FlashArray
+description:
+- Provides a persistent, authenticated REST 2.x session to a FlashArray.
+- Used with C(ansible_connection=ansible.netcommon.httpapi) so that modules
+  send their REST calls through a long-lived per-host connection process
+  instead of logging in on every task.
+- Supported by the purefa_admin, purefa_arrayname, purefa_banner,
+  purefa_console, purefa_eradication, purefa_eula, purefa_phonehome,
+  purefa_proxy, purefa_smtp and purefa_timeout modules. Other modules
+  connect directly with I(fa_url) and I(api_token).
+- Requires the C(ansible.netcommon) collection for the httpapi connection.
+version_added: '1.43.0'
+author:
+- Everpure Ansible Team (@sdodsley) <pure-ansible-team@purestorage.com>
+options:
+  api_token:
+    description:
+    - FlashArray API token used to log in.
+    - If not set, the connection password is used as the API token.
+    type: str
+    env:
+    - name: PUREFA_API
+    vars:
+    - name: ansible_httpapi_purefa_api_token
+  api_version:
+    description:
+    - REST API version to use.
+    - If not set, the highest 2.x version supported by the array is used.
+    type: str
+    vars:
+    - name: ansible_httpapi_purefa_api_version
+"""
+
+import json
+from urllib.error import HTTPError
+from urllib.parse import urlencode
+
+from ansible.errors import AnsibleAuthenticationFailure
+from ansible.plugins.httpapi import HttpApiBase
+
+BASE_HEADERS = {
+    "Content-Type": "application/json",
+    "Accept": "application/json",
+}
+
+
+def _version_key(version):
+    return tuple(int(part) for part in version.split("."))
+
+
+class HttpApi(HttpApiBase):
+    def __init__(self, connection):
+        super(HttpApi, self).__init__(connection)
+        self._api_version = None
+
+    def login(self, username, password):
+        """Exchange the API token for a session token"""
+        api_token = self.get_option("api_token") or password
+        if not api_token:
+            raise AnsibleAuthenticationFailure(
+                "An API token is required to connect to the FlashArray"
+            )
+        headers = dict(BASE_HEADERS)
+        headers["api-token"] = api_token
+        self.connection.send(
+            "/api/%s/login" % self.get_api_version(),
+            None,
+            method="POST",
+            headers=headers,
+        )
+        if not self.connection._auth:
+            raise AnsibleAuthenticationFailure(
+                "FlashArray login did not return a session token"
+            )
+
+    def logout(self):
+        """Release the session token on the array"""
+        if self.connection._auth:
+            self.connection.send(
+                "/api/%s/logout" % self.get_api_version(),
+                None,
+                method="POST",
+                headers=BASE_HEADERS,
+            )
+            self.connection._auth = None
+
+    def update_auth(self, response, response_text):
+        """Pick up the session token returned by login"""
+        token = response.headers.get("x-auth-token")
+        if token:
+            return {"x-auth-token": token}
+        return None
+
+    def get_api_version(self):
+        """Return the configured or highest supported 2.x REST version"""
+        if self._api_version is None:
+            self._api_version = self.get_option("api_version")
+        if self._api_version is None:
+            dummy, response_data = self.connection.send(
+                "/api/api_version", None, method="GET", headers=BASE_HEADERS
+            )
+            versions = json.loads(response_data.getvalue())["version"]
+            self._api_version = max(
+                (version for version in versions if version.startswith("2.")),
+                key=_version_key,
+            )
+        return self._api_version
+
+    def handle_httperror(self, exc):
+        """Re-login on an expired session, otherwise return the error response"""
+        if exc.code == 401 and self.connection._auth:
+            self.connection._auth = None
+            self.login(
+                self.connection.get_option("remote_user"),
+                self.connection.get_option("password"),
+            )
+            return True
+        return exc
+
+    def send_request(self, path, method="GET", params=None, body=None):
+        """Send a REST request and return the status code and decoded body"""
+        url = "/api/%s/%s" % (self.get_api_version(), path.lstrip("/"))
+        if params:
+            url += "?" + urlencode(params)
+        data = json.dumps(body) if body is not None else None
+        try:
+            response, response_data = self.connection.send(
+                url, data, method=method, headers=BASE_HEADERS
+            )
+            status_code = response.getcode()
+            content = response_data.getvalue()
+        except HTTPError as exc:
+            status_code = exc.code
+            content = exc.read()
+        if isinstance(content, bytes):
+            content = content.decode("utf-8")
+        try:
+            return status_code, json.loads(content) if content else {}
+        except ValueError:
+            return status_code, {"errors": [{"message": content}]}
@@ -0,0 +1,336 @@
+# -*- coding: utf-8 -*-
+
+# (c) 2026, Simon Dodsley (simon@purestorage.com)
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+DOCUMENTATION = r"""
+---
+name: purefa
+short_description: Everpure FlashArray inventory source
+description:
+- Builds inventory from the hosts, host groups, volumes and pods of one or
+  more FlashArrays.
+- Each object becomes an inventory host named C(<array>_<type>_<name>) with
+  its attributes in C(purefa_*) host variables. Characters other than
+  letters, digits, C(_), C(-) and C(.) are replaced with C(_), so the pod
+  volume C(pod1::vol1) becomes C(<array>_volume_pod1__vol1).
+- Objects are grouped by array (C(purefa_<array>)), by type
+  (C(purefa_hosts), C(purefa_hgroups), C(purefa_volumes), C(purefa_pods)),
+  by host group (C(purefa_hgroup_<name>)) and by pod (C(purefa_pod_<name>)).
+- Arrays are queried concurrently and results can be kept in the inventory
+  cache for I(cache_timeout) seconds.
+- An array that cannot be queried fails the inventory when I(strict=true).
+  Otherwise it is skipped with a warning and the results are not cached.
+- The inventory file name must end with C(purefa.yml) or C(purefa.yaml).
+version_added: '1.43.0'
+author:
+- Everpure Ansible Team (@sdodsley) <pure-ansible-team@purestorage.com>
+extends_documentation_fragment:
+- constructed
+- inventory_cache
+options:
+  plugin:
+    description:
+    - Name of this inventory plugin.
+    required: true
+    type: str
+    choices: [ purestorage.flasharray.purefa ]
+  arrays:
+    description:
+    - FlashArrays to query.
+    - If not set, the array given by the C(PUREFA_URL) and C(PUREFA_API)
+      environment variables is used.
+    type: list
+    elements: dict
+    suboptions:
+      fa_url:
+        description:
+        - FlashArray management IPv4 address or Hostname.
+        type: str
+        required: true
+      api_token:
+        description:
+        - FlashArray API token.
+        type: str
+        required: true
+  objects:
+    description:
+    - Types of object to add to the inventory.
+    type: list
+    elements: str
+    choices: [ hosts, hgroups, volumes, pods ]
+    default: [ hosts, hgroups, volumes, pods ]
+  max_workers:
+    description:
+    - Maximum number of arrays queried at the same time.
+    - Must be at least 1.
+    type: int
+    default: 4
+  disable_warnings:
+    description:
+    - Disable insecure certificate warnings.
+    type: bool
+    default: false
+requirements:
+- py-pure-client >= 1.26.0
+"""
+
+EXAMPLES = r"""
+# purefa.yml
+plugin: purestorage.flasharray.purefa
+arrays:
+  - fa_url: 10.10.10.2
+    api_token: e31060a7-21fc-e277-6240-25983c6c4592
+  - fa_url: 10.10.10.3
+    api_token: "{{ lookup('env', 'FA2_API_TOKEN') }}"
+objects:
+  - hosts
+  - hgroups
+cache: true
+cache_plugin: ansible.builtin.jsonfile
+cache_connection: ~/.ansible/purefa_inventory
+cache_timeout: 3600
+
+# Only volumes, grouped by their volume group
+plugin: purestorage.flasharray.purefa
+objects:
+  - volumes
+keyed_groups:
+  - key: purefa_volume_group
+    prefix: vgroup
+"""
+
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
+
+from ansible.errors import AnsibleError
+from ansible.plugins.inventory import BaseInventoryPlugin, Cacheable, Constructable
+
+from ansible_collections.purestorage.flasharray.plugins.module_utils.api_helpers import (
+    iter_items,
+)
+from ansible_collections.purestorage.flasharray.plugins.module_utils.error_handlers import (
+    FlashArrayAPIError,
+)
+
+HAS_PYPURECLIENT = True
+try:
+    from pypureclient import flasharray
+except ImportError:
+    HAS_PYPURECLIENT = False
+
+HAS_URLLIB3 = True
+try:
+    import urllib3
+except ImportError:
+    HAS_URLLIB3 = False
+
+USER_AGENT = "Ansible inventory purestorage.flasharray.purefa"
+
+
+def _name(reference):
+    return getattr(reference, "name", None)
+
+
+def _items(res, operation):
+    """Return the items of a list response, raising if the call failed"""
+    if getattr(res, "status_code", None) != 200:
+        raise FlashArrayAPIError(operation, res)
+    return list(res.items)
+
+
+def collect_array(client, objects):
+    """Return the inventory data of one array as JSON serialisable dicts"""
+    data = {"name": _items(client.get_arrays(), "get_arrays")[0].name}
+    connections = {"hosts": {}, "volumes": {}}
+    if "hosts" in objects or "volumes" in objects:
+        for connection in _items(client.get_connections(), "get_connections"):
+            host = _name(connection.host)
+            volume = connection.volume.name
+            if host:
+                connections["hosts"].setdefault(host, []).append(volume)
+                connections["volumes"].setdefault(volume, []).append(host)
+    if "hosts" in objects:
+        data["hosts"] = [
+            {
+                "name": host.name,
+                "host_group": _name(getattr(host, "host_group", None)),
+                "iqns": list(getattr(host, "iqns", None) or []),
+                "wwns": list(getattr(host, "wwns", None) or []),
+                "nqns": list(getattr(host, "nqns", None) or []),
+                "personality": getattr(host, "personality", None),
+                "volumes": sorted(set(connections["hosts"].get(host.name, []))),
+            }
+            for host in _items(client.get_hosts(), "get_hosts")
+        ]
+    if "hgroups" in objects:
+        data["hgroups"] = [
+            {"name": hgroup.name, "host_count": getattr(hgroup, "host_count", None)}
+            for hgroup in _items(client.get_host_groups(), "get_host_groups")
+        ]
+    if "volumes" in objects:
+        data["volumes"] = [
+            {
+                "name": volume.name,
+                "serial": getattr(volume, "serial", None),
+                "provisioned": getattr(volume, "provisioned", None),
+                "pod": _name(getattr(volume, "pod", None)),
+                "volume_group": _name(getattr(volume, "volume_group", None)),
+                "hosts": sorted(set(connections["volumes"].get(volume.name, []))),
+            }
+            for volume in iter_items(client, "get_volumes", destroyed=False)
+        ]
+    if "pods" in objects:
+        data["pods"] = [
+            {
+                "name": pod.name,
+                "arrays": [_name(member) for member in getattr(pod, "arrays", [])],
+                "promotion_status": getattr(pod, "promotion_status", None),
+            }
+            for pod in _items(client.get_pods(destroyed=False), "get_pods")
+        ]
+    return data
+
+
+class InventoryModule(BaseInventoryPlugin, Constructable, Cacheable):
+    NAME = "purestorage.flasharray.purefa"
+
+    def verify_file(self, path):
+        """Only accept inventory files named purefa.yml or purefa.yaml"""
+        return super(InventoryModule, self).verify_file(path) and path.endswith(
+            ("purefa.yml", "purefa.yaml")
+        )
+
+    def _get_arrays(self):
+        arrays = self.get_option("arrays")
+        if not arrays:
+            if os.environ.get("PUREFA_URL") and os.environ.get("PUREFA_API"):
+                arrays = [
+                    {
+                        "fa_url": os.environ["PUREFA_URL"],
+                        "api_token": os.environ["PUREFA_API"],
+                    }
+                ]
+            else:
+                raise AnsibleError(
+                    "You must set arrays or the PUREFA_URL and PUREFA_API "
+                    "environment variables"
+                )
+        return [
+            {
+                "fa_url": self.templar.template(array["fa_url"]),
+                "api_token": self.templar.template(array["api_token"]),
+            }
+            for array in arrays
+        ]
+
+    def _query_array(self, array):
+        """Return the data of one array, or None if it was skipped"""
+        try:
+            client = flasharray.Client(
+                target=array["fa_url"],
+                api_token=array["api_token"],
+                user_agent=USER_AGENT,
+            )
+            return collect_array(client, self.get_option("objects"))
+        except Exception as err:
+            msg = "Failed to query FlashArray %s: %s" % (array["fa_url"], err)
+            if self.get_option("strict"):
+                raise AnsibleError(msg)
+            self.display.warning(msg + ". Skipping it.")
+            return None
+
+    def _fetch(self):
+        """Query all arrays concurrently, returning results in option order
+
+        Arrays that could not be queried and were skipped are returned as None.
+        """
+        if not HAS_PYPURECLIENT:
+            raise AnsibleError("py-pure-client is required for this inventory")
+        max_workers = self.get_option("max_workers")
+        if max_workers < 1:
+            raise AnsibleError("max_workers must be at least 1, got: %s" % max_workers)
+        if HAS_URLLIB3 and self.get_option("disable_warnings"):
+            urllib3.disable_warnings()
+        arrays = self._get_arrays()
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            return list(pool.map(self._query_array, arrays))
+
+    def _add_object(self, array, kind, obj, groups):
+        # Pod and volume group objects are named pod::name and vgroup/name
+        hostname = re.sub(r"[^\w.-]", "_", "%s_%s_%s" % (array, kind, obj["name"]))
+        self.inventory.add_host(hostname)
+        for group in groups:
+            group = self._sanitize_group_name(group)
+            self.inventory.add_group(group)
+            self.inventory.add_child(group, hostname)
+        hostvars = {"purefa_array": array, "purefa_type": kind}
+        for key, value in obj.items():
+            hostvars["purefa_" + key] = value
+        for key, value in hostvars.items():
+            self.inventory.set_variable(hostname, key, value)
+        strict = self.get_option("strict")
+        self._set_composite_vars(
+            self.get_option("compose"), hostvars, hostname, strict=strict
+        )
+        self._add_host_to_composed_groups(
+            self.get_option("groups"), hostvars, hostname, strict=strict
+        )
+        self._add_host_to_keyed_groups(
+            self.get_option("keyed_groups"), hostvars, hostname, strict=strict
+        )
+
+    def populate(self, results):
+        """Add the collected array data to the inventory"""
+        for data in results:
+            if data is None:
+                continue
+            array = data["name"]
+            array_group = "purefa_" + array
+            for host in data.get("hosts", []):
+                groups = [array_group, "purefa_hosts"]
+                if host["host_group"]:
+                    groups.append("purefa_hgroup_" + host["host_group"])
+                self._add_object(array, "host", host, groups)
+            for hgroup in data.get("hgroups", []):
+                self._add_object(
+                    array, "hgroup", hgroup, [array_group, "purefa_hgroups"]
+                )
+            for volume in data.get("volumes", []):
+                groups = [array_group, "purefa_volumes"]
+                if volume["pod"]:
+                    groups.append("purefa_pod_" + volume["pod"])
+                self._add_object(array, "volume", volume, groups)
+            for pod in data.get("pods", []):
+                self._add_object(
+                    array,
+                    "pod",
+                    pod,
+                    [array_group, "purefa_pods", "purefa_pod_" + pod["name"]],
+                )
+
+    def parse(self, inventory, loader, path, cache=True):
+        super(InventoryModule, self).parse(inventory, loader, path, cache)
+        self._read_config_data(path)
+
+        cache_key = self.get_cache_key(path)
+        use_cache = self.get_option("cache")
+        update_cache = use_cache and not cache
+        results = None
+        if use_cache and cache:
+            try:
+                results = self._cache[cache_key]
+            except KeyError:
+                update_cache = True
+        if results is None:
+            results = self._fetch()
+            # Do not keep the results of skipped arrays out for cache_timeout
+            update_cache = update_cache and None not in results
+        if update_cache:
+            self._cache[cache_key] = results
+        self.populate(results)
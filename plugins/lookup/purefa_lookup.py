@@ -0,0 +1,267 @@
+# -*- coding: utf-8 -*-
+
+# (c) 2026, Simon Dodsley (simon@purestorage.com)
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+DOCUMENTATION = r"""
+---
+name: purefa_lookup
+short_description: Query objects on an Everpure FlashArray
+description:
+- Returns objects from a FlashArray REST list endpoint, such as volumes,
+  hosts or pods, running on the controller.
+- Selection is done on the array with a server-side I(filter) expression,
+  so only matching objects are transferred.
+- Results are cached for the rest of the play, so repeating the same query
+  in later tasks or for other hosts does not contact the array again.
+version_added: '1.43.0'
+author:
+- Everpure Ansible Team (@sdodsley) <pure-ansible-team@purestorage.com>
+options:
+  _terms:
+    description:
+    - Object types to query, named as in the REST API with underscores,
+      for example C(volumes), C(hosts), C(host_groups) or C(volume_snapshots).
+    required: true
+    type: list
+    elements: str
+  fa_url:
+    description:
+    - FlashArray management IPv4 address or Hostname.
+    type: str
+    env:
+    - name: PUREFA_URL
+  api_token:
+    description:
+    - FlashArray API token.
+    type: str
+    env:
+    - name: PUREFA_API
+  filter:
+    description:
+    - Server-side filter expression, for example C(name='db*').
+    type: str
+  names:
+    description:
+    - Only return objects with these names.
+    type: list
+    elements: str
+  fields:
+    description:
+    - Only return these fields of each object.
+    - Nested fields can be selected with a dotted path such as
+      C(space.total_physical).
+    - If not set, all fields are returned.
+    type: list
+    elements: str
+  cache:
+    description:
+    - Cache results for the rest of the play.
+    - Cached results are kept in the local temporary directory of the
+      current C(ansible-playbook) run on the controller, and are removed
+      when it ends.
+    - If that directory cannot be used, results are not cached.
+    type: bool
+    default: true
+  cache_ttl:
+    description:
+    - Number of seconds a cached result is reused before the array is
+      queried again.
+    type: int
+    default: 600
+requirements:
+- py-pure-client >= 1.26.0
+"""
+
+EXAMPLES = r"""
+- name: Get the serials of the db volumes
+  ansible.builtin.debug:
+    msg: "{{ lookup('purestorage.flasharray.purefa_lookup', 'volumes',
+             filter=\"name='db*'\", fields=['name', 'serial'],
+             fa_url='10.10.10.2', api_token=fa_api_token) }}"
+
+- name: Template a single volume serial into a multipath alias
+  ansible.builtin.set_fact:
+    db1_wwid: "3624a9370{{ (query('purestorage.flasharray.purefa_lookup', 'volumes',
+               names=['db1'], fields=['serial']) | first).serial | lower }}"
+"""
+
+RETURN = r"""
+_raw:
+  description:
+  - Matching objects of all requested types, as dictionaries.
+  type: list
+  elements: dict
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import time
+
+from ansible import constants as C
+from ansible.errors import AnsibleError
+from ansible.plugins.lookup import LookupBase
+
+from ansible_collections.purestorage.flasharray.plugins.module_utils.api_helpers import (
+    DEFAULT_PAGE_SIZE,
+    iter_items,
+)
+
+HAS_PYPURECLIENT = True
+try:
+    from pypureclient import flasharray
+except ImportError:
+    HAS_PYPURECLIENT = False
+
+USER_AGENT = "Ansible lookup purestorage.flasharray.purefa_lookup"
+
+
+def _to_data(value):
+    if hasattr(value, "to_dict"):
+        return value.to_dict()
+    if isinstance(value, list):
+        return [_to_data(entry) for entry in value]
+    return value
+
+
+def _get_field(obj, path):
+    for attr in path.split("."):
+        obj = getattr(obj, attr, None)
+    return _to_data(obj)
+
+
+def project(obj, fields):
+    """Return an object as a dict, limited to fields if given"""
+    if not fields:
+        return _to_data(obj)
+    return dict((field, _get_field(obj, field)) for field in fields)
+
+
+def _cache_file(key, variables):
+    """Return the cache file for a query in the current play, or None.
+
+    Lookups run in short-lived worker processes, so the cache lives on disk
+    in the local temporary directory of the Ansible run. Ansible creates it
+    readable only by the current user and removes it when the run ends.
+    """
+    cache_dir = os.path.join(C.DEFAULT_LOCAL_TMP, "purefa_lookup")
+    try:
+        # Lookups in parallel forks may create the directory at the same time
+        os.makedirs(cache_dir, 0o700, exist_ok=True)
+    except OSError:
+        return None
+    play = str(variables.get("ansible_play_name", ""))
+    digest = hashlib.sha256(
+        json.dumps([play] + key, sort_keys=True).encode("utf-8")
+    ).hexdigest()
+    return os.path.join(cache_dir, digest + ".json")
+
+
+def _read_cache(cache_file, ttl):
+    """Return the cached objects, or None if missing or older than ttl"""
+    try:
+        if time.time() - os.path.getmtime(cache_file) > ttl:
+            return None
+        with open(cache_file) as cached:
+            return json.load(cached)
+    except (IOError, OSError, ValueError):
+        return None
+
+
+def _write_cache(cache_file, objects):
+    """Replace the cache file atomically so readers never see a partial file"""
+    tmp_file = None
+    try:
+        cache_fd, tmp_file = tempfile.mkstemp(
+            dir=os.path.dirname(cache_file), suffix=".tmp"
+        )
+        with os.fdopen(cache_fd, "w") as cached:
+            json.dump(objects, cached)
+        os.replace(tmp_file, cache_file)
+    except (IOError, OSError):
+        if tmp_file and os.path.exists(tmp_file):
+            os.remove(tmp_file)
+
+
+class LookupModule(LookupBase):
+    def _get_client(self):
+        fa_url = self.get_option("fa_url")
+        api_token = self.get_option("api_token")
+        if not (fa_url and api_token):
+            raise AnsibleError(
+                "You must set PUREFA_URL and PUREFA_API environment variables "
+                "or the fa_url and api_token lookup options"
+            )
+        if not HAS_PYPURECLIENT:
+            raise AnsibleError("py-pure-client is required for this lookup")
+        return flasharray.Client(
+            target=fa_url, api_token=api_token, user_agent=USER_AGENT
+        )
+
+    def _query(self, client, term):
+        method = "get_" + term
+        if not term.replace("_", "").isalpha() or not hasattr(client, method):
+            raise AnsibleError("Unknown FlashArray object type %s" % term)
+        kwargs = {}
+        if self.get_option("filter"):
+            kwargs["filter"] = self.get_option("filter")
+        if self.get_option("names"):
+            kwargs["names"] = self.get_option("names")
+        res = getattr(client, method)(limit=DEFAULT_PAGE_SIZE, **kwargs)
+        if res.status_code != 200:
+            raise AnsibleError("Failed to query %s: %s" % (term, res.errors[0].message))
+        fields = self.get_option("fields")
+        objects = [project(obj, fields) for obj in res.items]
+        if len(objects) == DEFAULT_PAGE_SIZE and res.continuation_token:
+            try:
+                objects.extend(
+                    project(obj, fields)
+                    for obj in iter_items(
+                        client,
+                        method,
+                        continuation_token=res.continuation_token,
+                        **kwargs,
+                    )
+                )
+            except Exception as err:
+                raise AnsibleError("Failed to query %s: %s" % (term, err))
+        return objects
+
+    def run(self, terms, variables=None, **kwargs):
+        self.set_options(var_options=variables, direct=kwargs)
+        variables = variables or {}
+        client = None
+        results = []
+        for term in terms:
+            cache_file = None
+            if self.get_option("cache"):
+                key = [
+                    self.get_option("fa_url"),
+                    hashlib.sha256(
+                        str(self.get_option("api_token")).encode("utf-8")
+                    ).hexdigest(),
+                    term,
+                    self.get_option("filter"),
+                    self.get_option("names"),
+                    self.get_option("fields"),
+                ]
+                cache_file = _cache_file(key, variables)
+                cached = None
+                if cache_file:
+                    cached = _read_cache(cache_file, self.get_option("cache_ttl"))
+                if cached is not None:
+                    results.extend(cached)
+                    continue
+            if client is None:
+                client = self._get_client()
+            objects = self._query(client, term)
+            if cache_file:
+                _write_cache(cache_file, objects)
+            results.extend(objects)
+        return results
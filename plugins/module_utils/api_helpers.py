@@ -14,10 +14,123 @@ from __future__ import absolute_import, division, print_function
 
 __metaclass__ = type
 
+import random
+import threading
+import time
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+
+from ansible_collections.purestorage.flasharray.plugins.module_utils.error_handlers import (
+    FlashArrayAPIError,
+)
 from ansible_collections.purestorage.flasharray.plugins.module_utils.version import (
     LooseVersion,
 )
 
+DEFAULT_PAGE_SIZE = 1000
+DEFAULT_CONTEXT_WORKERS = 4
+
+# Arguments whose values are shown in API traces; all others show only a type
+TRACE_ARGS = ("names", "ids", "filter", "context_names", "destroyed", "limit")
+TRACE_SLOWEST = 5
+
+# Small endpoints read by several purefa_info subsets, cached by CachedClient
+CACHED_METHODS = (
+    "get_arrays",
+    "get_controllers",
+    "get_directories_policies",
+    "get_directory_services",
+    "get_directory_services_roles",
+    "get_fleets",
+    "get_fleets_members",
+    "get_hardware",
+    "get_offloads",
+    "get_support",
+)
+
+# Transient failures retried by RetryingClient. The SDK already retries
+# throttled responses itself; these are what is left once it gives up.
+RETRY_STATUSES = (429, 503)
+RETRY_EXCEPTIONS = (ConnectionError, TimeoutError)
+try:
+    from urllib3 import exceptions as urllib3_exceptions
+except ImportError:
+    pass
+else:
+    RETRY_EXCEPTIONS += (
+        urllib3_exceptions.MaxRetryError,
+        urllib3_exceptions.ProtocolError,
+        urllib3_exceptions.TimeoutError,
+    )
+RETRY_BASE_DELAY = 1.0
+RETRY_MAX_DELAY = 30.0
+
+# Writes that set absolute state, so repeating one leaves the array unchanged
+RETRY_SAFE_WRITES = (
+    "patch_alert_watchers",
+    "patch_arrays",
+    "patch_dns",
+    "patch_smtp_servers",
+    "patch_support",
+    "patch_syslog_servers_settings",
+)
+
+SHARED_CAP_API_VERSION = "2.9"
+SAFE_MODE_API_VERSION = "2.10"
+SUBS_API_VERSION = "2.26"
+CONTEXT_API_VERSION = "2.38"
+TAGS_API_VERSION = "2.39"
+
+# Minimum REST API version for each capability flag on ApiCapabilities
+API_FEATURES = (
+    ("shared_cap", SHARED_CAP_API_VERSION),
+    ("safe_mode", SAFE_MODE_API_VERSION),
+    ("subs", SUBS_API_VERSION),
+    ("context", CONTEXT_API_VERSION),
+    ("tags", TAGS_API_VERSION),
+)
+
+
+def _parse_version(version):
+    """Return a REST API version string as a tuple of integers"""
+    return tuple(int(part) for part in str(version).split(".") if part.isdigit())
+
+
+class ApiCapabilities(
+    namedtuple(
+        "ApiCapabilities",
+        ["api_version", "version_tuple"] + [name for name, dummy in API_FEATURES],
+    )
+):
+    """Immutable set of feature flags resolved from a single API version.
+
+    Each name in API_FEATURES is a boolean attribute, so a per-object
+    check becomes an attribute read instead of two LooseVersion parses::
+
+        api_caps = get_api_capabilities(array)
+        if api_caps.tags:
+            ...
+        if api_caps.supports(NFS_SECURITY_VERSION):
+            ...
+    """
+
+    __slots__ = ()
+
+    @classmethod
+    def from_version(cls, api_version):
+        version_tuple = _parse_version(api_version)
+        flags = [
+            _parse_version(min_version) <= version_tuple
+            for dummy, min_version in API_FEATURES
+        ]
+        return cls(api_version, version_tuple, *flags)
+
+    def supports(self, min_version):
+        """Return True if the API version is at least min_version"""
+        return _parse_version(min_version) <= self.version_tuple
+
 
 def get_cached_api_version(client):
     """Get API version with caching to avoid repeated calls.
@@ -33,6 +146,104 @@ def get_cached_api_version(client):
     return client._cached_api_version
 
 
+def get_api_capabilities(client):
+    """Get the ApiCapabilities for a client, computed once per client.
+
+    Args:
+        client: FlashArray client instance
+
+    Returns:
+        ApiCapabilities: Feature flags for the array's API version
+    """
+    api_caps = getattr(client, "_api_capabilities", None)
+    if not isinstance(api_caps, ApiCapabilities):
+        api_caps = ApiCapabilities.from_version(client.get_rest_version())
+        client._api_capabilities = api_caps
+    return api_caps
+
+
+def get_local_array_name(client):
+    """Get the name of the array the client is connected to, once per client.
+
+    ``get_array`` seeds the name from its credential check, so this
+    normally makes no call.
+
+    Args:
+        client: FlashArray client instance
+
+    Returns:
+        str: Local array name
+    """
+    array_name = getattr(client, "_local_array_name", None)
+    if not isinstance(array_name, str):
+        array_name = list(client.get_arrays().items)[0].name
+        client._local_array_name = array_name
+    return array_name
+
+
+def get_item_count(client, method_name, failed_count=None, **kwargs):
+    """Count the objects a list call would return without fetching them.
+
+    Requests a single-item page with ``total_item_count`` so the array
+    returns the collection size instead of every object.
+
+    Args:
+        client: FlashArray client instance
+        method_name: Name of list method to call (e.g., 'get_volumes')
+        failed_count: Count to return if the call fails, such as 0 for
+            endpoints that fail on arrays without the feature
+        **kwargs: Additional filter arguments to pass to the method
+
+    Returns:
+        int: Number of matching objects, failed_count if the call failed,
+        or None if the array did not return a total, so that callers can
+        tell an unknown count from an empty collection
+    """
+    res = getattr(client, method_name)(limit=1, total_item_count=True, **kwargs)
+    if getattr(res, "status_code", None) != 200:
+        return failed_count
+    return getattr(res, "total_item_count", None)
+
+
+def iter_items(client, method_name, page_size=DEFAULT_PAGE_SIZE, **kwargs):
+    """Iterate over a list call one page at a time.
+
+    Pages of at most page_size objects are requested with ``limit`` and
+    followed with the returned ``continuation_token``, so only one page is
+    held in memory at a time however large the collection is.
+
+    Args:
+        client: FlashArray client instance
+        method_name: Name of list method to call (e.g., 'get_volume_snapshots')
+        page_size: Maximum number of objects to request per page
+        **kwargs: Additional filter arguments to pass to the method
+
+    Yields:
+        Objects returned by the list call, in API order
+
+    Raises:
+        FlashArrayAPIError: If any page is not returned, so that a failure
+        part way through is not mistaken for the end of the collection
+
+    Example:
+        for snap in iter_items(array, "get_volume_snapshots", destroyed=False):
+            snap_info[snap.name] = {...}
+    """
+    method = getattr(client, method_name)
+    while True:
+        res = method(limit=page_size, **kwargs)
+        if getattr(res, "status_code", None) != 200:
+            raise FlashArrayAPIError(method_name, res)
+        count = 0
+        for item in res.items:
+            count += 1
+            yield item
+        continuation_token = getattr(res, "continuation_token", None)
+        if count < page_size or not continuation_token:
+            return
+        kwargs["continuation_token"] = continuation_token
+
+
 def check_api_version(client, min_version, module, feature_name=None):
     """Check if array API version meets minimum requirement.
 
@@ -132,6 +343,131 @@ def delete_with_context(client, method_name, context_version, module, **kwargs):
     return get_with_context(client, method_name, context_version, module, **kwargs)
 
 
+def get_fleet_contexts(client):
+    """Return the names of the fleet members this array can query.
+
+    Args:
+        client: FlashArray client instance
+
+    Returns:
+        list: Member array names, or just the local array name if the array
+        is not in a fleet or the API version has no context support
+    """
+    if get_api_capabilities(client).context:
+        res = client.get_fleets_members()
+        if getattr(res, "status_code", None) == 200:
+            members = [member.member.name for member in res.items]
+            if members:
+                return members
+    return [get_local_array_name(client)]
+
+
+def _context_name(item, default):
+    name = getattr(getattr(item, "context", None), "name", None)
+    return name if isinstance(name, str) else default
+
+
+def _rejects_contexts(res):
+    """Return True if a call was rejected because of its context_names"""
+    if getattr(res, "status_code", None) != 400:
+        return False
+    for error in getattr(res, "errors", None) or []:
+        for attr in ("message", "context", "location_context"):
+            text = getattr(error, attr, None)
+            if isinstance(text, str) and "context" in text.lower():
+                return True
+    return False
+
+
+def get_items_across_contexts(
+    client,
+    method_name,
+    contexts,
+    max_workers=DEFAULT_CONTEXT_WORKERS,
+    page_size=DEFAULT_PAGE_SIZE,
+    **kwargs,
+):
+    """Run a list call in several fleet contexts and merge the results.
+
+    All contexts are first requested in one call with multiple
+    ``context_names``, paging with the continuation token. If the endpoint
+    rejects multiple contexts, or returns items without a context reference
+    that cannot be attributed to a member, each context is listed
+    separately on up to max_workers threads and its items are tagged with
+    the requested context. Below the context API version only the local
+    array is listed.
+
+    Args:
+        client: FlashArray client instance
+        method_name: Name of list method to call (e.g., 'get_volumes')
+        contexts: Names of the fleet members to query, as returned by
+            get_fleet_contexts
+        max_workers: Maximum number of contexts listed at the same time
+        page_size: Maximum number of objects requested per page
+        **kwargs: Additional filter arguments to pass to the method
+
+    Returns:
+        list: ``(context, item)`` tuples, grouped by context in the order
+        the array or contexts returned them
+
+    Raises:
+        FlashArrayAPIError: If a call fails for any other reason than the
+        endpoint rejecting multiple contexts
+
+    Example:
+        contexts = get_fleet_contexts(array)
+        for context, vol in get_items_across_contexts(
+            array, "get_volumes", contexts, destroyed=False
+        ):
+            fleet_vols.setdefault(context, []).append(vol.name)
+    """
+    contexts = list(contexts)
+    if not contexts:
+        return []
+    if not get_api_capabilities(client).context:
+        local = get_local_array_name(client)
+        return [
+            (local, item)
+            for item in iter_items(client, method_name, page_size, **kwargs)
+        ]
+    res = getattr(client, method_name)(
+        limit=page_size, context_names=contexts, **kwargs
+    )
+    if getattr(res, "status_code", None) == 200:
+        items = list(res.items)
+        continuation_token = getattr(res, "continuation_token", None)
+        if len(items) >= page_size and continuation_token:
+            items.extend(
+                iter_items(
+                    client,
+                    method_name,
+                    page_size,
+                    context_names=contexts,
+                    continuation_token=continuation_token,
+                    **kwargs,
+                )
+            )
+        default = contexts[0] if len(contexts) == 1 else None
+        tagged = [(_context_name(item, default), item) for item in items]
+        if all(context is not None for context, dummy in tagged):
+            return tagged
+    elif not _rejects_contexts(res):
+        raise FlashArrayAPIError(method_name, res)
+
+    def list_context(context):
+        return list(
+            iter_items(
+                client, method_name, page_size, context_names=[context], **kwargs
+            )
+        )
+
+    with ThreadPoolExecutor(max_workers=min(len(contexts), max_workers)) as executor:
+        results = list(executor.map(list_context, contexts))
+    return [
+        (context, item) for context, items in zip(contexts, results) for item in items
+    ]
+
+
 def post_with_throttle_and_context(
     client, method_name, throttle_version, context_version, module, **kwargs
 ):
@@ -195,3 +531,336 @@ def check_response(response, module, operation="Operation"):
             status_code=response.status_code,
             changed=False,
         )
+
+
+class CachedClient(object):
+    """Request-scoped memoization proxy for a FlashArray client.
+
+    Successful calls to the small, repeatedly read endpoints in
+    ``cached_methods`` are cached by method name and arguments for the
+    lifetime of the proxy, so they are only sent to the array once per
+    module run. The items of a cached response are materialized into a list
+    so every caller can iterate them. Large listings such as volumes or
+    connections are passed through unmaterialized, as are paginated calls
+    (``limit`` or ``continuation_token``) and all other attributes.
+
+    Args:
+        client: FlashArray client instance
+        cached_methods: Names of the methods to cache
+
+    Example:
+        array = CachedClient(get_array(module))
+        ...
+        module.exit_json(changed=False, api_cache=array.cache_stats())
+    """
+
+    def __init__(self, client, cached_methods=CACHED_METHODS):
+        self._client = client
+        self._cached_methods = frozenset(cached_methods)
+        self._cache = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def __getattr__(self, name):
+        attr = getattr(self._client, name)
+        if name not in self._cached_methods or not callable(attr):
+            return attr
+
+        def cached_call(*args, **kwargs):
+            if "limit" in kwargs or "continuation_token" in kwargs:
+                return attr(*args, **kwargs)
+            key = (name, repr(args), repr(sorted(kwargs.items())))
+            with self._lock:
+                if key in self._cache:
+                    self.hits += 1
+                    return self._cache[key]
+                self.misses += 1
+            response = attr(*args, **kwargs)
+            if getattr(response, "status_code", 200) == 200:
+                if hasattr(response, "items"):
+                    response.items = list(response.items)
+                with self._lock:
+                    self._cache[key] = response
+            return response
+
+        return cached_call
+
+    def cache_stats(self):
+        """Return the cache hit and miss counters.
+
+        Returns:
+            dict: ``hits`` and ``misses`` counts for this client
+        """
+        return {"hits": self.hits, "misses": self.misses}
+
+
+def _summarize_args(args, kwargs):
+    """Return a short, secret-free description of call arguments"""
+    summary = ["<%s>" % type(arg).__name__ for arg in args]
+    for key in sorted(kwargs):
+        value = kwargs[key]
+        if key in TRACE_ARGS:
+            summary.append("%s=%s" % (key, str(value)[:80]))
+        else:
+            summary.append("%s=<%s>" % (key, type(value).__name__))
+    return ", ".join(summary)
+
+
+def _count_items(response):
+    count = getattr(response, "total_item_count", None)
+    if isinstance(count, int):
+        return count
+    try:
+        return len(response.items)
+    except (AttributeError, TypeError):
+        return None
+
+
+class TracingClient(object):
+    """Timing proxy for a FlashArray client.
+
+    Every public method call is recorded with its name, an argument summary,
+    HTTP status, latency and item count. Argument values are only recorded
+    for selectors such as ``names`` and ``filter``, so request bodies and
+    credentials never appear in the trace. All other attributes are passed
+    through to the wrapped client.
+
+    Args:
+        client: FlashArray client instance
+
+    Example:
+        array = TracingClient(array)
+        ...
+        module.exit_json(changed=False, _purefa_api_trace=array.trace_report())
+    """
+
+    def __init__(self, client, target=None):
+        self._client = client
+        self._target = target
+        self._calls = []
+        self._lock = threading.Lock()
+
+    def __getattr__(self, name):
+        attr = getattr(self._client, name)
+        if name.startswith("_") or not callable(attr):
+            return attr
+
+        def traced_call(*args, **kwargs):
+            entry = {"method": name, "args": _summarize_args(args, kwargs)}
+            start = time.time()
+            try:
+                response = attr(*args, **kwargs)
+            except Exception:
+                entry["status"] = None
+                raise
+            else:
+                entry["status"] = getattr(response, "status_code", None)
+                entry["items"] = _count_items(response)
+                return response
+            finally:
+                entry["latency_ms"] = round((time.time() - start) * 1000, 3)
+                with self._lock:
+                    self._calls.append(entry)
+
+        return traced_call
+
+    def trace_report(self):
+        """Return the recorded calls with aggregate timings.
+
+        Returns:
+            dict: The traced ``array``, ``calls`` in order, ``total_calls``,
+            ``total_time_ms``, per-method ``by_method`` counts and times, and
+            the ``slowest`` calls
+        """
+        with self._lock:
+            calls = list(self._calls)
+        by_method = {}
+        for call in calls:
+            method = by_method.setdefault(call["method"], {"calls": 0, "time_ms": 0})
+            method["calls"] += 1
+            method["time_ms"] = round(method["time_ms"] + call["latency_ms"], 3)
+        return {
+            "array": self._target,
+            "total_calls": len(calls),
+            "total_time_ms": round(sum(call["latency_ms"] for call in calls), 3),
+            "by_method": by_method,
+            "slowest": sorted(calls, key=lambda call: call["latency_ms"], reverse=True)[
+                :TRACE_SLOWEST
+            ],
+            "calls": calls,
+        }
+
+
+def enable_api_trace(module, client, target=None):
+    """Wrap a client in a TracingClient and report its trace on exit.
+
+    The module's ``exit_json`` and ``fail_json`` are wrapped to add the
+    trace report as ``_purefa_api_trace``, so modules need no changes.
+
+    Args:
+        module: AnsibleModule instance
+        client: FlashArray client instance
+        target: Array URL recorded in the report
+
+    Returns:
+        TracingClient: The wrapped client
+    """
+    traced = TracingClient(client, target)
+    _report_on_exit(module, "_purefa_api_trace", traced.trace_report)
+    return traced
+
+
+def _report_on_exit(module, key, report):
+    """Wrap exit_json and fail_json to add report() to the result as key.
+
+    Nothing is added when report() returns None.
+    """
+
+    def wrap(original):
+        def with_report(*args, **kwargs):
+            result = report()
+            if result is not None:
+                kwargs[key] = result
+            original(*args, **kwargs)
+
+        return with_report
+
+    for exit_method in ("exit_json", "fail_json"):
+        setattr(module, exit_method, wrap(getattr(module, exit_method)))
+
+
+def _retry_after(headers):
+    """Return the seconds asked for by a ``Retry-After`` header, or None.
+
+    The header is either a number of seconds or an HTTP date, which is
+    converted to the seconds from now. A date in the past means no wait.
+    """
+    try:
+        value = (headers or {}).get("Retry-After")
+    except AttributeError:
+        return None
+    if value is None:
+        return None
+    try:
+        seconds = float(value)
+    except (TypeError, ValueError):
+        try:
+            retry_at = parsedate_to_datetime(str(value))
+        except (TypeError, ValueError):
+            return None
+        if retry_at.tzinfo is None:
+            retry_at = retry_at.replace(tzinfo=timezone.utc)
+        seconds = max((retry_at - datetime.now(timezone.utc)).total_seconds(), 0)
+    return seconds if seconds >= 0 else None
+
+
+def _retry_wait(headers, attempt):
+    """Return the seconds to wait before a retry.
+
+    A ``Retry-After`` header, in seconds or as an HTTP date, is honoured,
+    otherwise the wait is exponential backoff with full jitter. Both are
+    capped at RETRY_MAX_DELAY.
+    """
+    retry_after = _retry_after(headers)
+    if retry_after is not None:
+        return min(retry_after, RETRY_MAX_DELAY)
+    return random.uniform(0, min(RETRY_BASE_DELAY * 2**attempt, RETRY_MAX_DELAY))
+
+
+class RetryingClient(object):
+    """Retrying proxy for a FlashArray client.
+
+    ``get_*`` calls and the writes named in ``safe_methods`` are repeated
+    when the array is still throttling (HTTP 429 or 503) after the SDK's own
+    retries, or when the connection is reset or times out. Other writes are
+    never repeated, as the array may already have applied them. All other
+    attributes are passed through to the wrapped client.
+
+    Args:
+        client: FlashArray client instance
+        retries: Maximum number of retries per call
+        safe_methods: Write methods that may be repeated
+
+    Example:
+        array = RetryingClient(array, retries=3)
+        ...
+        module.exit_json(changed=False, api_retry_stats=array.retry_stats())
+    """
+
+    def __init__(self, client, retries=3, safe_methods=RETRY_SAFE_WRITES):
+        self._client = client
+        self._retries = retries
+        self._safe_methods = frozenset(safe_methods)
+        self._counts = {}
+        self._lock = threading.Lock()
+
+    def __getattr__(self, name):
+        attr = getattr(self._client, name)
+        if not callable(attr) or not (
+            name.startswith("get_") or name in self._safe_methods
+        ):
+            return attr
+
+        def retried_call(*args, **kwargs):
+            attempt = 0
+            while True:
+                try:
+                    response = attr(*args, **kwargs)
+                except RETRY_EXCEPTIONS:
+                    if attempt >= self._retries:
+                        raise
+                    wait = _retry_wait(None, attempt)
+                else:
+                    if (
+                        getattr(response, "status_code", None) not in RETRY_STATUSES
+                        or attempt >= self._retries
+                    ):
+                        return response
+                    wait = _retry_wait(getattr(response, "headers", None), attempt)
+                attempt += 1
+                with self._lock:
+                    self._counts[name] = self._counts.get(name, 0) + 1
+                time.sleep(wait)
+
+        return retried_call
+
+    def retry_stats(self):
+        """Return the retry counters.
+
+        Returns:
+            dict: Total ``retries`` and the retries of each method in
+            ``by_method``
+        """
+        with self._lock:
+            by_method = dict(self._counts)
+        return {"retries": sum(by_method.values()), "by_method": by_method}
+
+
+def enable_api_retry(module, client, retries, always_report=False):
+    """Wrap a client in a RetryingClient and report its retries on exit.
+
+    The module's ``exit_json`` and ``fail_json`` are wrapped to add the
+    retry counters as ``api_retry_stats``, so modules need no changes. The
+    counters are only added when a call was retried, unless always_report
+    is set.
+
+    Args:
+        module: AnsibleModule instance
+        client: FlashArray client instance
+        retries: Maximum number of retries per call
+        always_report: Add the counters even when nothing was retried
+
+    Returns:
+        RetryingClient: The wrapped client
+    """
+    retrying = RetryingClient(client, retries)
+
+    def report():
+        stats = retrying.retry_stats()
+        if stats["retries"] or always_report:
+            return stats
+        return None
+
+    _report_on_exit(module, "api_retry_stats", report)
+    return retrying
@@ -0,0 +1,158 @@
+# -*- coding: utf-8 -*-
+
+# (c) 2026, Simon Dodsley (simon@purestorage.com)
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+"""REST client for modules running over the purefa httpapi connection.
+
+When a task uses ``ansible_connection=ansible.netcommon.httpapi`` with
+``ansible_network_os=purestorage.flasharray.purefa``, requests are sent
+through the persistent connection process, which holds the authenticated
+session for the lifetime of the play. Responses mirror the attributes of
+py-pure-client responses (``status_code``, ``items``, ``errors``,
+``total_item_count`` and ``continuation_token``) so that helpers such as
+``check_response`` work unchanged.
+
+The py-pure-client methods listed in ``SDK_METHODS`` can be called on the
+client directly, so a module that only uses those methods can fall back to
+``get_array`` when no persistent connection is configured::
+
+    array = get_persistent_client(module) or get_array(module)
+    res = array.get_arrays()
+"""
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+from ansible.module_utils.connection import Connection
+
+# py-pure-client methods supported by PersistentClient, mapped to their
+# HTTP method, REST path and the keyword argument holding the request body
+SDK_METHODS = {
+    "get_arrays": ("GET", "arrays", None),
+    "patch_arrays": ("PATCH", "arrays", "array"),
+    "get_arrays_eula": ("GET", "arrays/eula", None),
+    "patch_arrays_eula": ("PATCH", "arrays/eula", "eula"),
+    "get_admins_settings": ("GET", "admins/settings", None),
+    "patch_admins_settings": ("PATCH", "admins/settings", "admin_settings"),
+    "get_controllers": ("GET", "controllers", None),
+    "get_smtp_servers": ("GET", "smtp-servers", None),
+    "patch_smtp_servers": ("PATCH", "smtp-servers", "smtp"),
+    "get_support": ("GET", "support", None),
+    "patch_support": ("PATCH", "support", "support"),
+}
+
+
+class RestItem(object):
+    """Attribute view of a REST response object"""
+
+    def __init__(self, data):
+        for key, value in data.items():
+            setattr(self, key, _to_item(value))
+
+    def to_dict(self):
+        return dict((key, _from_item(value)) for key, value in self.__dict__.items())
+
+    def __repr__(self):
+        return "RestItem(%r)" % self.to_dict()
+
+
+def _to_item(value):
+    if isinstance(value, dict):
+        return RestItem(value)
+    if isinstance(value, list):
+        return [_to_item(entry) for entry in value]
+    return value
+
+
+def _from_item(value):
+    if isinstance(value, RestItem):
+        return value.to_dict()
+    if isinstance(value, list):
+        return [_from_item(entry) for entry in value]
+    return value
+
+
+class RestResponse(object):
+    """REST response with the same attributes as a py-pure-client response"""
+
+    def __init__(self, status_code, body):
+        body = body or {}
+        self.status_code = status_code
+        self.items = [_to_item(item) for item in body.get("items", [])]
+        self.errors = [_to_item(error) for error in body.get("errors", [])]
+        self.total_item_count = body.get("total_item_count")
+        self.continuation_token = body.get("continuation_token")
+
+
+class PersistentClient(object):
+    """Send FlashArray REST calls through a persistent httpapi connection"""
+
+    def __init__(self, connection):
+        self._connection = connection
+        self._api_version = None
+
+    def __getattr__(self, name):
+        if name not in SDK_METHODS:
+            raise AttributeError(
+                "%s is not supported over the purefa httpapi connection" % name
+            )
+        method, path, body_arg = SDK_METHODS[name]
+
+        def sdk_method(**params):
+            body = params.pop(body_arg, None) if body_arg else None
+            return self.request(method, path, body=body, **params)
+
+        return sdk_method
+
+    def get_rest_version(self):
+        if self._api_version is None:
+            self._api_version = self._connection.get_api_version()
+        return self._api_version
+
+    def request(self, method, path, body=None, **params):
+        """Send a request for a REST path such as ``protection-groups/volumes``.
+
+        List parameters are joined with commas as the REST API expects and
+        request bodies may be plain dicts or py-pure-client models.
+        """
+        query = {}
+        for key, value in params.items():
+            if value is None:
+                continue
+            if isinstance(value, (list, tuple)):
+                value = ",".join(str(entry) for entry in value)
+            elif isinstance(value, bool):
+                value = str(value).lower()
+            query[key] = value
+        if hasattr(body, "to_dict"):
+            body = body.to_dict()
+        status_code, data = self._connection.send_request(
+            path, method=method, params=query or None, body=body
+        )
+        return RestResponse(status_code, data)
+
+    def get(self, path, **params):
+        return self.request("GET", path, **params)
+
+    def post(self, path, body=None, **params):
+        return self.request("POST", path, body=body, **params)
+
+    def patch(self, path, body=None, **params):
+        return self.request("PATCH", path, body=body, **params)
+
+    def delete(self, path, **params):
+        return self.request("DELETE", path, **params)
+
+
+def get_persistent_client(module):
+    """Return a PersistentClient if the task uses the purefa httpapi connection.
+
+    Returns None when the module is not running over a persistent
+    connection so that callers can fall back to ``get_array``.
+    """
+    socket_path = getattr(module, "_socket_path", None)
+    if not socket_path:
+        return None
+    return PersistentClient(Connection(socket_path))
@@ -47,20 +47,64 @@ except ImportError:
 HAS_PYPURECLIENT = True
 try:
     from pypureclient import flasharray
+    from pypureclient.exceptions import PureError
 except ImportError:
     HAS_PYPURECLIENT = False
 
 from os import environ
+import importlib
 import platform
 
 VERSION = 1.5
 USER_AGENT_BASE = "Ansible"
 
 
-def get_array(module):
-    """Return System Object or Fail"""
-    if HAS_URLLIB3 and module.params["disable_warnings"]:
-        urllib3.disable_warnings()
+class LazyModel(object):
+    """Stand-in for a pypureclient.flasharray class that is imported on first use.
+
+    Importing a model from pypureclient.flasharray loads the whole models
+    package of the newest REST version, on top of the one loaded for the
+    version the client negotiates. Deferring it means runs that only read
+    from the array, such as check mode or a state that is already correct,
+    never pay for that import.
+    """
+
+    # Set by get_array, so that a missing model fails the module cleanly
+    module = None
+
+    def __init__(self, name):
+        self._name = name
+        self._target = None
+
+    def _resolve(self):
+        if self._target is None:
+            try:
+                self._target = getattr(
+                    importlib.import_module("pypureclient.flasharray"), self._name
+                )
+            except (AttributeError, ImportError):
+                # pypureclient.flasharray resolves its names lazily and
+                # raises ImportError, not AttributeError, for a missing one
+                msg = (
+                    "The installed py-pure-client is too old, it does not "
+                    "provide %s. Upgrade py-pure-client." % self._name
+                )
+                if LazyModel.module is not None:
+                    LazyModel.module.fail_json(msg=msg)
+                raise ImportError(msg)
+        return self._target
+
+    def __call__(self, *args, **kwargs):
+        return self._resolve()(*args, **kwargs)
+
+    def __getattr__(self, name):
+        return getattr(self._resolve(), name)
+
+    def __repr__(self):
+        return "LazyModel(%r)" % self._name
+
+
+def _user_agent():
     if HAS_DISTRO:
         user_agent = "%(base)s %(class)s/%(version)s (%(platform)s)" % {
             "base": USER_AGENT_BASE,
@@ -75,34 +119,92 @@ def get_array(module):
             "version": VERSION,
             "platform": platform.platform(),
         }
+    return user_agent
+
+
+# Fragments of the PureError text raised when the array rejects the login,
+# as opposed to one raised while negotiating the REST version
+LOGIN_REJECTED_ERRORS = ("401", "403", "unauthorized", "forbidden", "token", "log in")
+
+
+def _login_rejected(err):
+    text = str(err).lower()
+    return any(fragment in text for fragment in LOGIN_REJECTED_ERRORS)
+
+
+def connect_array(module, array_name, api):
+    """Return a client for one array, or None if its credentials are rejected
+
+    The client logs in when it is created and the credentials are then
+    checked with a get_arrays call. Errors other than a rejected login,
+    such as an unresolvable or unreachable array or a failed REST version
+    negotiation, are raised.
+    """
+    if HAS_URLLIB3 and module.params["disable_warnings"]:
+        urllib3.disable_warnings()
+    try:
+        # The client logs in with the API token, so this raises if it is invalid
+        system = flasharray.Client(
+            target=array_name,
+            api_token=api,
+            user_agent=_user_agent(),
+        )
+    except PureError as err:
+        if _login_rejected(err):
+            return None
+        raise
+    res = system.get_arrays()
+    if getattr(res, "status_code", None) != 200:
+        return None
+    # Seed the local array name used by api_helpers.get_local_array_name
+    system._local_array_name = list(res.items)[0].name
+    return system
+
+
+def get_array(module):
+    """Return System Object or Fail"""
     array_name = module.params["fa_url"]
     api = module.params["api_token"]
     if HAS_PYPURECLIENT:
-        if array_name and api:
-            system = flasharray.Client(
-                target=array_name,
-                api_token=api,
-                user_agent=user_agent,
-            )
-        elif environ.get("PUREFA_URL") and environ.get("PUREFA_API"):
-            system = flasharray.Client(
-                target=(environ.get("PUREFA_URL")),
-                api_token=(environ.get("PUREFA_API")),
-                user_agent=user_agent,
-            )
-        else:
+        if not (array_name and api):
+            if environ.get("PUREFA_URL") and environ.get("PUREFA_API"):
+                array_name = environ.get("PUREFA_URL")
+                api = environ.get("PUREFA_API")
+            else:
+                module.fail_json(
+                    msg="You must set PUREFA_URL and PUREFA_API environment variables "
+                    "or the fa_url and api_token module arguments"
+                )
+        try:
+            system = connect_array(module, array_name, api)
+        except Exception as err:
             module.fail_json(
-                msg="You must set PUREFA_URL and PUREFA_API environment variables "
-                "or the fa_url and api_token module arguments"
+                msg="Failed to connect to FlashArray {0}: {1}".format(array_name, err)
             )
-        try:
-            system.get_hardware()
-        except Exception:
+        if system is None:
             module.fail_json(
                 msg="Pure Storage FlashArray authentication failed. Check your credentials"
             )
+        LazyModel.module = module
     else:
         module.fail_json(msg="py-pure-client and/or requests are not installed.")
+    if module.params.get("debug_timing"):
+        from ansible_collections.purestorage.flasharray.plugins.module_utils.api_helpers import (
+            enable_api_trace,
+        )
+
+        system = enable_api_trace(module, system, array_name)
+    if module.params.get("api_retries"):
+        from ansible_collections.purestorage.flasharray.plugins.module_utils.api_helpers import (
+            enable_api_retry,
+        )
+
+        system = enable_api_retry(
+            module,
+            system,
+            module.params["api_retries"],
+            always_report=module.params.get("debug_timing"),
+        )
     return system
 
 
@@ -113,4 +215,6 @@ def purefa_argument_spec():
         fa_url=dict(),
         api_token=dict(no_log=True),
         disable_warnings=dict(type="bool", default=False),
+        debug_timing=dict(type="bool", default=False),
+        api_retries=dict(type="int", default=0),
     )
@@ -145,17 +145,13 @@ EXAMPLES = r"""
 RETURN = r"""
 """
 
-HAS_PURESTORAGE = True
-try:
-    from pypureclient.flasharray import ActiveDirectoryPost, ActiveDirectoryPatch
-except ImportError:
-    HAS_PURESTORAGE = False
-
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.purestorage.flasharray.plugins.module_utils.version import (
     LooseVersion,
 )
 from ansible_collections.purestorage.flasharray.plugins.module_utils.purefa import (
+    HAS_PYPURECLIENT,
+    LazyModel,
     get_array,
     purefa_argument_spec,
 )
@@ -163,6 +159,11 @@ from ansible_collections.purestorage.flasharray.plugins.module_utils.api_helpers
     check_response,
 )
 
+HAS_PURESTORAGE = HAS_PYPURECLIENT
+
+ActiveDirectoryPost = LazyModel("ActiveDirectoryPost")
+ActiveDirectoryPatch = LazyModel("ActiveDirectoryPatch")
+
 MIN_REQUIRED_API_VERSION = "2.2"
 SERVER_API_VERSION = "2.6"
 MIN_JOIN_OU_API_VERSION = "2.8"
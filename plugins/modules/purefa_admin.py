@@ -21,6 +21,9 @@ version_added: '1.12.0'
 short_description: Configure Everpure FlashArray Global Admin settings
 description:
 - Set global admin settings for the FlashArray
+- When run with C(ansible_connection=ansible.netcommon.httpapi) and
+  C(ansible_network_os=purestorage.flasharray.purefa) the REST calls are
+  sent through the persistent session of the purefa httpapi plugin.
 author:
 - Everpure Ansible Team (@sdodsley) <pure-ansible-team@purestorage.com>
 options:
@@ -61,15 +64,10 @@ EXAMPLES = r"""
 RETURN = r"""
 """
 
-HAS_PURESTORAGE = True
-try:
-    from pypureclient.flasharray import AdminSettings
-except ImportError:
-    HAS_PURESTORAGE = False
-
-
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.purestorage.flasharray.plugins.module_utils.purefa import (
+    HAS_PYPURECLIENT,
+    LazyModel,
     get_array,
     purefa_argument_spec,
 )
@@ -79,6 +77,13 @@ from ansible_collections.purestorage.flasharray.plugins.module_utils.version imp
 from ansible_collections.purestorage.flasharray.plugins.module_utils.api_helpers import (
     check_response,
 )
+from ansible_collections.purestorage.flasharray.plugins.module_utils.httpapi import (
+    get_persistent_client,
+)
+
+HAS_PURESTORAGE = HAS_PYPURECLIENT
+
+AdminSettings = LazyModel("AdminSettings")
 
 MIN_API_VERSION = "2.2"
 
@@ -100,7 +105,7 @@ def main():
         module.fail_json(msg="py-pure-client sdk is required for this module")
     if module.params["lockout"] and not 1 <= module.params["lockout"] <= 7776000:
         module.fail_json(msg="Lockout must be between 1 and 7776000 seconds")
-    array = get_array(module)
+    array = get_persistent_client(module) or get_array(module)
     api_version = array.get_rest_version()
     changed = False
     if LooseVersion(MIN_API_VERSION) <= LooseVersion(api_version):
@@ -66,6 +66,8 @@ RETURN = r"""
 import re
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.purestorage.flasharray.plugins.module_utils.purefa import (
+    HAS_PYPURECLIENT,
+    LazyModel,
     get_array,
     purefa_argument_spec,
 )
@@ -73,11 +75,10 @@ from ansible_collections.purestorage.flasharray.plugins.module_utils.api_helpers
     check_response,
 )
 
-HAS_PURESTORAGE = True
-try:
-    from pypureclient.flasharray import AlertWatcherPost, AlertWatcherPatch
-except ImportError:
-    HAS_PURESTORAGE = False
+HAS_PURESTORAGE = HAS_PYPURECLIENT
+
+AlertWatcherPost = LazyModel("AlertWatcherPost")
+AlertWatcherPatch = LazyModel("AlertWatcherPatch")
 
 
 def test_alert(module, array):
@@ -22,6 +22,9 @@ short_description: Configure Everpure FlashArray array name
 description:
 - Configure name of array for Everpure FlashArrays.
 - Ideal for Day 0 initial configuration.
+- When run with C(ansible_connection=ansible.netcommon.httpapi) and
+  C(ansible_network_os=purestorage.flasharray.purefa) the REST calls are
+  sent through the persistent session of the purefa httpapi plugin.
 author:
 - Everpure Ansible Team (@sdodsley) <pure-ansible-team@purestorage.com>
 options:
@@ -60,16 +63,11 @@ EXAMPLES = r"""
 RETURN = r"""
 """
 
-HAS_PURESTORAGE = True
-try:
-    from pypureclient.flasharray import Arrays
-except ImportError:
-    HAS_PURESTORAGE = False
-
-
 import re
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.purestorage.flasharray.plugins.module_utils.purefa import (
+    HAS_PYPURECLIENT,
+    LazyModel,
     get_array,
     purefa_argument_spec,
 )
@@ -77,6 +75,13 @@ from ansible_collections.purestorage.flasharray.plugins.module_utils.api_helpers
     get_with_context,
     check_response,
 )
+from ansible_collections.purestorage.flasharray.plugins.module_utils.httpapi import (
+    get_persistent_client,
+)
+
+HAS_PURESTORAGE = HAS_PYPURECLIENT
+
+Arrays = LazyModel("Arrays")
 
 CONTEXT_VERSION = "2.38"
 
@@ -114,7 +119,7 @@ def main():
     if not HAS_PURESTORAGE:
         module.fail_json(msg="py-pure-client sdk is required for this module")
 
-    array = get_array(module)
+    array = get_persistent_client(module) or get_array(module)
     pattern = re.compile("^[a-zA-Z0-9]([a-zA-Z0-9-]{0,54}[a-zA-Z0-9])?$")
     if not pattern.match(module.params["name"]):
         module.fail_json(
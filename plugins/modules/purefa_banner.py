@@ -23,6 +23,9 @@ description:
 - Configure MOTD for Everpure FlashArrays.
 - This will be shown during an SSH or GUI login to the array.
 - Multiple line messages can be achieved using \\n.
+- When run with C(ansible_connection=ansible.netcommon.httpapi) and
+  C(ansible_network_os=purestorage.flasharray.purefa) the REST calls are
+  sent through the persistent session of the purefa httpapi plugin.
 author:
 - Everpure Ansible Team (@sdodsley) <pure-ansible-team@purestorage.com>
 options:
@@ -62,6 +65,16 @@ EXAMPLES = r"""
     state: absent
     fa_url: 10.10.10.2
     api_token: e31060a7-21fc-e277-6240-25983c6c4592
+
+- name: Set banner text over a persistent httpapi session
+  purestorage.flasharray.purefa_banner:
+    banner: "Authorized users only"
+  vars:
+    ansible_connection: ansible.netcommon.httpapi
+    ansible_network_os: purestorage.flasharray.purefa
+    ansible_httpapi_use_ssl: true
+    ansible_httpapi_validate_certs: false
+    ansible_httpapi_purefa_api_token: e31060a7-21fc-e277-6240-25983c6c4592
 """
 
 RETURN = r"""
@@ -69,6 +82,8 @@ RETURN = r"""
 
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.purestorage.flasharray.plugins.module_utils.purefa import (
+    HAS_PYPURECLIENT,
+    LazyModel,
     get_array,
     purefa_argument_spec,
 )
@@ -76,12 +91,14 @@ from ansible_collections.purestorage.flasharray.plugins.module_utils.api_helpers
     get_with_context,
     check_response,
 )
+from ansible_collections.purestorage.flasharray.plugins.module_utils.httpapi import (
+    get_persistent_client,
+)
+
+HAS_PURESTORAGE = HAS_PYPURECLIENT
+
+Arrays = LazyModel("Arrays")
 
-HAS_PURESTORAGE = True
-try:
-    from pypureclient.flasharray import Arrays
-except ImportError:
-    HAS_PURESTORAGE = False
 
 CONTEXT_VERSION = "2.38"
 
@@ -139,7 +156,7 @@ def main():
         module.fail_json(msg="py-pure-client sdk is required for this module")
 
     state = module.params["state"]
-    array = get_array(module)
+    array = get_persistent_client(module) or get_array(module)
     res = get_with_context(array, "get_arrays", CONTEXT_VERSION, module)
     current_banner = list(res.items)[0].banner
     # set banner if empty value or value differs
@@ -201,6 +201,7 @@ from ansible_collections.purestorage.flasharray.plugins.module_utils.version imp
 )
 from ansible_collections.purestorage.flasharray.plugins.module_utils.api_helpers import (
     check_response,
+    get_local_array_name,
 )
 
 MIN_REQUIRED_API_VERSION = "2.4"
@@ -511,7 +512,7 @@ def main():
     state = module.params["state"]
     if state in ["present"]:
         if not module.params["common_name"]:
-            module.params["common_name"] = list(array.get_arrays().items)[0].name
+            module.params["common_name"] = get_local_array_name(array)
         module.params["common_name"] = module.params["common_name"][:64]
 
     exists = bool(
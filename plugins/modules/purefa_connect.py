@@ -111,16 +111,6 @@ EXAMPLES = r"""
 RETURN = r"""
 """
 
-HAS_PYPURECLIENT = True
-try:
-    from pypureclient.flasharray import (
-        ArrayConnectionPost,
-        ArrayConnectionPatch,
-        Client,
-    )
-except ImportError:
-    HAS_PYPURECLIENT = False
-
 HAS_DISTRO = True
 try:
     import distro
@@ -129,6 +119,8 @@ except ImportError:
 
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.purestorage.flasharray.plugins.module_utils.purefa import (
+    HAS_PYPURECLIENT,
+    LazyModel,
     get_array,
     purefa_argument_spec,
 )
@@ -145,6 +137,10 @@ from ansible_collections.purestorage.flasharray.plugins.module_utils.api_helpers
 import platform
 import socket
 
+ArrayConnectionPost = LazyModel("ArrayConnectionPost")
+ArrayConnectionPatch = LazyModel("ArrayConnectionPatch")
+Client = LazyModel("Client")
+
 ENCRYPT_VERSION = "2.33"
 CONTEXT_VERSION = "2.38"
 
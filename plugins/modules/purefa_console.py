@@ -21,6 +21,9 @@ version_added: '1.0.0'
 short_description: Enable or Disable Everpure FlashArray Console Lock
 description:
 - Enablke or Disable root lockout from the array at the physical console for a Everpure FlashArray.
+- When run with C(ansible_connection=ansible.netcommon.httpapi) and
+  C(ansible_network_os=purestorage.flasharray.purefa) the REST calls are
+  sent through the persistent session of the purefa httpapi plugin.
 author:
 - Everpure Ansible Team (@sdodsley) <pure-ansible-team@purestorage.com>
 options:
@@ -59,14 +62,10 @@ EXAMPLES = r"""
 RETURN = r"""
 """
 
-HAS_PYPURECLIENT = True
-try:
-    from pypureclient.flasharray import Arrays
-except ImportError:
-    HAS_PYPURECLIENT = False
-
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.purestorage.flasharray.plugins.module_utils.purefa import (
+    HAS_PYPURECLIENT,
+    LazyModel,
     get_array,
     purefa_argument_spec,
 )
@@ -74,6 +73,11 @@ from ansible_collections.purestorage.flasharray.plugins.module_utils.api_helpers
     get_with_context,
     check_response,
 )
+from ansible_collections.purestorage.flasharray.plugins.module_utils.httpapi import (
+    get_persistent_client,
+)
+
+Arrays = LazyModel("Arrays")
 
 CONTEXT_VERSION = "2.38"
 
@@ -112,7 +116,7 @@ def main():
     if not HAS_PYPURECLIENT:
         module.fail_json(msg="purestorage sdk is required for this module")
 
-    array = get_array(module)
+    array = get_persistent_client(module) or get_array(module)
 
     update_console(module, array)
 
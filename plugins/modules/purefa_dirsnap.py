@@ -172,15 +172,11 @@ EXAMPLES = r"""
 RETURN = r"""
 """
 
-HAS_PURESTORAGE = True
-try:
-    from pypureclient.flasharray import DirectorySnapshotPost, DirectorySnapshotPatch
-except ImportError:
-    HAS_PURESTORAGE = False
-
 import re
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.purestorage.flasharray.plugins.module_utils.purefa import (
+    HAS_PYPURECLIENT,
+    LazyModel,
     get_array,
     purefa_argument_spec,
 )
@@ -195,6 +191,11 @@ from ansible_collections.purestorage.flasharray.plugins.module_utils.api_helpers
     post_with_context,
 )
 
+HAS_PURESTORAGE = HAS_PYPURECLIENT
+
+DirectorySnapshotPost = LazyModel("DirectorySnapshotPost")
+DirectorySnapshotPatch = LazyModel("DirectorySnapshotPatch")
+
 MIN_REQUIRED_API_VERSION = "2.2"
 MIN_RENAME_API_VERSION = "2.10"
 CONTEXT_VERSION = "2.42"
@@ -112,17 +112,13 @@ EXAMPLES = r"""
 RETURN = r"""
 """
 
-HAS_PURESTORAGE = True
-try:
-    from pypureclient.flasharray import DnsPost, DnsPatch, ReferenceNoId
-except ImportError:
-    HAS_PURESTORAGE = False
-
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.purestorage.flasharray.plugins.module_utils.version import (
     LooseVersion,
 )
 from ansible_collections.purestorage.flasharray.plugins.module_utils.purefa import (
+    HAS_PYPURECLIENT,
+    LazyModel,
     get_array,
     purefa_argument_spec,
 )
@@ -131,6 +127,12 @@ from ansible_collections.purestorage.flasharray.plugins.module_utils.api_helpers
     check_response,
 )
 
+HAS_PURESTORAGE = HAS_PYPURECLIENT
+
+DnsPost = LazyModel("DnsPost")
+DnsPatch = LazyModel("DnsPatch")
+ReferenceNoId = LazyModel("ReferenceNoId")
+
 MULTIPLE_DNS = "2.15"
 CONTEXT_API_VERSION = "2.47"
 
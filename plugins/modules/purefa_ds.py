@@ -178,17 +178,10 @@ EXAMPLES = r"""
 RETURN = r"""
 """
 
-HAS_PURESTORAGE = True
-try:
-    from pypureclient.flasharray import (
-        DirectoryService,
-        DirectoryServiceManagement,
-    )
-except ImportError:
-    HAS_PURESTORAGE = False
-
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.purestorage.flasharray.plugins.module_utils.purefa import (
+    HAS_PYPURECLIENT,
+    LazyModel,
     get_array,
     purefa_argument_spec,
 )
@@ -197,6 +190,11 @@ from ansible_collections.purestorage.flasharray.plugins.module_utils.api_helpers
     check_response,
 )
 
+HAS_PURESTORAGE = HAS_PYPURECLIENT
+
+DirectoryService = LazyModel("DirectoryService")
+DirectoryServiceManagement = LazyModel("DirectoryServiceManagement")
+
 CONTEXT_VERSION = "2.42"
 
 
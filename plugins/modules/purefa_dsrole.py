@@ -111,20 +111,11 @@ MIN_DSROLE_API_VERSION = "2.30"
 POLICY_API_VERSION = "2.36"
 CONTEXT_VERSION = "2.42"
 
-HAS_PYPURECLIENT = True
-try:
-    from pypureclient.flasharray import (
-        DirectoryServiceRole,
-        DirectoryServiceRolePost,
-        Reference,
-        ReferenceNoId,
-    )
-except ImportError:
-    HAS_PYPURECLIENT = False
-
 
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.purestorage.flasharray.plugins.module_utils.purefa import (
+    HAS_PYPURECLIENT,
+    LazyModel,
     get_array,
     purefa_argument_spec,
 )
@@ -139,6 +130,11 @@ from ansible_collections.purestorage.flasharray.plugins.module_utils.api_helpers
     post_with_context,
 )
 
+DirectoryServiceRole = LazyModel("DirectoryServiceRole")
+DirectoryServiceRolePost = LazyModel("DirectoryServiceRolePost")
+Reference = LazyModel("Reference")
+ReferenceNoId = LazyModel("ReferenceNoId")
+
 
 def update_role(module, array):
     """Update Directory Service Role"""
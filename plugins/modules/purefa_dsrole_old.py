@@ -88,15 +88,10 @@ EXAMPLES = r"""
 RETURN = r"""
 """
 
-
-HAS_PURESTORAGE = True
-try:
-    from pypureclient.flasharray import DirectoryServiceRole
-except ImportError:
-    HAS_PURESTORAGE = False
-
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.purestorage.flasharray.plugins.module_utils.purefa import (
+    HAS_PYPURECLIENT,
+    LazyModel,
     get_array,
     purefa_argument_spec,
 )
@@ -107,6 +102,10 @@ from ansible_collections.purestorage.flasharray.plugins.module_utils.api_helpers
     check_response,
 )
 
+HAS_PURESTORAGE = HAS_PYPURECLIENT
+
+DirectoryServiceRole = LazyModel("DirectoryServiceRole")
+
 MAX_API_VERSION = "2.30"
 
 
@@ -120,19 +120,11 @@ volume:
             type: str
 """
 
-HAS_PURESTORAGE = True
-try:
-    from pypureclient.flasharray import (
-        VolumePost,
-        VolumePatch,
-        ProtocolEndpoint,
-    )
-except ImportError:
-    HAS_PURESTORAGE = False
-
 import time
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.purestorage.flasharray.plugins.module_utils.purefa import (
+    HAS_PYPURECLIENT,
+    LazyModel,
     get_array,
     purefa_argument_spec,
 )
@@ -144,6 +136,12 @@ from ansible_collections.purestorage.flasharray.plugins.module_utils.api_helpers
     post_with_context,
 )
 
+HAS_PURESTORAGE = HAS_PYPURECLIENT
+
+VolumePost = LazyModel("VolumePost")
+VolumePatch = LazyModel("VolumePatch")
+ProtocolEndpoint = LazyModel("ProtocolEndpoint")
+
 CONTEXT_VERSION = "2.38"
 
 
@@ -22,6 +22,9 @@ short_description: Configure Everpure FlashArray Eradication Timer
 description:
 - Configure the eradication timer for destroyed items on a FlashArray.
 - Valid values are integer days from 1 to 30. Default is 1.
+- When run with C(ansible_connection=ansible.netcommon.httpapi) and
+  C(ansible_network_os=purestorage.flasharray.purefa) the REST calls are
+  sent through the persistent session of the purefa httpapi plugin.
 author:
 - Everpure Ansible Team (@sdodsley) <pure-ansible-team@purestorage.com>
 options:
@@ -78,15 +81,10 @@ EXAMPLES = r"""
 RETURN = r"""
 """
 
-HAS_PURESTORAGE = True
-try:
-    from pypureclient.flasharray import Arrays, EradicationConfig
-except ImportError:
-    HAS_PURESTORAGE = False
-
-
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.purestorage.flasharray.plugins.module_utils.purefa import (
+    HAS_PYPURECLIENT,
+    LazyModel,
     get_array,
     purefa_argument_spec,
 )
@@ -97,6 +95,14 @@ from ansible_collections.purestorage.flasharray.plugins.module_utils.api_helpers
     get_with_context,
     check_response,
 )
+from ansible_collections.purestorage.flasharray.plugins.module_utils.httpapi import (
+    get_persistent_client,
+)
+
+HAS_PURESTORAGE = HAS_PYPURECLIENT
+
+Arrays = LazyModel("Arrays")
+EradicationConfig = LazyModel("EradicationConfig")
 
 SEC_PER_DAY = 86400000
 ERADICATION_API_VERSION = "2.6"
@@ -126,7 +132,7 @@ def main():
         module.fail_json(msg="enabled_delay must be between 1 and 30 days.")
     if not HAS_PURESTORAGE:
         module.fail_json(msg="py-pure-client sdk is required for this module")
-    array = get_array(module)
+    array = get_persistent_client(module) or get_array(module)
     api_version = array.get_rest_version()
     changed = False
     current_disabled = None
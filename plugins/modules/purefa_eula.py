@@ -21,6 +21,9 @@ version_added: '1.0.0'
 short_description: Sign Everpure FlashArray EULA
 description:
 - Sign the FlashArray EULA for Day 0 config, or change signatory.
+- When run with C(ansible_connection=ansible.netcommon.httpapi) and
+  C(ansible_network_os=purestorage.flasharray.purefa) the REST calls are
+  sent through the persistent session of the purefa httpapi plugin.
 author:
 - Everpure Ansible Team (@sdodsley) <pure-ansible-team@purestorage.com>
 options:
@@ -58,6 +61,8 @@ RETURN = r"""
 
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.purestorage.flasharray.plugins.module_utils.purefa import (
+    HAS_PYPURECLIENT,
+    LazyModel,
     get_array,
     purefa_argument_spec,
 )
@@ -67,12 +72,14 @@ from ansible_collections.purestorage.flasharray.plugins.module_utils.version imp
 from ansible_collections.purestorage.flasharray.plugins.module_utils.api_helpers import (
     check_response,
 )
+from ansible_collections.purestorage.flasharray.plugins.module_utils.httpapi import (
+    get_persistent_client,
+)
+
+HAS_PURESTORAGE = HAS_PYPURECLIENT
 
-HAS_PURESTORAGE = True
-try:
-    from pypureclient.flasharray import Eula, EulaSignature
-except ImportError:
-    HAS_PURESTORAGE = False
+Eula = LazyModel("Eula")
+EulaSignature = LazyModel("EulaSignature")
 
 
 EULA_V2 = "2.30"
@@ -120,7 +127,7 @@ def main():
     if not HAS_PURESTORAGE:
         module.fail_json(msg="py-pure-client sdk is required for this module")
 
-    array = get_array(module)
+    array = get_persistent_client(module) or get_array(module)
     api_version = array.get_rest_version()
     if LooseVersion(EULA_V2) > LooseVersion(api_version):
         if not (
@@ -107,17 +107,12 @@ HAS_PURESTORAGE = True
 try:
     from pypureclient import flasharray
     from pypureclient import flashblade
-    from pypureclient.flasharray import (
-        FleetMemberPost,
-        FleetmemberpostMember,
-        FleetmemberpostMembers,
-        FleetPatch,
-    )
 except ImportError:
     HAS_PURESTORAGE = False
 
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.purestorage.flasharray.plugins.module_utils.purefa import (
+    LazyModel,
     get_array,
     purefa_argument_spec,
 )
@@ -129,6 +124,11 @@ from ansible_collections.purestorage.flasharray.plugins.module_utils.api_helpers
 )
 import platform
 
+FleetMemberPost = LazyModel("FleetMemberPost")
+FleetmemberpostMember = LazyModel("FleetmemberpostMember")
+FleetmemberpostMembers = LazyModel("FleetmemberpostMembers")
+FleetPatch = LazyModel("FleetPatch")
+
 VERSION = 1.5
 USER_AGENT_BASE = "Ansible"
 MIN_REQUIRED_API_VERSION = "2.38"
@@ -143,20 +143,10 @@ EXAMPLES = r"""
 RETURN = r"""
 """
 
-HAS_PURESTORAGE = True
-try:
-    from pypureclient.flasharray import (
-        ConnectionPost,
-        HostGroupPatch,
-        HostPatch,
-        ReferenceNoId,
-    )
-except ImportError:
-    HAS_PURESTORAGE = False
-
-
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.purestorage.flasharray.plugins.module_utils.purefa import (
+    HAS_PYPURECLIENT,
+    LazyModel,
     get_array,
     purefa_argument_spec,
 )
@@ -167,6 +157,13 @@ from ansible_collections.purestorage.flasharray.plugins.module_utils.api_helpers
     check_response,
 )
 
+HAS_PURESTORAGE = HAS_PYPURECLIENT
+
+ConnectionPost = LazyModel("ConnectionPost")
+HostGroupPatch = LazyModel("HostGroupPatch")
+HostPatch = LazyModel("HostPatch")
+ReferenceNoId = LazyModel("ReferenceNoId")
+
 CONTEXT_API_VERSION = "2.38"
 
 
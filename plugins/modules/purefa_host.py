@@ -353,21 +353,11 @@ EXAMPLES = r"""
 RETURN = r"""
 """
 
-HAS_PURESTORAGE = True
-try:
-    from pypureclient.flasharray import (
-        Chap,
-        HostPatch,
-        HostPost,
-        ConnectionPost,
-        Reference,
-    )
-except ImportError:
-    HAS_PURESTORAGE = False
-
 import re
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.purestorage.flasharray.plugins.module_utils.purefa import (
+    HAS_PYPURECLIENT,
+    LazyModel,
     get_array,
     purefa_argument_spec,
 )
@@ -377,8 +367,17 @@ from ansible_collections.purestorage.flasharray.plugins.module_utils.version imp
 from ansible_collections.purestorage.flasharray.plugins.module_utils.api_helpers import (
     get_with_context,
     check_response,
+    get_local_array_name,
 )
 
+HAS_PURESTORAGE = HAS_PYPURECLIENT
+
+Chap = LazyModel("Chap")
+HostPatch = LazyModel("HostPatch")
+HostPost = LazyModel("HostPost")
+ConnectionPost = LazyModel("ConnectionPost")
+Reference = LazyModel("Reference")
+
 VLAN_API_VERSION = "2.16"
 CONTEXT_API_VERSION = "2.38"
 REALMS_CONTEXT_VERSION = "2.47"
@@ -1229,7 +1228,7 @@ def move_host(module, array):
     """Move host between realms and the local array"""
     if module.params["context"] != "":
         module.fail_json(msg="context is not yet supported for host move function")
-    local_array = list(array.get_arrays().items)[0].name
+    local_array = get_local_array_name(array)
     # current_realm = ""
     if len(module.params["move"]) > 1 and len(module.params["move"]) != module.params[
         "move"
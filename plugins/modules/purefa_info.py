@@ -41,6 +41,117 @@ options:
     elements: str
     required: false
     default: minimum
+  parallel:
+    description:
+      - Collect the requested subsets concurrently on a pool of worker threads
+        sharing the same array session.
+      - The returned information is identical to a serial collection.
+    type: bool
+    default: false
+    version_added: '1.43.0'
+  max_workers:
+    description:
+      - Maximum number of subsets to collect at the same time when I(parallel=true).
+      - Must be at least 1.
+      - The C(snapshots) and C(deleted_snapshots) subsets each query up to
+        four offload targets at the same time, so a collection uses at most
+        I(max_workers) + 8 threads.
+    type: int
+    default: 4
+    version_added: '1.43.0'
+  arrays:
+    description:
+      - Collect the requested subsets from each of these FlashArrays instead
+        of the one given by I(fa_url) and I(api_token).
+      - Arrays are collected concurrently and I(purefa_info) is keyed by
+        array name.
+      - An array that cannot be reached or fails during collection is
+        reported in I(failed_arrays) without affecting the others.
+      - An array that reports the same name as an array collected before it
+        in the list is reported in I(failed_arrays) instead of replacing it.
+      - Mutually exclusive with I(fa_url) and I(api_token).
+      - With I(debug_timing=true), C(_purefa_api_trace) is a list with the
+        trace of each array.
+    type: list
+    elements: dict
+    suboptions:
+      fa_url:
+        description:
+          - FlashArray management IPv4 address or Hostname.
+        type: str
+        required: true
+      api_token:
+        description:
+          - FlashArray API token.
+        type: str
+        required: true
+    version_added: '1.43.0'
+  array_workers:
+    description:
+      - Maximum number of arrays in I(arrays) to collect at the same time.
+      - Must be at least 1.
+    type: int
+    default: 8
+    version_added: '1.43.0'
+  filters:
+    description:
+      - REST API filter for each subset, keyed by subset name, that is
+        applied by the array so only matching objects are returned.
+      - Supported for the C(hosts), C(snapshots) and C(volumes) subsets.
+      - A filter only applies to the subset key of the same name in
+        I(purefa_info). The C(volumes) filter does not apply to
+        C(deleted_volumes), and the C(snapshots) filter does not apply to
+        C(deleted_snapshots) or C(pg_snapshots).
+      - See the FlashArray REST API documentation for the filter syntax.
+      - Snapshots that only exist on an offload target are not returned
+        when the C(snapshots) subset is filtered.
+    type: dict
+    version_added: '1.43.0'
+  fields:
+    description:
+      - Keys to return for each subset, keyed by the subset key in
+        I(purefa_info).
+      - Subsets keyed by object name keep the listed keys of each object,
+        other subsets keep the listed top level keys.
+      - Data that takes extra requests is only requested from the array
+        when its key is listed. This covers tags, performance, host
+        connections, remote snapshots, protection group members and
+        transfers, volume group members, host group hosts and protection
+        groups, and policy members and rules.
+      - All other keys are still computed for every object and then left
+        out of the result.
+    type: dict
+    version_added: '1.43.0'
+  output_format:
+    description:
+      - Format of the subsets keyed by object name, such as C(volumes).
+      - C(dict) returns a dictionary of objects keyed by name.
+      - C(columnar) returns a dictionary with a C(columns) list of key names,
+        starting with C(name), and a C(rows) list with one list of values
+        per object. Keys missing from an object are returned as C(null) and
+        listed in an C(absent) list of C([row, column]) index pairs, which is
+        only present when some object lacks a key.
+      - Subsets keyed by object name always have C(columns) and C(rows) in
+        C(columnar) format, even when the array has no such objects.
+      - C(columnar) avoids repeating every key for every object, which
+        greatly reduces the size of the result for large subsets.
+      - Use the P(purestorage.flasharray.purefa_expand#filter) filter to
+        convert columnar subsets back to dictionaries.
+    type: str
+    choices: [ dict, columnar ]
+    default: dict
+    version_added: '1.43.0'
+  fleet_objects:
+    description:
+      - Add the volume and host names of each connected fleet member to the
+        C(fleet) subset.
+      - This lists the objects of every member, so it can take much longer
+        than the rest of the subset in a large fleet.
+      - A member whose objects cannot be listed has the error message of
+        each object type under C(errors) in its entry.
+    type: bool
+    default: false
+    version_added: '1.43.0'
 extends_documentation_fragment:
   - purestorage.flasharray.purestorage.fa
 """
@@ -72,37 +183,133 @@ EXAMPLES = r"""
       - all
     fa_url: 10.10.10.2
     api_token: e31060a7-21fc-e277-6240-25983c6c4592
+
+- name: collect all information using up to 8 concurrent subsets
+  purestorage.flasharray.purefa_info:
+    gather_subset:
+      - all
+    parallel: true
+    max_workers: 8
+    fa_url: 10.10.10.2
+    api_token: e31060a7-21fc-e277-6240-25983c6c4592
 - name: show all information
   debug:
     msg: "{{ array_info['purefa_info'] }}"
+
+- name: collect the serial number of the database volumes
+  purestorage.flasharray.purefa_info:
+    gather_subset:
+      - volumes
+    filters:
+      volumes: "name='db*'"
+    fields:
+      volumes:
+        - serial
+        - size
+    fa_url: 10.10.10.2
+    api_token: e31060a7-21fc-e277-6240-25983c6c4592
+
+- name: collect volumes in the compact columnar format
+  purestorage.flasharray.purefa_info:
+    gather_subset:
+      - volumes
+    output_format: columnar
+    fa_url: 10.10.10.2
+    api_token: e31060a7-21fc-e277-6240-25983c6c4592
+  register: array_info
+- name: show the volumes as a dictionary keyed by name
+  debug:
+    msg: "{{ array_info['purefa_info']['volumes'] | purestorage.flasharray.purefa_expand }}"
+
+- name: collect capacity information from several arrays at once
+  purestorage.flasharray.purefa_info:
+    gather_subset:
+      - capacity
+    arrays:
+      - fa_url: 10.10.10.2
+        api_token: e31060a7-21fc-e277-6240-25983c6c4592
+      - fa_url: 10.10.10.3
+        api_token: "{{ fa2_api_token }}"
+  register: fleet_info
+- name: show the capacity of each array
+  debug:
+    msg: "{{ fleet_info['purefa_info'] | dict2items | map(attribute='value.capacity') }}"
 """
 
 RETURN = r"""
 purefa_info:
-  description: Returns the information collected from the FlashArray
+  description:
+    - Returns the information collected from the FlashArray.
+    - When I(arrays) is set, the information of each array keyed by array name.
+    - When I(output_format=columnar), subsets keyed by object name are
+      returned as C(columns), C(rows) and, when some objects lack a key,
+      C(absent).
+    - Object counts in the C(minimum) subset are C(null) when the count
+      could not be read from the FlashArray or it returned no total. File
+      and policy counts, such as C(filesystems), are C(0) when the
+      FlashArray cannot list those objects.
   returned: always
   type: dict
+failed_arrays:
+  description:
+    - Error message for each array in I(arrays) that could not be collected,
+      keyed by I(fa_url).
+  returned: when arrays is set
+  type: dict
+  sample: {"10.10.10.3": "Authentication failed. Check your credentials"}
+  version_added: '1.43.0'
+api_cache:
+  description:
+    - Number of calls to repeatedly read REST API endpoints such as
+      arrays, controllers, offloads and volume group members answered from
+      the per-run cache (hits) and sent to the FlashArray (misses).
+  returned: always
+  type: dict
+  sample: {"hits": 12, "misses": 9}
+  version_added: '1.43.0'
+api_retry_stats:
+  description:
+    - When I(arrays) is set, the REST API retries made for each array,
+      keyed by array name.
+    - Only arrays with retried calls are listed, or every array when
+      I(debug_timing=true).
+  returned: when api_retries is set and a call was retried
+  type: dict
+  sample: {"array1": {"retries": 1, "by_method": {"get_volumes": 1}}}
+  version_added: '1.43.0'
 """
 
 
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.purestorage.flasharray.plugins.module_utils.purefa import (
+    HAS_PYPURECLIENT,
+    connect_array,
     get_array,
     purefa_argument_spec,
 )
-from ansible_collections.purestorage.flasharray.plugins.module_utils.version import (
-    LooseVersion,
+from ansible_collections.purestorage.flasharray.plugins.module_utils.api_helpers import (
+    CachedClient,
+    RetryingClient,
+    TracingClient,
+    get_api_capabilities,
+    get_fleet_contexts,
+    get_item_count,
+    get_items_across_contexts,
+    get_local_array_name,
+    iter_items,
+)
+from ansible_collections.purestorage.flasharray.plugins.module_utils.error_handlers import (
+    FlashArrayAPIError,
 )
 
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 import time
 
 SEC_TO_DAY = 86400000
 ENCRYPTION_STATUS_API_VERSION = "2.6"
 DIR_QUOTA_API_VERSION = "2.7"
-SHARED_CAP_API_VERSION = "2.9"
 PURE_OUI = "naa.624a9370"
-SAFE_MODE_VERSION = "2.10"
 PER_PG_VERSION = "2.13"
 SAML2_VERSION = "2.11"
 NFS_USER_MAP_VERSION = "2.15"
@@ -112,7 +319,6 @@ VLAN_VERSION = "2.17"
 NEIGHBOR_API_VERSION = "2.22"
 POD_QUOTA_VERSION = "2.23"
 AUTODIR_API_VERSION = "2.24"
-SUBS_API_VERSION = "2.26"
 NSID_API_VERSION = "2.27"
 NFS_SECURITY_VERSION = "2.29"
 UPTIME_API_VERSION = "2.30"
@@ -120,9 +326,68 @@ TLS_CONNECTION_API_VERSION = "2.33"
 PWD_POLICY_API_VERSION = "2.34"
 RA_API_VERSION = "2.35"
 DSROLE_POLICY_API_VERSION = "2.36"
-CONTEXT_API_VERSION = "2.38"
 QUOTA_API_VERSION = "2.42"
-TAGS_API_VERSION = "2.39"
+REMOTE_SNAP_PAGING_API_VERSION = "2.38"
+# Offload targets queried at the same time by each snapshots subset
+OFFLOAD_WORKERS = 4
+# Thread pool size options that must be at least 1
+WORKER_OPTIONS = ("max_workers", "array_workers")
+# Subsets whose object list call accepts a filter option entry
+FILTER_SUBSETS = ("hosts", "snapshots", "volumes")
+PGROUP_MEMBER_TYPES = ("volumes", "hosts", "host_groups", "targets")
+# Keys of the pgroups and deleted_pgroups subsets filled from each member type
+PGROUP_MEMBER_FIELDS = {
+    "volumes": ("volumes", "deleted_volumes"),
+    "hosts": ("hosts",),
+    "host_groups": ("hgroups",),
+    "targets": ("targets",),
+}
+# Keys of each subset filled from the shared connections index
+CONNECTION_FIELDS = {
+    "hgroups": ("vols",),
+    "hosts": ("volumes",),
+    "volumes": ("hosts", "host_groups"),
+}
+KEYED_SUBSETS = (
+    "admins",
+    "alerts",
+    "apps",
+    "arrays",
+    "azure_offload",
+    "certs",
+    "clients",
+    "deleted_pgroups",
+    "deleted_pods",
+    "deleted_snapshots",
+    "deleted_vgroups",
+    "deleted_volumes",
+    "dir_snaps",
+    "filesystems",
+    "fleet",
+    "google_offload",
+    "hgroups",
+    "hosts",
+    "interfaces",
+    "kmip",
+    "network",
+    "nfs_offload",
+    "pg_snapshots",
+    "pgroups",
+    "pods",
+    "policies",
+    "presets",
+    "realms",
+    "replica_links",
+    "s3_offload",
+    "snapshots",
+    "subnet",
+    "subscriptions",
+    "vgroups",
+    "virtual_machines",
+    "virtual_machines_snaps",
+    "volumes",
+    "workloads",
+)
 
 
 def _is_cbs(array):
@@ -134,45 +399,48 @@ def _is_cbs(array):
 
 def generate_default_dict(array):
     default_info = {}
-    api_version = array.get_rest_version()
+    api_caps = get_api_capabilities(array)
+    api_version = api_caps.api_version
     default_info["api_versions"] = api_version
-    if LooseVersion(VM_VERSION) <= LooseVersion(api_version):
-        default_info["virtual_machines"] = len(
-            getattr(array.get_virtual_machines(vm_type="vvol"), "items", [])
+    # These endpoints fail on arrays without the feature, such as file
+    # services, which has always been reported as a count of 0
+    if api_caps.supports(VM_VERSION):
+        default_info["virtual_machines"] = get_item_count(
+            array, "get_virtual_machines", vm_type="vvol", failed_count=0
         )
-        default_info["virtual_machine_snaps"] = len(
-            getattr(array.get_virtual_machine_snapshots(vm_type="vvol"), "items", [])
+        default_info["virtual_machine_snaps"] = get_item_count(
+            array, "get_virtual_machine_snapshots", vm_type="vvol", failed_count=0
         )
-    default_info["snapshot_policies"] = len(
-        getattr(array.get_policies_snapshot(), "items", []) or []
+    default_info["snapshot_policies"] = get_item_count(
+        array, "get_policies_snapshot", failed_count=0
     )
-    default_info["nfs_policies"] = len(
-        getattr(array.get_policies_nfs(), "items", []) or []
+    default_info["nfs_policies"] = get_item_count(
+        array, "get_policies_nfs", failed_count=0
     )
-    default_info["smb_policies"] = len(
-        getattr(array.get_policies_smb(), "items", []) or []
+    default_info["smb_policies"] = get_item_count(
+        array, "get_policies_smb", failed_count=0
     )
-    default_info["filesystems"] = len(
-        getattr(array.get_file_systems(), "items", []) or []
+    default_info["filesystems"] = get_item_count(
+        array, "get_file_systems", failed_count=0
     )
-    default_info["directories"] = len(
-        getattr(array.get_directories(), "items", []) or []
+    default_info["directories"] = get_item_count(
+        array, "get_directories", failed_count=0
     )
-    default_info["exports"] = len(
-        getattr(array.get_directory_exports(), "items", []) or []
+    default_info["exports"] = get_item_count(
+        array, "get_directory_exports", failed_count=0
     )
-    default_info["directory_snapshots"] = len(
-        getattr(array.get_directory_snapshots(), "items", []) or []
+    default_info["directory_snapshots"] = get_item_count(
+        array, "get_directory_snapshots", failed_count=0
     )
-    if LooseVersion(DIR_QUOTA_API_VERSION) <= LooseVersion(api_version):
-        default_info["quota_policies"] = len(
-            getattr(array.get_policies_quota(), "items", []) or []
+    if api_caps.supports(DIR_QUOTA_API_VERSION):
+        default_info["quota_policies"] = get_item_count(
+            array, "get_policies_quota", failed_count=0
         )
-    if LooseVersion(PWD_POLICY_API_VERSION) <= LooseVersion(api_version):
-        default_info["password_policies"] = len(
-            getattr(array.get_policies_password(), "items", []) or []
+    if api_caps.supports(PWD_POLICY_API_VERSION):
+        default_info["password_policies"] = get_item_count(
+            array, "get_policies_password", failed_count=0
         )
-    if LooseVersion(ENCRYPTION_STATUS_API_VERSION) <= LooseVersion(api_version):
+    if api_caps.supports(ENCRYPTION_STATUS_API_VERSION):
         array_data = list(array.get_arrays().items)[0]
         encryption = array_data.encryption
         default_info["encryption_enabled"] = encryption.data_at_rest.enabled
@@ -180,7 +448,7 @@ def generate_default_dict(array):
             default_info["encryption_algorithm"] = encryption.data_at_rest.algorithm
             default_info["encryption_module_version"] = encryption.module_version
         eradication = array_data.eradication_config
-        if LooseVersion(SUBS_API_VERSION) <= LooseVersion(api_version):
+        if api_caps.subs:
             default_info["service_mode"] = list(array.get_subscriptions().items)[
                 0
             ].service
@@ -193,12 +461,12 @@ def generate_default_dict(array):
         eradication_delay = getattr(eradication, "eradication_delay", None)
         if eradication_delay is not None:
             default_info["eradication_days_timer"] = int(eradication_delay / SEC_TO_DAY)
-        if LooseVersion(SAFE_MODE_VERSION) <= LooseVersion(api_version):
+        if api_caps.safe_mode:
             if eradication.manual_eradication == "all-enabled":
                 default_info["safe_mode"] = "Disabled"
             else:
                 default_info["safe_mode"] = "Enabled"
-        if LooseVersion(UPTIME_API_VERSION) <= LooseVersion(api_version):
+        if api_caps.supports(UPTIME_API_VERSION):
             default_info["controller_uptime"] = []
             controllers = list(
                 array.get_controllers(filter="type='array_controller'").items
@@ -218,15 +486,15 @@ def generate_default_dict(array):
                         "uptime": uptime,
                     }
                 )
-    default_info["volume_groups"] = len(list(array.get_volume_groups().items))
-    default_info["connected_arrays"] = len(list(array.get_array_connections().items))
-    default_info["pods"] = len(list(array.get_pods().items))
+    default_info["volume_groups"] = get_item_count(array, "get_volume_groups")
+    default_info["connected_arrays"] = get_item_count(array, "get_array_connections")
+    default_info["pods"] = get_item_count(array, "get_pods")
     default_info["connection_key"] = list(
         array.get_array_connections_connection_key().items
     )[0].connection_key
     if (
-        LooseVersion(TLS_CONNECTION_API_VERSION) <= LooseVersion(api_version)
-        and default_info["connected_arrays"] > 0
+        api_caps.supports(TLS_CONNECTION_API_VERSION)
+        and default_info["connected_arrays"]
     ):
         default_info["connection_paths"] = []
         connection_paths = list(array.get_array_connections_path().items)
@@ -246,17 +514,17 @@ def generate_default_dict(array):
                 }
             )
     default_info["array_model"] = list(array.get_controllers().items)[0].model
-    default_info["array_name"] = list(array.get_arrays().items)[0].name
+    default_info["array_name"] = get_local_array_name(array)
     default_info["purity_version"] = list(array.get_arrays().items)[0].version
-    default_info["hosts"] = len(list(array.get_hosts().items))
-    default_info["snapshots"] = len(list(array.get_volume_snapshots().items))
-    default_info["volumes"] = len(list(array.get_volumes().items))
-    default_info["protection_groups"] = len(list(array.get_protection_groups().items))
-    default_info["hostgroups"] = len(list(array.get_host_groups().items))
-    default_info["admins"] = len(list(array.get_admins().items))
+    default_info["hosts"] = get_item_count(array, "get_hosts")
+    default_info["snapshots"] = get_item_count(array, "get_volume_snapshots")
+    default_info["volumes"] = get_item_count(array, "get_volumes")
+    default_info["protection_groups"] = get_item_count(array, "get_protection_groups")
+    default_info["hostgroups"] = get_item_count(array, "get_host_groups")
+    default_info["admins"] = get_item_count(array, "get_admins")
     support_info = list(array.get_support().items)[0]
     default_info["remote_assist"] = support_info.remote_assist_status
-    if LooseVersion(RA_API_VERSION) <= LooseVersion(api_version):
+    if api_caps.supports(RA_API_VERSION):
         default_info["remote_assist_detail"] = {
             "remote_assist_duration": str(
                 int(support_info.remote_assist_duration / 3600000)
@@ -299,7 +567,7 @@ def generate_default_dict(array):
         ]
     else:
         default_info["maintenance_window"] = []
-    if LooseVersion(CONTEXT_API_VERSION) <= LooseVersion(api_version):
+    if api_caps.context:
         res = array.get_fleets()
         if res.status_code == 200:
             if len(res.items) > 0:
@@ -350,7 +618,7 @@ def generate_perf_dict(array):
 
 def generate_config_dict(module, array):
     config_info = {}
-    api_version = array.get_rest_version()
+    api_caps = get_api_capabilities(array)
     array_info = list(array.get_arrays().items)[0]
     config_info["console_lock"] = ("disabled", "enabled")[
         array_info.console_lock_enabled
@@ -421,7 +689,7 @@ def generate_config_dict(module, array):
             "group_base": getattr(role, "group_base", None),
             "management_access_policies": None,
         }
-        if LooseVersion(DSROLE_POLICY_API_VERSION) <= LooseVersion(api_version):
+        if api_caps.supports(DSROLE_POLICY_API_VERSION):
             config_info["directory_service_roles"][role_name][
                 "management_access_policies"
             ] = getattr(role.management_access_policies[0], "name", None)
@@ -446,7 +714,7 @@ def generate_config_dict(module, array):
         config_info["dns"][config.services[0]]["source"] = getattr(
             config.source, "name", None
         )
-    if LooseVersion(SAML2_VERSION) <= LooseVersion(api_version):
+    if api_caps.supports(SAML2_VERSION):
         config_info["saml2sso"] = {}
         saml2 = list(array.get_sso_saml2_idps().items)
         if saml2:
@@ -495,7 +763,7 @@ def generate_config_dict(module, array):
                 ),
                 "tls": getattr(ad_account, "tls", None),
             }
-    if LooseVersion(DEFAULT_PROT_API_VERSION) <= LooseVersion(api_version):
+    if api_caps.supports(DEFAULT_PROT_API_VERSION):
         config_info["default_protections"] = {}
         default_prots = list(array.get_container_default_protections().items)
         for prot in default_prots:
@@ -511,7 +779,7 @@ def generate_config_dict(module, array):
                         "name": container_prot.name,
                     }
                 )
-    if LooseVersion(SUBS_API_VERSION) <= LooseVersion(api_version):
+    if api_caps.subs:
         array_info = list(array.get_arrays().items)[0]
         config_info["ntp_keys"] = bool(getattr(array_info, "ntp_symmetric_key", None))
         config_info["timezone"] = array_info.time_zone
@@ -569,17 +837,33 @@ def generate_config_dict(module, array):
     return config_info
 
 
+def _group_by_name(items, attr):
+    """Group API items by the name of the object referenced by attr"""
+    grouped = {}
+    for item in items:
+        grouped.setdefault(getattr(item, attr).name, []).append(item)
+    return grouped
+
+
 def generate_filesystems_dict(array, performance):
+    api_caps = get_api_capabilities(array)
     files_info = {}
+    quota_api = bool(api_caps.supports(QUOTA_API_VERSION))
     filesystems = list(array.get_file_systems().items)
+    fs_directories = _group_by_name(array.get_directories().items, "file_system")
+    dir_policies = _group_by_name(array.get_directories_policies().items, "member")
+    dir_exports = _group_by_name(array.get_directory_exports().items, "directory")
+    dir_performance = {}
+    if performance:
+        for perf_stats in array.get_directories_performance().items:
+            dir_performance[perf_stats.name] = perf_stats
     for filesystem in filesystems:
         fs_name = filesystem.name
         files_info[fs_name] = {
             "destroyed": filesystem.destroyed,
             "directories": {},
         }
-        directories = list(array.get_directories(file_system_names=[fs_name]).items)
-        for directory in directories:
+        for directory in fs_directories.get(fs_name, []):
             d_name = directory.directory_name
             files_info[fs_name]["directories"][d_name] = {
                 "path": directory.path,
@@ -606,21 +890,12 @@ def generate_filesystems_dict(array, performance):
                 "limited_by": None,
                 "performance": [],
             }
-            if LooseVersion(QUOTA_API_VERSION) <= LooseVersion(
-                array.get_rest_version()
-            ):
+            if quota_api:
                 if hasattr(directory.limited_by, "member"):
                     files_info[fs_name]["directories"][d_name]["limited_by"] = getattr(
                         directory.limited_by.member, "name", None
                     )
-            policies = list(
-                array.get_directories_policies(
-                    member_names=[
-                        files_info[fs_name]["directories"][d_name]["full_name"]
-                    ]
-                ).items
-            )
-            for policy in policies:
+            for policy in dir_policies.get(directory.name, []):
                 files_info[fs_name]["directories"][d_name]["policies"].append(
                     {
                         "enabled": policy.enabled,
@@ -630,14 +905,7 @@ def generate_filesystems_dict(array, performance):
                         },
                     }
                 )
-            exports = list(
-                array.get_directory_exports(
-                    directory_names=[
-                        files_info[fs_name]["directories"][d_name]["full_name"]
-                    ]
-                ).items
-            )
-            for export in exports:
+            for export in dir_exports.get(directory.name, []):
                 files_info[fs_name]["directories"][d_name]["exports"].append(
                     {
                         "enabled": export.enabled,
@@ -649,14 +917,10 @@ def generate_filesystems_dict(array, performance):
                     }
                 )
             if (
-                performance
-                and not files_info[fs_name]["directories"][d_name]["destroyed"]
+                not files_info[fs_name]["directories"][d_name]["destroyed"]
+                and directory.name in dir_performance
             ):
-                perf_stats = list(
-                    array.get_directories_performance(
-                        names=[files_info[fs_name]["directories"][d_name]["full_name"]]
-                    ).items
-                )[0]
+                perf_stats = dir_performance[directory.name]
                 files_info[fs_name]["directories"][d_name]["performance"] = {
                     "bytes_per_op": perf_stats.bytes_per_op,
                     "bytes_per_read": perf_stats.bytes_per_read,
@@ -675,8 +939,7 @@ def generate_filesystems_dict(array, performance):
 
 def generate_pgsnaps_dict(array):
     pgsnaps_info = {}
-    snapshots = list(array.get_protection_group_snapshots().items)
-    for snapshot in snapshots:
+    for snapshot in iter_items(array, "get_protection_group_snapshots"):
         s_name = snapshot.name
         pgsnaps_info[s_name] = {
             "destroyed": snapshot.destroyed,
@@ -700,6 +963,7 @@ def generate_pgsnaps_dict(array):
 
 
 def generate_dir_snaps_dict(array):
+    api_caps = get_api_capabilities(array)
     dir_snaps_info = {}
     snapshots = list(array.get_directory_snapshots().items)
     for snapshot in snapshots:
@@ -718,7 +982,7 @@ def generate_dir_snaps_dict(array):
             "unique_space": snapshot.space.unique,
             "used_provisioned": getattr(snapshot.space, "used_provisioned", None),
         }
-        if LooseVersion(SUBS_API_VERSION) <= LooseVersion(array.get_rest_version()):
+        if api_caps.subs:
             dir_snaps_info[s_name]["total_used"] = snapshot.space.total_used
         if hasattr(snapshot, "policy"):
             dir_snaps_info[s_name]["policy"] = getattr(snapshot.policy, "name", None)
@@ -727,9 +991,64 @@ def generate_dir_snaps_dict(array):
     return dir_snaps_info
 
 
-def generate_policies_dict(array, quota_available, autodir_available, nfs_user_mapping):
+def _get_policy_rules(
+    array, policy_types, quota_available, nfs_user_mapping, fields=None
+):
+    """Load policy members and rules grouped by policy name
+
+    Each rule endpoint is listed once, without a policy_names filter, and
+    only when a policy of the matching type exists. Members and rules are
+    only listed when their key is requested by fields.
+    """
+    rules = {"members": {}, "smb": {}, "nfs": {}, "snapshot": {}, "quota": {}}
+    if _wants(fields, "members"):
+        rules["members"] = _group_by_name(
+            array.get_directories_policies().items, "policy"
+        )
+    list_rules = _wants(fields, "rules")
+    if "smb" in policy_types and list_rules:
+        rules["smb"] = _group_by_name(
+            array.get_policies_smb_client_rules().items, "policy"
+        )
+    if "nfs" in policy_types:
+        if list_rules:
+            rules["nfs"] = _group_by_name(
+                array.get_policies_nfs_client_rules().items, "policy"
+            )
+        if nfs_user_mapping:
+            rules["nfs_policies"] = {
+                nfs_policy.name: nfs_policy
+                for nfs_policy in array.get_policies_nfs().items
+            }
+    if "snapshot" in policy_types and list_rules:
+        rules["snapshot"] = _group_by_name(
+            array.get_policies_snapshot_rules().items, "policy"
+        )
+    if "quota" in policy_types and quota_available and list_rules:
+        rules["quota"] = _group_by_name(
+            array.get_policies_quota_rules().items, "policy"
+        )
+    if "password" in policy_types:
+        rules["password_policies"] = {
+            pwd_policy.name: pwd_policy
+            for pwd_policy in array.get_policies_password().items
+        }
+    return rules
+
+
+def generate_policies_dict(
+    array, quota_available, autodir_available, nfs_user_mapping, fields=None
+):
+    api_caps = get_api_capabilities(array)
     policy_info = {}
     policies = list(array.get_policies().items)
+    rules = _get_policy_rules(
+        array,
+        set(policy.policy_type for policy in policies),
+        quota_available,
+        nfs_user_mapping,
+        fields,
+    )
     for policy in policies:
         p_name = policy.name
         policy_info[p_name] = {
@@ -738,15 +1057,11 @@ def generate_policies_dict(array, quota_available, autodir_available, nfs_user_m
             "members": [],
             "rules": [],
         }
-        members = list(array.get_directories_policies(policy_names=[p_name]).items)
-        for member in members:
+        for member in rules["members"].get(p_name, []):
             m_name = member.member.name
             policy_info[p_name]["members"].append(m_name)
         if policy.policy_type == "smb":
-            rules = list(
-                array.get_policies_smb_client_rules(policy_names=[p_name]).items
-            )
-            for rule in rules:
+            for rule in rules["smb"].get(p_name, []):
                 smb_rules_dict = {
                     "client": rule.client,
                     "smb_encryption_required": rule.smb_encryption_required,
@@ -755,43 +1070,30 @@ def generate_policies_dict(array, quota_available, autodir_available, nfs_user_m
                 policy_info[p_name]["rules"].append(smb_rules_dict)
         if policy.policy_type == "nfs":
             if nfs_user_mapping:
-                nfs_policy = list(array.get_policies_nfs(names=[p_name]).items)[0]
+                nfs_policy = rules["nfs_policies"][p_name]
                 policy_info[p_name][
                     "user_mapping_enabled"
                 ] = nfs_policy.user_mapping_enabled
-                if LooseVersion(SUBS_API_VERSION) <= LooseVersion(
-                    array.get_rest_version()
-                ):
+                if api_caps.subs:
                     policy_info[p_name]["nfs_version"] = getattr(
                         nfs_policy, "nfs_version", None
                     )
-                if LooseVersion(NFS_SECURITY_VERSION) <= LooseVersion(
-                    array.get_rest_version()
-                ):
+                if api_caps.supports(NFS_SECURITY_VERSION):
                     policy_info[p_name]["security"] = getattr(
                         nfs_policy, "security", None
                     )
-            rules = list(
-                array.get_policies_nfs_client_rules(policy_names=[p_name]).items
-            )
-            for rule in rules:
+            for rule in rules["nfs"].get(p_name, []):
                 nfs_rules_dict = {
                     "access": rule.access,
                     "permission": rule.permission,
                     "client": rule.client,
                 }
-                if LooseVersion(SUBS_API_VERSION) <= LooseVersion(
-                    array.get_rest_version()
-                ):
+                if api_caps.subs:
                     nfs_rules_dict["nfs_version"] = rule.nfs_version
                 policy_info[p_name]["rules"].append(nfs_rules_dict)
         if policy.policy_type == "snapshot":
-            suffix_enabled = bool(
-                LooseVersion(array.get_rest_version())
-                >= LooseVersion(SHARED_CAP_API_VERSION)
-            )
-            rules = list(array.get_policies_snapshot_rules(policy_names=[p_name]).items)
-            for rule in rules:
+            suffix_enabled = bool(api_caps.shared_cap)
+            for rule in rules["snapshot"].get(p_name, []):
                 try:
                     snap_rules_dict = {
                         "at": str(int(rule.at / 3600000)).zfill(2) + ":00",
@@ -813,8 +1115,7 @@ def generate_policies_dict(array, quota_available, autodir_available, nfs_user_m
                         snap_rules_dict["suffix"] = ""
                 policy_info[p_name]["rules"].append(snap_rules_dict)
         if policy.policy_type == "quota" and quota_available:
-            rules = list(array.get_policies_quota_rules(policy_names=[p_name]).items)
-            for rule in rules:
+            for rule in rules["quota"].get(p_name, []):
                 quota_rules_dict = {
                     "enforced": rule.enforced,
                     "quota_limit": rule.quota_limit,
@@ -824,7 +1125,7 @@ def generate_policies_dict(array, quota_available, autodir_available, nfs_user_m
         if policy.policy_type == "autodir" and autodir_available:
             pass  # there are currently no rules for autodir policies
         if policy.policy_type == "password":
-            pwd_policy = list(array.get_policies_password(names=[p_name]).items)[0]
+            pwd_policy = rules["password_policies"][p_name]
             policy_info[p_name] |= {
                 "enabled": pwd_policy.enabled,
                 "enforce_dictionary_check": pwd_policy.enforce_dictionary_check,
@@ -922,6 +1223,7 @@ def generate_subnet_dict(array):
 
 
 def generate_network_dict(array, performance):
+    api_caps = get_api_capabilities(array)
     net_info = {}
     ports = list(array.get_network_interfaces().items)
     for port in ports:
@@ -1182,7 +1484,7 @@ def generate_network_dict(array, performance):
                         ),
                     },
                 }
-    if LooseVersion(NEIGHBOR_API_VERSION) <= LooseVersion(array.get_rest_version()):
+    if api_caps.supports(NEIGHBOR_API_VERSION):
         neighbors = list(array.get_network_interfaces_neighbors().items)
         for neighbor in neighbors:
             int_name = neighbor.local_port.name
@@ -1443,13 +1745,14 @@ def generate_network_dict(array, performance):
 
 
 def generate_capacity_dict(array):
+    api_caps = get_api_capabilities(array)
     capacity_info = {}
     total_capacity = list(array.get_arrays().items)[0].capacity
     capacity = list(array.get_arrays_space().items)[0]
     capacity_info["total_capacity"] = total_capacity
     capacity_info["parity"] = getattr(capacity, "parity", None)
     capacity_info["capacity_installed"] = getattr(capacity, "capacity_installed", None)
-    if LooseVersion(SHARED_CAP_API_VERSION) <= LooseVersion(array.get_rest_version()):
+    if api_caps.shared_cap:
         capacity_info["provisioned_space"] = getattr(
             capacity.space, "total_provisioned", 0
         )
@@ -1479,7 +1782,7 @@ def generate_capacity_dict(array):
         capacity_info["used_provisioned"] = getattr(
             capacity.space, "used_provisioned", 0
         )
-        if LooseVersion(SUBS_API_VERSION) <= LooseVersion(array.get_rest_version()):
+        if api_caps.subs:
             capacity_info["total_used"] = capacity.space.total_used
     else:
         capacity_info["provisioned_space"] = capacity.space["total_provisioned"]
@@ -1492,9 +1795,7 @@ def generate_capacity_dict(array):
         capacity_info["thin_provisioning"] = capacity.space["thin_provisioning"]
         capacity_info["total_reduction"] = capacity.space["total_reduction"]
         capacity_info["replication"] = capacity.space["replication"]
-    if LooseVersion(NFS_SECURITY_VERSION) <= LooseVersion(
-        array.get_rest_version()
-    ) and _is_cbs(array):
+    if api_caps.supports(NFS_SECURITY_VERSION) and _is_cbs(array):
         cloud = list(array.get_arrays_cloud_capacity().items)[0]
         capacity_info["cloud_capacity"] = {
             "current_capacity": cloud.current_capacity,
@@ -1504,10 +1805,98 @@ def generate_capacity_dict(array):
     return capacity_info
 
 
-def generate_snap_dict(array):
+def _utc_time(epoch_ms):
+    if epoch_ms is None:
+        return None
+    return time.strftime("%Y-%m-%d %H:%M:%S", time.gmtime(epoch_ms / 1000)) + " UTC"
+
+
+def _list_remote_snaps(array, method_name, offload_name, destroyed):
+    """List remote snapshots or their transfers on one offload target
+
+    Remote snapshot listings only return a continuation token from
+    REMOTE_SNAP_PAGING_API_VERSION, so older arrays are asked for the whole
+    listing in one call rather than a first page that cannot be followed.
+    """
+    if get_api_capabilities(array).supports(REMOTE_SNAP_PAGING_API_VERSION):
+        return list(
+            iter_items(array, method_name, on=offload_name, destroyed=destroyed)
+        )
+    res = getattr(array, method_name)(on=offload_name, destroyed=destroyed)
+    if getattr(res, "status_code", None) != 200:
+        raise FlashArrayAPIError(method_name, res)
+    return list(res.items)
+
+
+def _offload_remote_snaps(array, offload_name, destroyed):
+    """Return (snapshot, remote dict) pairs for one offload target
+
+    Transfer statistics are listed in bulk and joined by remote snapshot
+    name rather than requested one snapshot at a time.
+    """
+    try:
+        remote_snaps = _list_remote_snaps(
+            array, "get_remote_volume_snapshots", offload_name, destroyed
+        )
+        if not remote_snaps:
+            return []
+        transfers = dict(
+            (transfer.name, transfer)
+            for transfer in _list_remote_snaps(
+                array, "get_remote_volume_snapshots_transfer", offload_name, destroyed
+            )
+        )
+    except FlashArrayAPIError:
+        # The offload target is not reachable
+        return []
+    remote = []
+    for remote_snap in remote_snaps:
+        transfer = transfers.get(remote_snap.name)
+        remote.append(
+            (
+                remote_snap.name.split(":")[1],
+                {
+                    "source": remote_snap.source.name,
+                    "suffix": remote_snap.suffix,
+                    "size": remote_snap.provisioned,
+                    "data_transferred": getattr(transfer, "data_transferred", None),
+                    "completed": _utc_time(getattr(transfer, "completed", None)),
+                    "physical_bytes_written": getattr(
+                        transfer, "physical_bytes_written", None
+                    ),
+                    "progress": getattr(transfer, "progress", None),
+                    "created": _utc_time(remote_snap.created),
+                },
+            )
+        )
+    return remote
+
+
+def _collect_remote_snaps(array, destroyed):
+    """Return (snapshot, remote dict) pairs for all offload targets
+
+    Offload targets are queried concurrently and their results returned in
+    offload target order.
+    """
+    offloads = [offload.name for offload in array.get_offloads().items]
+    if not offloads:
+        return []
+    with ThreadPoolExecutor(
+        max_workers=min(len(offloads), OFFLOAD_WORKERS)
+    ) as executor:
+        results = executor.map(
+            lambda offload_name: _offload_remote_snaps(array, offload_name, destroyed),
+            offloads,
+        )
+        return [pair for remote in results for pair in remote]
+
+
+def generate_snap_dict(array, query_filter=None, fields=None):
+    api_caps = get_api_capabilities(array)
     snap_info = {}
-    snaps = list(array.get_volume_snapshots(destroyed=False).items)
-    for snap in snaps:
+    for snap in iter_items(
+        array, "get_volume_snapshots", destroyed=False, **_filter_args(query_filter)
+    ):
         snapshot = snap.name
         snap_info[snapshot] = {
             "size": snap.space.total_provisioned,
@@ -1529,59 +1918,27 @@ def generate_snap_dict(array):
         snap_info[snapshot]["total_physical"] = snap.space.total_physical
         snap_info[snapshot]["total_provisioned"] = snap.space.total_provisioned
         snap_info[snapshot]["unique_space"] = snap.space.unique
-        if LooseVersion(SHARED_CAP_API_VERSION) <= LooseVersion(
-            array.get_rest_version()
-        ):
+        if api_caps.shared_cap:
             snap_info[snapshot]["snapshots_effective"] = getattr(
                 snap.space, "snapshots_effective", None
             )
-        if LooseVersion(SUBS_API_VERSION) <= LooseVersion(array.get_rest_version()):
+        if api_caps.subs:
             snap_info[snapshot]["total_used"] = snap.space.total_used
-    offloads = list(array.get_offloads().items)
-    for offload in offloads:
-        offload_name = offload.name
-        check_offload = array.get_remote_volume_snapshots(on=offload_name)
-        if check_offload.status_code == 200:
-            remote_snaps = list(
-                array.get_remote_volume_snapshots(
-                    on=offload_name, destroyed=False
-                ).items
-            )
-            for remote_snap in remote_snaps:
-                remote_snap_name = remote_snap.name.split(":")[1]
-                remote_transfer = list(
-                    array.get_remote_volume_snapshots_transfer(
-                        on=offload_name, names=[remote_snap]
-                    ).items
-                )[0]
-                remote_dict = {
-                    "source": remote_snap.source.name,
-                    "suffix": remote_snap.suffix,
-                    "size": remote_snap.provisioned,
-                    "data_transferred": remote_transfer.data_transferred,
-                    "completed": time.strftime(
-                        "%Y-%m-%d %H:%M:%S",
-                        time.gmtime(remote_transfer.completed / 1000),
-                    )
-                    + " UTC",
-                    "physical_bytes_written": remote_transfer.physical_bytes_written,
-                    "progress": remote_transfer.progress,
-                    "created": time.strftime(
-                        "%Y-%m-%d %H:%M:%S",
-                        time.gmtime(remote_snap.created / 1000),
-                    )
-                    + " UTC",
-                }
-                try:
-                    snap_info[remote_snap_name]["remote"].append(remote_dict)
-                except KeyError:
-                    snap_info[remote_snap_name] = {"remote": []}
-                    snap_info[remote_snap_name]["remote"].append(remote_dict)
-    if LooseVersion(TAGS_API_VERSION) <= LooseVersion(array.get_rest_version()):
+    if _wants(fields, "remote"):
+        for remote_snap_name, remote_dict in _collect_remote_snaps(array, False):
+            try:
+                snap_info[remote_snap_name]["remote"].append(remote_dict)
+            except KeyError:
+                # Remote-only snapshots are not selected by a local filter
+                if not query_filter:
+                    snap_info[remote_snap_name] = {"remote": [remote_dict]}
+    if api_caps.tags and _wants(fields, "tags"):
         snaps_tags = list(
             array.get_volume_snapshots_tags(resource_destroyed=False).items
         )
         for snap_tag in snaps_tags:
+            if snap_tag.resource.name not in snap_info:
+                continue
             snap_info[snap_tag.resource.name]["tags"].append(
                 {
                     "key": snap_tag.key,
@@ -1593,10 +1950,10 @@ def generate_snap_dict(array):
     return snap_info
 
 
-def generate_del_snap_dict(array):
+def generate_del_snap_dict(array, fields=None):
+    api_caps = get_api_capabilities(array)
     snap_info = {}
-    snaps = list(array.get_volume_snapshots(destroyed=True).items)
-    for snap in snaps:
+    for snap in iter_items(array, "get_volume_snapshots", destroyed=True):
         snapshot = snap.name
         snap_info[snapshot] = {
             "size": snap.space.total_provisioned,
@@ -1617,47 +1974,16 @@ def generate_del_snap_dict(array):
         snap_info[snapshot]["total_physical"] = snap.space.total_physical
         snap_info[snapshot]["total_provisioned"] = snap.space.total_provisioned
         snap_info[snapshot]["unique_space"] = snap.space.unique
-        if LooseVersion(SUBS_API_VERSION) <= LooseVersion(array.get_rest_version()):
+        if api_caps.subs:
             snap_info[snapshot]["total_used"] = snap.space.total_used
-    offloads = list(array.get_offloads().items)
-    for offload in offloads:
-        offload_name = offload.name
-        check_offload = array.get_remote_volume_snapshots(on=offload_name)
-        if check_offload.status_code == 200:
-            remote_snaps = list(
-                array.get_remote_volume_snapshots(on=offload_name, destroyed=True).items
-            )
-            for remote_snap in remote_snaps:
-                remote_snap_name = remote_snap.name.split(":")[1]
-                remote_transfer = list(
-                    array.get_remote_volume_snapshots_transfer(
-                        on=offload_name, names=[remote_snap.name]
-                    ).items
-                )[0]
-                remote_dict = {
-                    "source": remote_snap.source.name,
-                    "suffix": remote_snap.suffix,
-                    "size": remote_snap.provisioned,
-                    "data_transferred": remote_transfer.data_transferred,
-                    "completed": time.strftime(
-                        "%Y-%m-%d %H:%M:%S",
-                        time.gmtime(remote_transfer.completed / 1000),
-                    )
-                    + " UTC",
-                    "physical_bytes_written": remote_transfer.physical_bytes_written,
-                    "progress": remote_transfer.progress,
-                    "created": time.strftime(
-                        "%Y-%m-%d %H:%M:%S",
-                        time.gmtime(remote_snap.created / 1000),
-                    )
-                    + " UTC",
-                }
-                try:
-                    snap_info[remote_snap_name]["remote"].append(remote_dict)
-                except KeyError:
-                    snap_info[remote_snap_name] = {"remote": []}
-                    snap_info[remote_snap_name]["remote"].append(remote_dict)
-    if LooseVersion(TAGS_API_VERSION) <= LooseVersion(array.get_rest_version()):
+    if _wants(fields, "remote"):
+        for remote_snap_name, remote_dict in _collect_remote_snaps(array, True):
+            try:
+                snap_info[remote_snap_name]["remote"].append(remote_dict)
+            except KeyError:
+                snap_info[remote_snap_name] = {"remote": []}
+                snap_info[remote_snap_name]["remote"].append(remote_dict)
+    if api_caps.tags and _wants(fields, "tags"):
         snaps_tags = list(
             array.get_volume_snapshots_tags(resource_destroyed=True).items
         )
@@ -1674,9 +2000,9 @@ def generate_del_snap_dict(array):
 
 
 def generate_del_vol_dict(array):
+    api_caps = get_api_capabilities(array)
     volume_info = {}
-    vols = list(array.get_volumes(destroyed=True).items)
-    for vol in vols:
+    for vol in iter_items(array, "get_volumes", destroyed=True):
         volume = vol.name
         volume_info[volume] = {
             "protocol_endpoint": bool(vol.subtype == "protocol_endpoint"),
@@ -1716,16 +2042,14 @@ def generate_del_vol_dict(array):
             "host_encryption_key_status": vol.host_encryption_key_status,
             "subtype": vol.subtype,
         }
-        if LooseVersion(SAFE_MODE_VERSION) <= LooseVersion(array.get_rest_version()):
+        if api_caps.safe_mode:
             volume_info[volume]["subtype"] = vol.subtype
             volume_info[volume]["priority"] = vol.priority
             volume_info[volume]["priority_adjustment"] = (
                 vol.priority_adjustment.priority_adjustment_operator
                 + str(vol.priority_adjustment.priority_adjustment_value)
             )
-        if LooseVersion(SHARED_CAP_API_VERSION) <= LooseVersion(
-            array.get_rest_version()
-        ):
+        if api_caps.shared_cap:
             volume_info[volume]["snapshots_effective"] = getattr(
                 vol.space, "snapshots_effective", None
             )
@@ -1735,9 +2059,9 @@ def generate_del_vol_dict(array):
             volume_info[volume]["used_provisioned"] = (
                 getattr(vol.space, "used_provisioned", None),
             )
-        if LooseVersion(SUBS_API_VERSION) <= LooseVersion(array.get_rest_version()):
+        if api_caps.subs:
             volume_info[volume]["total_used"] = vol.space.total_used
-    if LooseVersion(TAGS_API_VERSION) <= LooseVersion(array.get_rest_version()):
+    if api_caps.tags:
         volume_tags = list(array.get_volumes_tags(resource_destroyed=True).items)
         for volume_tag in volume_tags:
             volume_info[volume_tag.resource.name]["tags"].append(
@@ -1751,10 +2075,110 @@ def generate_del_vol_dict(array):
     return volume_info
 
 
-def generate_vol_dict(array, performance):
+def _get_connections_index(array, list_connections=True):
+    """Index all connections by volume, host and host group name
+
+    A single unfiltered get_connections() sweep is shared by the volume,
+    host and host group generators instead of one call per object. With
+    list_connections False, an empty index is returned without a call.
+    """
+    connections = {"volumes": {}, "hosts": {}, "host_groups": {}}
+    if not list_connections:
+        return connections
+    for connection in array.get_connections().items:
+        connections["volumes"].setdefault(connection.volume.name, []).append(connection)
+        host_name = getattr(connection.host, "name", None)
+        if host_name:
+            connections["hosts"].setdefault(host_name, []).append(connection)
+        hgroup_name = getattr(connection.host_group, "name", None)
+        if hgroup_name:
+            connections["host_groups"].setdefault(hgroup_name, []).append(connection)
+    return connections
+
+
+def _wants(fields, key):
+    """Is key requested by a fields projection, where None requests all keys"""
+    return fields is None or key in fields
+
+
+def _filter_args(query_filter):
+    """Return the filter keyword argument for a list call, if there is one"""
+    return {"filter": query_filter} if query_filter else {}
+
+
+def _project_fields(subset_info, fields, keyed):
+    """Keep only the requested keys of a subset
+
+    Subsets keyed by object name, listed in KEYED_SUBSETS, are projected per
+    object and entries that are not objects are kept as they are. All other
+    subsets are projected at the top level.
+    """
+    if not isinstance(subset_info, dict):
+        return subset_info
+    if keyed:
+        return dict(
+            (
+                name,
+                (
+                    dict((key, obj[key]) for key in fields if key in obj)
+                    if isinstance(obj, dict)
+                    else obj
+                ),
+            )
+            for name, obj in subset_info.items()
+        )
+    return dict((key, subset_info[key]) for key in fields if key in subset_info)
+
+
+def _to_columnar(subset_info, keyed):
+    """Return a subset keyed by object name as column names and row lists
+
+    Subsets keyed by object name, listed in KEYED_SUBSETS, always have
+    ``columns`` and ``rows``, even when they are empty. The first column is
+    the object name. Keys missing from an object are returned as None and
+    recorded in an ``absent`` list of ``[row, column]`` index pairs, so that
+    they can be told apart from keys set to None. All other subsets, and
+    keyed subsets with an entry that is not an object, are returned
+    unchanged.
+    """
+    if not (
+        keyed
+        and isinstance(subset_info, dict)
+        and all(isinstance(value, dict) for value in subset_info.values())
+    ):
+        return subset_info
+    columns = []
+    for obj in subset_info.values():
+        for key in obj:
+            if key not in columns:
+                columns.append(key)
+    rows = []
+    absent = []
+    for row_index, (name, obj) in enumerate(subset_info.items()):
+        row = [name]
+        for column_index, key in enumerate(columns, 1):
+            if key not in obj:
+                absent.append([row_index, column_index])
+            row.append(obj.get(key))
+        rows.append(row)
+    columnar = {"columns": ["name"] + columns, "rows": rows}
+    if absent:
+        columnar["absent"] = absent
+    return columnar
+
+
+def generate_vol_dict(
+    array, performance, connections=None, query_filter=None, fields=None
+):
+    api_caps = get_api_capabilities(array)
     volume_info = {}
-    vols = list(array.get_volumes(destroyed=False).items)
-    for vol in vols:
+    if connections is None:
+        connections = _get_connections_index(
+            array, _wants(fields, "hosts") or _wants(fields, "host_groups")
+        )
+    for vol in iter_items(
+        array, "get_volumes", destroyed=False, **_filter_args(query_filter)
+    ):
         volume = vol.name
         volume_info[volume] = {
             "protocol_endpoint": bool(vol.subtype == "protocol_endpoint"),
@@ -1794,9 +2218,7 @@ def generate_vol_dict(array, performance):
             "host_encryption_key_status": vol.host_encryption_key_status,
             "subtype": vol.subtype,
         }
-        if LooseVersion(SHARED_CAP_API_VERSION) <= LooseVersion(
-            array.get_rest_version()
-        ):
+        if api_caps.shared_cap:
             volume_info[volume]["snapshots_effective"] = getattr(
                 vol.space, "snapshots_effective", None
             )
@@ -1809,17 +2231,17 @@ def generate_vol_dict(array, performance):
             volume_info[volume]["used_provisioned"] = (
                 getattr(vol.space, "used_provisioned", None),
             )
-        if LooseVersion(SUBS_API_VERSION) <= LooseVersion(array.get_rest_version()):
+        if api_caps.subs:
             volume_info[volume]["total_used"] = vol.space.total_used
-        if LooseVersion(SAFE_MODE_VERSION) <= LooseVersion(array.get_rest_version()):
+        if api_caps.safe_mode:
             volume_info[volume]["priority"] = vol.priority
             volume_info[volume]["priority_adjustment"] = (
                 vol.priority_adjustment.priority_adjustment_operator
                 + str(vol.priority_adjustment.priority_adjustment_value)
             )
-        connections = list(array.get_connections(volume_names=[vol.name]).items)
+        vol_connections = connections["volumes"].get(volume, [])
         voldict = {}
-        for connection in connections:
+        for connection in vol_connections:
             voldict = {
                 "host": getattr(connection.host, "name", None),
                 "lun": getattr(connection, "lun", None),
@@ -1827,7 +2249,7 @@ def generate_vol_dict(array, performance):
             if voldict["host"]:
                 volume_info[volume]["hosts"].append(voldict)
         voldict = {}
-        for connection in connections:
+        for connection in vol_connections:
             voldict = {
                 "host_group": getattr(connection.host_group, "name", None),
                 "lun": getattr(connection, "lun", None),
@@ -1838,9 +2260,11 @@ def generate_vol_dict(array, performance):
             dict(t)
             for t in set(tuple(d.items()) for d in volume_info[volume]["host_groups"])
         ]
-    if LooseVersion(TAGS_API_VERSION) <= LooseVersion(array.get_rest_version()):
+    if api_caps.tags and _wants(fields, "tags"):
         volume_tags = list(array.get_volumes_tags(resource_destroyed=False).items)
         for volume_tag in volume_tags:
+            if volume_tag.resource.name not in volume_info:
+                continue
             volume_info[volume_tag.resource.name]["tags"].append(
                 {
                     "key": volume_tag.key,
@@ -1849,7 +2273,7 @@ def generate_vol_dict(array, performance):
                     "namespace": volume_tag.namespace,
                 }
             )
-    if performance:
+    if performance and _wants(fields, "performance"):
         vols_performance = list(array.get_volumes_performance(destroyed=False).items)
         for perf in vols_performance:
             if perf.name in volume_info:
@@ -1883,10 +2307,18 @@ def generate_vol_dict(array, performance):
     return volume_info
 
 
-def generate_host_dict(array, performance):
+def generate_host_dict(
+    array, performance, connections=None, query_filter=None, fields=None
+):
+    api_caps = get_api_capabilities(array)
     host_info = {}
-    hosts = list(array.get_hosts().items)
-    hosts_balance = list(array.get_hosts_performance_balance().items)
+    if connections is None:
+        connections = _get_connections_index(array, _wants(fields, "volumes"))
+    hosts = list(array.get_hosts(**_filter_args(query_filter)).items)
+    hosts_balance = []
+    if _wants(fields, "performance_balance") or _wants(fields, "target_port"):
+        hosts_balance = list(array.get_hosts_performance_balance().items)
+    performance = performance and _wants(fields, "performance")
     if performance:
         hosts_performance = list(array.get_hosts_performance().items)
     for host in hosts:
@@ -1909,8 +2341,7 @@ def generate_host_dict(array, performance):
             "time_remaining": getattr(host, "time_remaining", None),
             "vlan": getattr(host, "vlan", None),
         }
-        host_connections = list(array.get_connections(host_names=[hostname]).items)
-        for connection in host_connections:
+        for connection in connections["hosts"].get(hostname, []):
             connection_dict = {
                 "hostgroup": getattr(connection.host_group, "name", None),
                 "volume": connection.volume.name,
@@ -1944,9 +2375,11 @@ def generate_host_dict(array, performance):
                         getattr(balance.target, "name", None)
                     )
             host_info[host.name]["performance_balance"].append(host_perf_balance)
-    if LooseVersion(TAGS_API_VERSION) <= LooseVersion(array.get_rest_version()):
+    if api_caps.tags and _wants(fields, "tags"):
         host_tags = list(array.get_hosts_tags(resource_destroyed=False).items)
         for tag in host_tags:
+            if tag.resource.name not in host_info:
+                continue
             host_info[tag.resource.name]["tags"].append(
                 {
                     "key": tag.key,
@@ -1957,7 +2390,7 @@ def generate_host_dict(array, performance):
             )
     if performance:
         for perf in hosts_performance:
-            if ":" not in perf.name:
+            if ":" not in perf.name and perf.name in host_info:
                 host_info[perf.name]["performance"] = {
                     "bytes_per_mirrored_write": perf.bytes_per_mirrored_write,
                     "bytes_per_op": perf.bytes_per_op,
@@ -1988,10 +2421,72 @@ def generate_host_dict(array, performance):
     return host_info
 
 
-def generate_del_pgroups_dict(array):
+def _get_pgroup_members(array, member_types=PGROUP_MEMBER_TYPES):
+    """Group protection group volumes, hosts, host groups and targets by group name
+
+    One unfiltered list call per member type replaces the per-group calls.
+    Only the member types listed in member_types are requested, the others
+    are left empty.
+    """
+    members = {}
+    for member_type in PGROUP_MEMBER_TYPES:
+        members[member_type] = {}
+        if member_type in member_types:
+            res = getattr(array, "get_protection_groups_" + member_type)()
+            members[member_type] = _group_by_name(res.items, "group")
+    return members
+
+
+def _pgroup_member_types(fields):
+    """Member types needed for the keys requested by fields"""
+    return [
+        member_type
+        for member_type in PGROUP_MEMBER_TYPES
+        if any(_wants(fields, key) for key in PGROUP_MEMBER_FIELDS[member_type])
+    ]
+
+
+def _get_pgroup_transfers(array):
+    """Bucket protection group snapshot transfer statistics by source pgroup
+
+    Transfers for every protection group are read a page at a time and
+    reduced to their output dict one at a time, keyed by the pgroup
+    prefix of the snapshot name.
+    """
+    transfers = {}
+    try:
+        for pgroup_transfer in iter_items(
+            array, "get_protection_group_snapshots_transfer"
+        ):
+            snap = pgroup_transfer.name
+            transfers.setdefault(snap.rsplit(".", 1)[0], {})[snap] = {
+                "time_remaining": None,  # Backwards compatibility
+                "created": None,  # Backwards compatibility
+                "started": getattr(pgroup_transfer, "started", None),
+                "completed": getattr(pgroup_transfer, "completed", None),
+                "physical_bytes_written": getattr(
+                    pgroup_transfer,
+                    "physical_bytes_written",
+                    None,
+                ),
+                "data_transferred": getattr(pgroup_transfer, "data_transferred", None),
+                "progress": getattr(pgroup_transfer, "progress", None),
+                "destroyed": pgroup_transfer.destroyed,
+            }
+    except FlashArrayAPIError:
+        # Report no transfers rather than those of the pages read so far
+        return {}
+    return transfers
+
+
+def generate_del_pgroups_dict(array, members=None, transfers=None, fields=None):
+    api_caps = get_api_capabilities(array)
     pgroups_info = {}
-    api_version = array.get_rest_version()
     pgroups = list(array.get_protection_groups(destroyed=True).items)
+    if members is None:
+        members = _get_pgroup_members(array, _pgroup_member_types(fields))
+    if transfers is None:
+        transfers = _get_pgroup_transfers(array) if _wants(fields, "snaps") else {}
     for pgroup in pgroups:
         protgroup = pgroup.name
 
@@ -2032,73 +2527,34 @@ def generate_del_pgroups_dict(array):
             "used_provisioned": getattr(pgroup.space, "used_provisioned", None),
             "tags": [],
         }
-        pgroup_transfers_res = array.get_protection_group_snapshots_transfer(
-            names=[protgroup + ".*"]
-        )
-        if pgroup_transfers_res.status_code == 200:
-            pgroup_transfers = list(pgroup_transfers_res.items)
-            for pgroup_transfer in pgroup_transfers:
-                snap = pgroup_transfer.name
-                pgroups_info[protgroup]["snaps"][snap] = {
-                    "time_remaining": None,  # Backwards compatibility
-                    "created": None,  # Backwards compatibility
-                    "started": getattr(pgroup_transfer, "started", None),
-                    "completed": getattr(pgroup_transfer, "completed", None),
-                    "physical_bytes_written": getattr(
-                        pgroup_transfer,
-                        "physical_bytes_written",
-                        None,
-                    ),
-                    "data_transferred": getattr(
-                        pgroup_transfer, "data_transferred", None
-                    ),
-                    "progress": getattr(pgroup_transfer, "progress", None),
-                    "destroyed": pgroup_transfer.destroyed,
-                }
-        pgroup_volumes = list(
-            array.get_protection_groups_volumes(group_names=[protgroup]).items
-        )
+        pgroups_info[protgroup]["snaps"] = transfers.get(protgroup, {})
+        pgroup_volumes = members["volumes"].get(protgroup, [])
         for pg_vol in pgroup_volumes:
             pgroups_info[protgroup]["volumes"].append(pg_vol.member.name)
-        pgroup_hosts = list(
-            array.get_protection_groups_hosts(group_names=[protgroup]).items
-        )
-        for pg_host in pgroup_hosts:
+        for pg_host in members["hosts"].get(protgroup, []):
             pgroups_info[protgroup]["hosts"].append(pg_host.member.name)
-        pgroup_hgs = list(
-            array.get_protection_groups_host_groups(group_names=[protgroup]).items
-        )
-        for pg_hg in pgroup_hgs:
+        for pg_hg in members["host_groups"].get(protgroup, []):
             pgroups_info[protgroup]["hgroups"].append(pg_hg.member.name)
-        pgroup_targets = list(
-            array.get_protection_groups_targets(group_names=[protgroup]).items
-        )
-        for pg_target in pgroup_targets:
+        for pg_target in members["targets"].get(protgroup, []):
             pgroups_info[protgroup]["targets"].append(pg_target.member.name)
-        if LooseVersion(SHARED_CAP_API_VERSION) <= LooseVersion(api_version):
+        if api_caps.shared_cap:
             pgroups_info[protgroup]["deleted_volumes"] = []
-            volumes = list(
-                array.get_protection_groups_volumes(group_names=[protgroup]).items
-            )
-            if volumes:
-                for volume in volumes:
+            if pgroup_volumes:
+                for volume in pgroup_volumes:
                     if volume.member.destroyed:
                         pgroups_info[protgroup]["deleted_volumes"].append(
                             volume.member.name
                         )
             else:
                 pgroups_info[protgroup]["deleted_volumes"] = None
-        if LooseVersion(PER_PG_VERSION) <= LooseVersion(api_version):
-            res = array.get_protection_groups(names=[protgroup])
-            if res.status_code == 200:
-                pg_info = list(res.items)[0]
-                pgroups_info[protgroup]["retention_lock"] = getattr(
-                    pg_info, "retention_lock", None
-                )
-                pgroups_info[protgroup]["manual_eradication"] = getattr(
-                    pg_info.eradication_config, "manual_eradication", None
-                )
-    if LooseVersion(TAGS_API_VERSION) <= LooseVersion(array.get_rest_version()):
+        if api_caps.supports(PER_PG_VERSION):
+            pgroups_info[protgroup]["retention_lock"] = getattr(
+                pgroup, "retention_lock", None
+            )
+            pgroups_info[protgroup]["manual_eradication"] = getattr(
+                pgroup.eradication_config, "manual_eradication", None
+            )
+    if api_caps.tags and _wants(fields, "tags"):
         pgroup_tags = list(
             array.get_protection_groups_tags(resource_destroyed=True).items
         )
@@ -2114,10 +2570,14 @@ def generate_del_pgroups_dict(array):
     return pgroups_info
 
 
-def generate_pgroups_dict(array):
+def generate_pgroups_dict(array, members=None, transfers=None, fields=None):
+    api_caps = get_api_capabilities(array)
     pgroups_info = {}
-    api_version = array.get_rest_version()
     pgroups = list(array.get_protection_groups(destroyed=False).items)
+    if members is None:
+        members = _get_pgroup_members(array, _pgroup_member_types(fields))
+    if transfers is None:
+        transfers = _get_pgroup_transfers(array) if _wants(fields, "snaps") else {}
     for pgroup in pgroups:
         protgroup = pgroup.name
         pgroups_info[protgroup] = {
@@ -2156,73 +2616,34 @@ def generate_pgroups_dict(array):
             "used_provisioned": getattr(pgroup.space, "used_provisioned", None),
             "tags": [],
         }
-        pgroup_transfers_res = array.get_protection_group_snapshots_transfer(
-            names=[protgroup + ".*"]
-        )
-        if pgroup_transfers_res.status_code == 200:
-            pgroup_transfers = list(pgroup_transfers_res.items)
-            for pgroup_transfer in pgroup_transfers:
-                snap = pgroup_transfer.name
-                pgroups_info[protgroup]["snaps"][snap] = {
-                    "time_remaining": None,  # Backwards compatibility
-                    "created": None,  # Backwards compatibility
-                    "started": getattr(pgroup_transfer, "started", None),
-                    "completed": getattr(pgroup_transfer, "completed", None),
-                    "physical_bytes_written": getattr(
-                        pgroup_transfer,
-                        "physical_bytes_written",
-                        None,
-                    ),
-                    "data_transferred": getattr(
-                        pgroup_transfer, "data_transferred", None
-                    ),
-                    "progress": getattr(pgroup_transfer, "progress", None),
-                    "destroyed": pgroup_transfer.destroyed,
-                }
-        pgroup_volumes = list(
-            array.get_protection_groups_volumes(group_names=[protgroup]).items
-        )
+        pgroups_info[protgroup]["snaps"] = transfers.get(protgroup, {})
+        pgroup_volumes = members["volumes"].get(protgroup, [])
         for pg_vol in pgroup_volumes:
             pgroups_info[protgroup]["volumes"].append(pg_vol.member.name)
-        pgroup_hosts = list(
-            array.get_protection_groups_hosts(group_names=[protgroup]).items
-        )
-        for pg_host in pgroup_hosts:
+        for pg_host in members["hosts"].get(protgroup, []):
             pgroups_info[protgroup]["hosts"].append(pg_host.member.name)
-        pgroup_hgs = list(
-            array.get_protection_groups_host_groups(group_names=[protgroup]).items
-        )
-        for pg_hg in pgroup_hgs:
+        for pg_hg in members["host_groups"].get(protgroup, []):
             pgroups_info[protgroup]["hgroups"].append(pg_hg.member.name)
-        pgroup_targets = list(
-            array.get_protection_groups_targets(group_names=[protgroup]).items
-        )
-        for pg_target in pgroup_targets:
+        for pg_target in members["targets"].get(protgroup, []):
             pgroups_info[protgroup]["targets"].append(pg_target.member.name)
-        if LooseVersion(SHARED_CAP_API_VERSION) <= LooseVersion(api_version):
+        if api_caps.shared_cap:
             pgroups_info[protgroup]["deleted_volumes"] = []
-            volumes = list(
-                array.get_protection_groups_volumes(group_names=[protgroup]).items
-            )
-            if volumes:
-                for volume in volumes:
+            if pgroup_volumes:
+                for volume in pgroup_volumes:
                     if volume.member.destroyed:
                         pgroups_info[protgroup]["deleted_volumes"].append(
                             volume.member.name
                         )
             else:
                 pgroups_info[protgroup]["deleted_volumes"] = None
-        if LooseVersion(PER_PG_VERSION) <= LooseVersion(api_version):
-            res = array.get_protection_groups(names=[protgroup])
-            if res.status_code == 200:
-                pg_info = list(res.items)[0]
-                pgroups_info[protgroup]["retention_lock"] = getattr(
-                    pg_info, "retention_lock", None
-                )
-                pgroups_info[protgroup]["manual_eradication"] = getattr(
-                    pg_info.eradication_config, "manual_eradication", None
-                )
-    if LooseVersion(TAGS_API_VERSION) <= LooseVersion(array.get_rest_version()):
+        if api_caps.supports(PER_PG_VERSION):
+            pgroups_info[protgroup]["retention_lock"] = getattr(
+                pgroup, "retention_lock", None
+            )
+            pgroups_info[protgroup]["manual_eradication"] = getattr(
+                pgroup.eradication_config, "manual_eradication", None
+            )
+    if api_caps.tags and _wants(fields, "tags"):
         pgroup_tags = list(
             array.get_protection_groups_tags(resource_destroyed=False).items
         )
@@ -2265,6 +2686,7 @@ def generate_rl_dict(array):
 
 
 def generate_del_pods_dict(array):
+    api_caps = get_api_capabilities(array)
     pods_info = {}
     pods = list(array.get_pods(destroyed=True).items)
     for pod in pods:
@@ -2318,7 +2740,7 @@ def generate_del_pods_dict(array):
                     "status": getattr(pod_array, "status", None),
                 }
             )
-    if LooseVersion(TAGS_API_VERSION) <= LooseVersion(array.get_rest_version()):
+    if api_caps.tags:
         pods_tags = list(array.get_pods_tags(resource_destroyed=True).items)
         for tag in pods_tags:
             pods_info[tag.resource.name]["tags"].append(
@@ -2333,6 +2755,7 @@ def generate_del_pods_dict(array):
 
 
 def generate_pods_dict(array, performance):
+    api_caps = get_api_capabilities(array)
     pods_info = {}
     pods = list(array.get_pods(destroyed=False).items)
     for pod in pods:
@@ -2388,7 +2811,7 @@ def generate_pods_dict(array, performance):
                     "status": getattr(pod_array, "status", None),
                 }
             )
-    if LooseVersion(TAGS_API_VERSION) <= LooseVersion(array.get_rest_version()):
+    if api_caps.tags:
         pods_tags = list(array.get_pods_tags(resource_destroyed=False).items)
         for tag in pods_tags:
             pods_info[tag.resource.name]["tags"].append(
@@ -2488,8 +2911,24 @@ def generate_apps_dict(array):
     return apps_info
 
 
-def generate_vgroups_dict(array, performance):
+def _get_vgroup_members(array):
+    """Map each volume group name to the names of its member volumes
+
+    The vgroups and deleted_vgroups subsets share one membership listing.
+    Only the names are kept, not the API objects.
+    """
+    members = {}
+    for vg_vol in array.get_volume_groups_volumes().items:
+        members.setdefault(vg_vol.group.name, []).append(vg_vol.member.name)
+    return members
+
+
+def generate_vgroups_dict(array, performance, members=None, fields=None):
+    api_caps = get_api_capabilities(array)
     vgroups_info = {}
+    if members is None:
+        members = _get_vgroup_members(array) if _wants(fields, "volumes") else {}
+    performance = performance and _wants(fields, "performance")
     vgroups = list(array.get_volume_groups(destroyed=False).items)
     for vgroup in vgroups:
         name = vgroup.name
@@ -2515,7 +2954,7 @@ def generate_vgroups_dict(array, performance):
                 vgroup.priority_adjustment.priority_adjustment_operator
                 + str(vgroup.priority_adjustment.priority_adjustment_value)
             )
-    if LooseVersion(TAGS_API_VERSION) <= LooseVersion(array.get_rest_version()):
+    if api_caps.tags and _wants(fields, "tags"):
         vgroup_tags = list(array.get_volume_groups_tags(resource_destroyed=False).items)
         for tag in vgroup_tags:
             vgroups_info[tag.resource.name]["tags"].append(
@@ -2557,15 +2996,16 @@ def generate_vgroups_dict(array, performance):
                     "write_bytes_per_sec": perf.write_bytes_per_sec,
                     "writes_per_sec": perf.writes_per_sec,
                 }
-    vg_volumes = list(array.get_volume_groups_volumes().items)
-    for vg_vol in vg_volumes:
-        group_name = vg_vol.group.name
-        vgroups_info[group_name]["volumes"].append(vg_vol.member.name)
+    for name, vgroup_info in vgroups_info.items():
+        vgroup_info["volumes"] = list(members.get(name, []))
     return vgroups_info
 
 
-def generate_del_vgroups_dict(array):
+def generate_del_vgroups_dict(array, members=None, fields=None):
+    api_caps = get_api_capabilities(array)
     vgroups_info = {}
+    if members is None:
+        members = _get_vgroup_members(array) if _wants(fields, "volumes") else {}
     vgroups = list(array.get_volume_groups(destroyed=True).items)
     for vgroup in vgroups:
         name = vgroup.name
@@ -2591,12 +3031,9 @@ def generate_del_vgroups_dict(array):
                 vgroup.priority_adjustment.priority_adjustment_operator
                 + str(vgroup.priority_adjustment.priority_adjustment_value)
             )
-    vg_volumes = list(array.get_volume_groups_volumes().items)
-    for vg_vol in vg_volumes:
-        group_name = vg_vol.group.name
-        if group_name in vgroups_info:
-            vgroups_info[group_name]["volumes"].append(vg_vol.member.name)
-    if LooseVersion(TAGS_API_VERSION) <= LooseVersion(array.get_rest_version()):
+    for name, vgroup_info in vgroups_info.items():
+        vgroup_info["volumes"] = list(members.get(name, []))
+    if api_caps.tags and _wants(fields, "tags"):
         vgroup_tags = list(array.get_volume_groups_tags(resource_destroyed=True).items)
         for tag in vgroup_tags:
             vgroups_info[tag.resource.name]["tags"].append(
@@ -2751,6 +3188,7 @@ def generate_azure_offload_dict(array):
 
 
 def generate_google_offload_dict(array):
+    api_caps = get_api_capabilities(array)
     offload_info = {}
     offloads_res = array.get_offloads(protocol="google-cloud")
     if offloads_res.status_code == 200:
@@ -2777,13 +3215,17 @@ def generate_google_offload_dict(array):
                 "used_provisioned": getattr(offload.space, "used_provisioned", None),
                 "total_used": getattr(offload.space, "total_used", None),
             }
-            if LooseVersion(SUBS_API_VERSION) <= LooseVersion(array.get_rest_version()):
+            if api_caps.subs:
                 offload_info[name]["total_used"] = offload.space.total_used
     return offload_info
 
 
-def generate_hgroups_dict(array, performance):
+def generate_hgroups_dict(array, performance, connections=None, fields=None):
+    api_caps = get_api_capabilities(array)
     hgroups_info = {}
+    if connections is None:
+        connections = _get_connections_index(array, _wants(fields, "vols"))
+    performance = performance and _wants(fields, "performance")
     hgroups = list(array.get_host_groups().items)
     for hgroup in hgroups:
         if hgroup.is_local:
@@ -2806,7 +3248,7 @@ def generate_hgroups_dict(array, performance):
                 "destroyed": getattr(hgroup, "destroyed", False),
                 "time_remaining": getattr(hgroup, "time_remaining", None),
             }
-    if LooseVersion(TAGS_API_VERSION) <= LooseVersion(array.get_rest_version()):
+    if api_caps.tags and _wants(fields, "tags"):
         hgroup_tags = list(array.get_host_groups_tags(resource_destroyed=False).items)
         for tag in hgroup_tags:
             hgroups_info[tag.resource.name]["tags"].append(
@@ -2848,29 +3290,27 @@ def generate_hgroups_dict(array, performance):
                     "write_bytes_per_sec": perf.write_bytes_per_sec,
                     "writes_per_sec": perf.writes_per_sec,
                 }
-    hg_vols = list(array.get_connections().items)
-    for hg_vol in hg_vols:
-        if (
-            getattr(hg_vol.host_group, "name", None)
-            and ":" not in hg_vol.host_group.name
-        ):
-            name = hg_vol.host_group.name
-            vol_entry = {
-                "name": hg_vol.volume.name,
-                "lun": getattr(hg_vol, "lun", None),
-                "nsid": getattr(hg_vol, "nsid", None),
-            }
+    for name, hg_vols in connections["host_groups"].items():
+        if ":" not in name:
             vols_list = hgroups_info[name]["vols"]
-            if vol_entry not in vols_list:
-                vols_list.append(vol_entry)
-    hg_hosts = list(array.get_host_groups_hosts().items)
-    for hg_host in hg_hosts:
-        if hg_host.group.name in hgroups_info:
-            hgroups_info[hg_host.group.name]["hosts"].append(hg_host.member.name)
-    hg_pgs = list(array.get_host_groups_protection_groups().items)
-    for hg_pg in hg_pgs:
-        if hg_pg.group.name in hgroups_info:
-            hgroups_info[hg_pg.group.name]["pgs"].append(hg_pg.member.name)
+            for hg_vol in hg_vols:
+                vol_entry = {
+                    "name": hg_vol.volume.name,
+                    "lun": getattr(hg_vol, "lun", None),
+                    "nsid": getattr(hg_vol, "nsid", None),
+                }
+                if vol_entry not in vols_list:
+                    vols_list.append(vol_entry)
+    if _wants(fields, "hosts"):
+        hg_hosts = list(array.get_host_groups_hosts().items)
+        for hg_host in hg_hosts:
+            if hg_host.group.name in hgroups_info:
+                hgroups_info[hg_host.group.name]["hosts"].append(hg_host.member.name)
+    if _wants(fields, "pgs"):
+        hg_pgs = list(array.get_host_groups_protection_groups().items)
+        for hg_pg in hg_pgs:
+            if hg_pg.group.name in hgroups_info:
+                hgroups_info[hg_pg.group.name]["pgs"].append(hg_pg.member.name)
     return hgroups_info
 
 
@@ -2908,8 +3348,7 @@ def generate_vm_dict(array):
 
 def generate_alerts_dict(array):
     alerts_info = {}
-    alerts = list(array.get_alerts().items)
-    for alert in alerts:
+    for alert in iter_items(array, "get_alerts"):
         name = alert.name
         try:
             notified_time = alert.notified / 1000
@@ -2988,7 +3427,7 @@ def generate_subs_dict(array):
     return subs_info
 
 
-def generate_fleet_dict(array):
+def generate_fleet_dict(array, objects=False):
     fleet_info = {}
     fleet = list(array.get_fleets().items)
     if fleet:
@@ -3006,9 +3445,60 @@ def generate_fleet_dict(array):
                     "fleet_coordinator" if hasattr(member, "coordinator_of") else None
                 ),
             }
+        if objects and get_api_capabilities(array).context:
+            _add_fleet_objects(array, fleet_info[fleet_name]["members"])
     return fleet_info
 
 
+def _add_fleet_objects(array, members):
+    """Add the volume and host names of each connected fleet member
+
+    Every member is listed in one multi-context call per object type where
+    the array allows it, instead of one call per member. If that call fails,
+    each member is listed on its own and a member that still fails has the
+    error recorded under its errors key instead of failing the subset.
+    """
+    contexts = [
+        name
+        for name in get_fleet_contexts(array)
+        if members.get(name, {}).get("status") == "connected"
+    ]
+    for key, method, kwargs in (
+        ("volumes", "get_volumes", {"destroyed": False}),
+        ("hosts", "get_hosts", {}),
+    ):
+        try:
+            listed = get_items_across_contexts(array, method, contexts, **kwargs)
+            failed = {}
+        except FlashArrayAPIError:
+            listed, failed = _list_fleet_members(array, method, contexts, kwargs)
+        for context in contexts:
+            if context in failed:
+                members[context].setdefault("errors", {})[key] = failed[context]
+            else:
+                members[context][key] = []
+        for context, item in listed:
+            if key in members.get(context, {}):
+                members[context][key].append(item.name)
+
+
+def _list_fleet_members(array, method, contexts, kwargs):
+    """List each fleet member on its own
+
+    Returns:
+        tuple: The ``(context, item)`` tuples of the members that could be
+        listed, and the error message of each member that could not
+    """
+    listed = []
+    failed = {}
+    for context in contexts:
+        try:
+            listed.extend(get_items_across_contexts(array, method, [context], **kwargs))
+        except FlashArrayAPIError as err:
+            failed[context] = str(err)
+    return listed, failed
+
+
 def generate_preset_dict(array):
 
     def to_plain(value):
@@ -3128,6 +3618,7 @@ def generate_workload_dict(array):
 
 
 def generate_realms_dict(array, performance):
+    api_caps = get_api_capabilities(array)
     realms_info = {}
     realms = list(array.get_realms().items)
     for realm in realms:
@@ -3159,7 +3650,7 @@ def generate_realms_dict(array, performance):
         }
         if realms_info[name]["destroyed"]:
             realms_info[name]["time_remaining"] = realm.time_remaining
-    if LooseVersion(TAGS_API_VERSION) <= LooseVersion(array.get_rest_version()):
+    if api_caps.tags:
         realms_tags = list(array.get_realms_tags(resource_destroyed=False).items)
         for tag in realms_tags:
             realms_info[tag.resource.name]["tags"].append(
@@ -3205,15 +3696,389 @@ def generate_realms_dict(array, performance):
     return realms_info
 
 
+def _run_collectors(collectors, max_workers=None):
+    """Run subset collectors and merge their results in collector order
+
+    Collectors are (key, function, args) tuples. When max_workers is set the
+    collectors are run on a thread pool sharing the same client session,
+    otherwise they run serially. Collectors without a function are left as
+    placeholders so that dependent subsets keep their position in the output.
+    """
+    info = {}
+    if max_workers:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                (key, executor.submit(func, *args) if func else None)
+                for key, func, args in collectors
+            ]
+            for key, future in futures:
+                info[key] = future.result() if future else None
+    else:
+        for key, func, args in collectors:
+            info[key] = func(*args) if func else None
+    return info
+
+
+def _gather_info(module, array, subset):
+    """Collect the requested subsets from one array"""
+    api_caps = get_api_capabilities(array)
+    filters = module.params.get("filters") or {}
+    fields = dict(
+        (key, value if isinstance(value, list) else [value])
+        for key, value in (module.params.get("fields") or {}).items()
+    )
+    performance = False
+    if "performance" in subset or "all" in subset:
+        performance = True
+    connections = None
+    connection_subsets = [
+        key for key in CONNECTION_FIELDS if key in subset or "all" in subset
+    ]
+    if connection_subsets:
+        connections = _get_connections_index(
+            array,
+            any(
+                _wants(fields.get(key), field)
+                for key in connection_subsets
+                for field in CONNECTION_FIELDS[key]
+            ),
+        )
+    collectors = []
+    if "minimum" in subset or "all" in subset or "apps" in subset:
+        collectors.append(("default", generate_default_dict, (array,)))
+    if "performance" in subset or "all" in subset:
+        collectors.append(("performance", generate_perf_dict, (array,)))
+    if "config" in subset or "all" in subset:
+        collectors.append(("config", generate_config_dict, (module, array)))
+    if "capacity" in subset or "all" in subset:
+        collectors.append(("capacity", generate_capacity_dict, (array,)))
+    if "network" in subset or "all" in subset:
+        collectors.append(("network", generate_network_dict, (array, performance)))
+    if "subnet" in subset or "all" in subset:
+        collectors.append(("subnet", generate_subnet_dict, (array,)))
+    if "interfaces" in subset or "all" in subset:
+        collectors.append(("interfaces", generate_interfaces_dict, (array,)))
+    if "hosts" in subset or "all" in subset:
+        collectors.append(
+            (
+                "hosts",
+                generate_host_dict,
+                (
+                    array,
+                    performance,
+                    connections,
+                    filters.get("hosts"),
+                    fields.get("hosts"),
+                ),
+            )
+        )
+    if "volumes" in subset or "all" in subset:
+        collectors.append(
+            (
+                "volumes",
+                generate_vol_dict,
+                (
+                    array,
+                    performance,
+                    connections,
+                    filters.get("volumes"),
+                    fields.get("volumes"),
+                ),
+            )
+        )
+        collectors.append(("deleted_volumes", generate_del_vol_dict, (array,)))
+    if "snapshots" in subset or "all" in subset:
+        collectors.append(
+            (
+                "snapshots",
+                generate_snap_dict,
+                (array, filters.get("snapshots"), fields.get("snapshots")),
+            )
+        )
+        collectors.append(
+            (
+                "deleted_snapshots",
+                generate_del_snap_dict,
+                (array, fields.get("deleted_snapshots")),
+            )
+        )
+    if "hgroups" in subset or "all" in subset:
+        collectors.append(
+            (
+                "hgroups",
+                generate_hgroups_dict,
+                (array, performance, connections, fields.get("hgroups")),
+            )
+        )
+    if "pgroups" in subset or "all" in subset:
+        # Members and transfers are shared, so list what either subset needs
+        pgroup_fields = [fields.get("pgroups"), fields.get("deleted_pgroups")]
+        pgroup_members = _get_pgroup_members(
+            array,
+            set().union(*(_pgroup_member_types(keys) for keys in pgroup_fields)),
+        )
+        pgroup_transfers = {}
+        if any(_wants(keys, "snaps") for keys in pgroup_fields):
+            pgroup_transfers = _get_pgroup_transfers(array)
+        collectors.append(
+            (
+                "pgroups",
+                generate_pgroups_dict,
+                (array, pgroup_members, pgroup_transfers, fields.get("pgroups")),
+            )
+        )
+        collectors.append(
+            (
+                "deleted_pgroups",
+                generate_del_pgroups_dict,
+                (
+                    array,
+                    pgroup_members,
+                    pgroup_transfers,
+                    fields.get("deleted_pgroups"),
+                ),
+            )
+        )
+    if "pods" in subset or "all" in subset or "replication" in subset:
+        collectors.append(("replica_links", generate_rl_dict, (array,)))
+        collectors.append(("pods", generate_pods_dict, (array, performance)))
+        collectors.append(("deleted_pods", generate_del_pods_dict, (array,)))
+    if "admins" in subset or "all" in subset:
+        collectors.append(("admins", generate_admin_dict, (array,)))
+    if "vgroups" in subset or "all" in subset:
+        vgroup_members = {}
+        if _wants(fields.get("vgroups"), "volumes") or _wants(
+            fields.get("deleted_vgroups"), "volumes"
+        ):
+            vgroup_members = _get_vgroup_members(array)
+        collectors.append(
+            (
+                "vgroups",
+                generate_vgroups_dict,
+                (array, performance, vgroup_members, fields.get("vgroups")),
+            )
+        )
+        collectors.append(
+            (
+                "deleted_vgroups",
+                generate_del_vgroups_dict,
+                (array, vgroup_members, fields.get("deleted_vgroups")),
+            )
+        )
+    if "offload" in subset or "all" in subset:
+        collectors.append(("azure_offload", generate_azure_offload_dict, (array,)))
+        collectors.append(("nfs_offload", generate_nfs_offload_dict, (array,)))
+        collectors.append(("s3_offload", generate_s3_offload_dict, (array,)))
+    if "apps" in subset or "all" in subset:
+        # Depends on the default subset, so it is resolved after collection
+        collectors.append(("apps", None, ()))
+    if "arrays" in subset or "all" in subset:
+        collectors.append(("arrays", generate_conn_array_dict, (array,)))
+    if "certs" in subset or "all" in subset:
+        collectors.append(("certs", generate_certs_dict, (array,)))
+    if "kmip" in subset or "all" in subset:
+        collectors.append(("kmip", generate_kmip_dict, (array,)))
+    if "offload" in subset or "all" in subset:
+        collectors.append(("google_offload", generate_google_offload_dict, (array,)))
+    if "filesystems" in subset or "all" in subset:
+        collectors.append(
+            ("filesystems", generate_filesystems_dict, (array, performance))
+        )
+    if "policies" in subset or "all" in subset:
+        user_map = bool(api_caps.supports(NFS_USER_MAP_VERSION))
+        quota = bool(api_caps.supports(DIR_QUOTA_API_VERSION))
+        autodir = bool(api_caps.supports(AUTODIR_API_VERSION))
+        collectors.append(
+            (
+                "policies",
+                generate_policies_dict,
+                (array, quota, autodir, user_map, fields.get("policies")),
+            )
+        )
+    if "clients" in subset or "all" in subset:
+        collectors.append(("clients", generate_clients_dict, (array,)))
+    if "dir_snaps" in subset or "all" in subset:
+        collectors.append(("dir_snaps", generate_dir_snaps_dict, (array,)))
+    if "snapshots" in subset or "all" in subset:
+        collectors.append(("pg_snapshots", generate_pgsnaps_dict, (array,)))
+    if "alerts" in subset or "all" in subset:
+        collectors.append(("alerts", generate_alerts_dict, (array,)))
+    if api_caps.subs and ("subscriptions" in subset or "all" in subset):
+        collectors.append(("subscriptions", generate_subs_dict, (array,)))
+    if api_caps.supports(VM_VERSION) and (
+        "virtual_machines" in subset or "all" in subset
+    ):
+        collectors.append(("virtual_machines", generate_vm_dict, (array,)))
+        collectors.append(("virtual_machines_snaps", generate_vmsnap_dict, (array,)))
+    if api_caps.supports(DSROLE_POLICY_API_VERSION):
+        if "realms" in subset or "all" in subset:
+            collectors.append(("realms", generate_realms_dict, (array, performance)))
+    if api_caps.context:
+        if "fleet" in subset or "all" in subset:
+            collectors.append(
+                (
+                    "fleet",
+                    generate_fleet_dict,
+                    (array, module.params.get("fleet_objects")),
+                )
+            )
+        if "presets" in subset or "all" in subset:
+            collectors.append(("presets", generate_preset_dict, (array,)))
+        if "workloads" in subset or "all" in subset:
+            collectors.append(("workloads", generate_workload_dict, (array,)))
+
+    max_workers = None
+    if module.params.get("parallel"):
+        max_workers = module.params.get("max_workers")
+    info = _run_collectors(collectors, max_workers)
+    if "apps" in info:
+        if "CBS" not in info["default"]["array_model"]:
+            info["apps"] = generate_apps_dict(array)
+        else:
+            info["apps"] = {}
+        if "minimum" not in subset or "all" not in subset:
+            del info["default"]
+    for key, subset_fields in fields.items():
+        if key in info:
+            info[key] = _project_fields(info[key], subset_fields, key in KEYED_SUBSETS)
+    if module.params.get("output_format") == "columnar":
+        info = dict(
+            (key, _to_columnar(value, key in KEYED_SUBSETS))
+            for key, value in info.items()
+        )
+    return info
+
+
+def _gather_array_info(module, array_params, subset, tracers):
+    """Connect to one entry of the arrays option and collect its subsets
+
+    With debug_timing, the client is traced and its TracingClient is added
+    to tracers under the array URL, so the trace is kept if collection fails.
+
+    Returns:
+        tuple: The array name, its information, its API cache counters and
+        its API retry counters, or None when retries are disabled
+    """
+    client = connect_array(module, array_params["fa_url"], array_params["api_token"])
+    if client is None:
+        raise ValueError("Authentication failed. Check your credentials")
+    if module.params.get("debug_timing"):
+        client = TracingClient(client, array_params["fa_url"])
+        tracers[array_params["fa_url"]] = client
+    retrying = None
+    if module.params.get("api_retries"):
+        client = retrying = RetryingClient(client, module.params["api_retries"])
+    array = CachedClient(client)
+    info = _gather_info(module, array, subset)
+    return (
+        get_local_array_name(array),
+        info,
+        array.cache_stats(),
+        retrying.retry_stats() if retrying else None,
+    )
+
+
+def _gather_arrays_info(module, subset):
+    """Collect the requested subsets from every array in the arrays option
+
+    Arrays are collected concurrently on up to array_workers threads. An
+    array that cannot be reached or fails during collection is reported in
+    failed_arrays without affecting the others, as is an array reporting the
+    name of one collected earlier in the list.
+    """
+    if not HAS_PYPURECLIENT:
+        module.fail_json(msg="py-pure-client and/or requests are not installed.")
+    info = {}
+    failed_arrays = {}
+    array_urls = {}
+    api_cache = {"hits": 0, "misses": 0}
+    api_retry_stats = {}
+    tracers = {}
+    with ThreadPoolExecutor(max_workers=module.params["array_workers"]) as executor:
+        futures = [
+            (
+                array_params["fa_url"],
+                executor.submit(
+                    _gather_array_info, module, array_params, subset, tracers
+                ),
+            )
+            for array_params in module.params["arrays"]
+        ]
+        for fa_url, future in futures:
+            try:
+                array_name, array_info, cache_stats, retry_stats = future.result()
+            except Exception as err:
+                failed_arrays[fa_url] = str(err)
+                continue
+            if array_name in info:
+                failed_arrays[fa_url] = "Array name %s is already used by %s" % (
+                    array_name,
+                    array_urls[array_name],
+                )
+                continue
+            array_urls[array_name] = fa_url
+            info[array_name] = array_info
+            for counter in api_cache:
+                api_cache[counter] += cache_stats[counter]
+            if retry_stats and (
+                retry_stats["retries"] or module.params.get("debug_timing")
+            ):
+                api_retry_stats[array_name] = retry_stats
+    reports = {}
+    if api_retry_stats:
+        reports["api_retry_stats"] = api_retry_stats
+    if module.params.get("debug_timing"):
+        reports["_purefa_api_trace"] = [
+            tracers[fa_url].trace_report()
+            for fa_url, dummy in futures
+            if fa_url in tracers
+        ]
+    if not info:
+        module.fail_json(
+            msg="Failed to collect information from any array",
+            failed_arrays=failed_arrays,
+            **reports,
+        )
+    module.exit_json(
+        changed=False,
+        purefa_info=info,
+        failed_arrays=failed_arrays,
+        api_cache=api_cache,
+        **reports,
+    )
+
+
 def main():
     argument_spec = purefa_argument_spec()
     argument_spec.update(
-        dict(gather_subset=dict(default="minimum", type="list", elements="str"))
+        dict(
+            gather_subset=dict(default="minimum", type="list", elements="str"),
+            parallel=dict(type="bool", default=False),
+            max_workers=dict(type="int", default=4),
+            arrays=dict(
+                type="list",
+                elements="dict",
+                options=dict(
+                    fa_url=dict(type="str", required=True),
+                    api_token=dict(type="str", required=True, no_log=True),
+                ),
+            ),
+            array_workers=dict(type="int", default=8),
+            filters=dict(type="dict"),
+            fields=dict(type="dict"),
+            output_format=dict(
+                type="str", default="dict", choices=["dict", "columnar"]
+            ),
+            fleet_objects=dict(type="bool", default=False),
+        )
     )
 
-    module = AnsibleModule(argument_spec, supports_check_mode=True)
-    array = get_array(module)
-    api_version = array.get_rest_version()
+    mutually_exclusive = [["arrays", "fa_url"], ["arrays", "api_token"]]
+    module = AnsibleModule(
+        argument_spec,
+        mutually_exclusive=mutually_exclusive,
+        supports_check_mode=True,
+    )
     subset = [test.lower() for test in module.params["gather_subset"]]
     valid_subsets = (
         "all",
@@ -3250,6 +4115,10 @@ def main():
         "presets",
         "workloads",
     )
+    for option in WORKER_OPTIONS:
+        workers = module.params.get(option)
+        if workers is not None and workers < 1:
+            module.fail_json(msg="%s must be at least 1, got: %s" % (option, workers))
     subset_test = (test in valid_subsets for test in subset)
     if not all(subset_test):
         module.fail_json(
@@ -3257,99 +4126,22 @@ def main():
             % (",".join(valid_subsets), ",".join(subset))
         )
 
-    info = {}
-    performance = False
-    if "minimum" in subset or "all" in subset or "apps" in subset:
-        info["default"] = generate_default_dict(array)
-    if "performance" in subset or "all" in subset:
-        performance = True
-        info["performance"] = generate_perf_dict(array)
-    if "config" in subset or "all" in subset:
-        info["config"] = generate_config_dict(module, array)
-    if "capacity" in subset or "all" in subset:
-        info["capacity"] = generate_capacity_dict(array)
-    if "network" in subset or "all" in subset:
-        info["network"] = generate_network_dict(array, performance)
-    if "subnet" in subset or "all" in subset:
-        info["subnet"] = generate_subnet_dict(array)
-    if "interfaces" in subset or "all" in subset:
-        info["interfaces"] = generate_interfaces_dict(array)
-    if "hosts" in subset or "all" in subset:
-        info["hosts"] = generate_host_dict(array, performance)
-    if "volumes" in subset or "all" in subset:
-        info["volumes"] = generate_vol_dict(array, performance)
-        info["deleted_volumes"] = generate_del_vol_dict(array)
-    if "snapshots" in subset or "all" in subset:
-        info["snapshots"] = generate_snap_dict(array)
-        info["deleted_snapshots"] = generate_del_snap_dict(array)
-    if "hgroups" in subset or "all" in subset:
-        info["hgroups"] = generate_hgroups_dict(array, performance)
-    if "pgroups" in subset or "all" in subset:
-        info["pgroups"] = generate_pgroups_dict(array)
-        info["deleted_pgroups"] = generate_del_pgroups_dict(array)
-    if "pods" in subset or "all" in subset or "replication" in subset:
-        info["replica_links"] = generate_rl_dict(array)
-        info["pods"] = generate_pods_dict(array, performance)
-        info["deleted_pods"] = generate_del_pods_dict(array)
-    if "admins" in subset or "all" in subset:
-        info["admins"] = generate_admin_dict(array)
-    if "vgroups" in subset or "all" in subset:
-        info["vgroups"] = generate_vgroups_dict(array, performance)
-        info["deleted_vgroups"] = generate_del_vgroups_dict(array)
-    if "offload" in subset or "all" in subset:
-        info["azure_offload"] = generate_azure_offload_dict(array)
-        info["nfs_offload"] = generate_nfs_offload_dict(array)
-        info["s3_offload"] = generate_s3_offload_dict(array)
-    if "apps" in subset or "all" in subset:
-        if "CBS" not in info["default"]["array_model"]:
-            info["apps"] = generate_apps_dict(array)
-        else:
-            info["apps"] = {}
-        if "minimum" not in subset or "all" not in subset:
-            del info["default"]
-    if "arrays" in subset or "all" in subset:
-        info["arrays"] = generate_conn_array_dict(array)
-    if "certs" in subset or "all" in subset:
-        info["certs"] = generate_certs_dict(array)
-    if "kmip" in subset or "all" in subset:
-        info["kmip"] = generate_kmip_dict(array)
-    if "offload" in subset or "all" in subset:
-        info["google_offload"] = generate_google_offload_dict(array)
-    if "filesystems" in subset or "all" in subset:
-        info["filesystems"] = generate_filesystems_dict(array, performance)
-    if "policies" in subset or "all" in subset:
-        user_map = bool(LooseVersion(NFS_USER_MAP_VERSION) <= LooseVersion(api_version))
-        quota = bool(LooseVersion(DIR_QUOTA_API_VERSION) <= LooseVersion(api_version))
-        autodir = bool(LooseVersion(AUTODIR_API_VERSION) <= LooseVersion(api_version))
-        info["policies"] = generate_policies_dict(array, quota, autodir, user_map)
-    if "clients" in subset or "all" in subset:
-        info["clients"] = generate_clients_dict(array)
-    if "dir_snaps" in subset or "all" in subset:
-        info["dir_snaps"] = generate_dir_snaps_dict(array)
-    if "snapshots" in subset or "all" in subset:
-        info["pg_snapshots"] = generate_pgsnaps_dict(array)
-    if "alerts" in subset or "all" in subset:
-        info["alerts"] = generate_alerts_dict(array)
-    if LooseVersion(SUBS_API_VERSION) <= LooseVersion(api_version) and (
-        "subscriptions" in subset or "all" in subset
-    ):
-        info["subscriptions"] = generate_subs_dict(array)
-    if LooseVersion(VM_VERSION) <= LooseVersion(api_version) and (
-        "virtual_machines" in subset or "all" in subset
-    ):
-        info["virtual_machines"] = generate_vm_dict(array)
-        info["virtual_machines_snaps"] = generate_vmsnap_dict(array)
-    if LooseVersion(DSROLE_POLICY_API_VERSION) <= LooseVersion(api_version):
-        if "realms" in subset or "all" in subset:
-            info["realms"] = generate_realms_dict(array, performance)
-    if LooseVersion(CONTEXT_API_VERSION) <= LooseVersion(api_version):
-        if "fleet" in subset or "all" in subset:
-            info["fleet"] = generate_fleet_dict(array)
-        if "presets" in subset or "all" in subset:
-            info["presets"] = generate_preset_dict(array)
-        if "workloads" in subset or "all" in subset:
-            info["workloads"] = generate_workload_dict(array)
-    module.exit_json(changed=False, purefa_info=info)
+    bad_filters = set(module.params.get("filters") or {}) - set(FILTER_SUBSETS)
+    if bad_filters:
+        module.fail_json(
+            msg="filters can only be set for: %s, got: %s"
+            % (",".join(FILTER_SUBSETS), ",".join(sorted(bad_filters)))
+        )
+
+    if module.params.get("arrays"):
+        _gather_arrays_info(module, subset)
+        return
+    array = CachedClient(get_array(module))
+    try:
+        info = _gather_info(module, array, subset)
+    except FlashArrayAPIError as err:
+        module.fail_json(msg=str(err), status_code=err.status_code)
+    module.exit_json(changed=False, purefa_info=info, api_cache=array.cache_stats())
 
 
 if __name__ == "__main__":
@@ -155,22 +155,10 @@ try:
 except ImportError:
     HAS_NETADDR = False
 
-try:
-    from pypureclient.flasharray import (
-        NetworkInterfacePatch,
-        NetworkInterfacePost,
-        NetworkinterfacepostEth,
-        NetworkinterfacepatchEth,
-        FixedReferenceNoId,
-        ReferenceNoId,
-    )
-
-    HAS_PYPURECLIENT = True
-except ImportError:
-    HAS_PYPURECLIENT = False
-
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.purestorage.flasharray.plugins.module_utils.purefa import (
+    HAS_PYPURECLIENT,
+    LazyModel,
     get_array,
     purefa_argument_spec,
 )
@@ -178,6 +166,13 @@ from ansible_collections.purestorage.flasharray.plugins.module_utils.api_helpers
     check_response,
 )
 
+NetworkInterfacePatch = LazyModel("NetworkInterfacePatch")
+NetworkInterfacePost = LazyModel("NetworkInterfacePost")
+NetworkinterfacepostEth = LazyModel("NetworkinterfacepostEth")
+NetworkinterfacepatchEth = LazyModel("NetworkinterfacepatchEth")
+FixedReferenceNoId = LazyModel("FixedReferenceNoId")
+ReferenceNoId = LazyModel("ReferenceNoId")
+
 
 def update_fc_interface(module, array, interface):
     """Modify FC Interface settings"""
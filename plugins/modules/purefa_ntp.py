@@ -85,6 +85,8 @@ RETURN = r"""
 
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.purestorage.flasharray.plugins.module_utils.purefa import (
+    HAS_PYPURECLIENT,
+    LazyModel,
     get_array,
     purefa_argument_spec,
 )
@@ -96,11 +98,9 @@ from ansible_collections.purestorage.flasharray.plugins.module_utils.api_helpers
     check_response,
 )
 
-HAS_PURESTORAGE = True
-try:
-    from pypureclient.flasharray import Arrays
-except ImportError:
-    HAS_PURESTORAGE = False
+HAS_PURESTORAGE = HAS_PYPURECLIENT
+
+Arrays = LazyModel("Arrays")
 
 
 KEY_API_VERSION = "2.26"
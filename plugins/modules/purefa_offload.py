@@ -168,22 +168,12 @@ RETURN = r"""
 """
 
 
-HAS_PURESTORAGE = True
-try:
-    from pypureclient.flasharray import (
-        OffloadAzure,
-        OffloadGoogleCloud,
-        OffloadNfs,
-        OffloadPost,
-        OffloadS3,
-    )
-except ImportError:
-    HAS_PURESTORAGE = False
-
 import re
 
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.purestorage.flasharray.plugins.module_utils.purefa import (
+    HAS_PYPURECLIENT,
+    LazyModel,
     get_array,
     purefa_argument_spec,
 )
@@ -195,6 +185,14 @@ from ansible_collections.purestorage.flasharray.plugins.module_utils.api_helpers
     check_response,
 )
 
+HAS_PURESTORAGE = HAS_PYPURECLIENT
+
+OffloadAzure = LazyModel("OffloadAzure")
+OffloadGoogleCloud = LazyModel("OffloadGoogleCloud")
+OffloadNfs = LazyModel("OffloadNfs")
+OffloadPost = LazyModel("OffloadPost")
+OffloadS3 = LazyModel("OffloadS3")
+
 REGEX_TARGET_NAME = re.compile(r"^[a-zA-Z0-9\-]*$")
 MULTIOFFLOAD_LIMIT = 1
 PROFILE_API_VERSION = "2.25"
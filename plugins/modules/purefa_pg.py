@@ -213,6 +213,8 @@ RETURN = r"""
 import re
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.purestorage.flasharray.plugins.module_utils.purefa import (
+    HAS_PYPURECLIENT,
+    LazyModel,
     purefa_argument_spec,
     get_array,
 )
@@ -221,18 +223,14 @@ from ansible_collections.purestorage.flasharray.plugins.module_utils.version imp
 )
 from ansible_collections.purestorage.flasharray.plugins.module_utils.api_helpers import (
     check_response,
+    get_local_array_name,
 )
 
-HAS_PURESTORAGE = True
-try:
-    from pypureclient.flasharray import (
-        ProtectionGroup,
-        ReplicationSchedule,
-        SnapshotSchedule,
-    )
-except ImportError:
-    HAS_PURESTORAGE = False
+HAS_PURESTORAGE = HAS_PYPURECLIENT
 
+ProtectionGroup = LazyModel("ProtectionGroup")
+ReplicationSchedule = LazyModel("ReplicationSchedule")
+SnapshotSchedule = LazyModel("SnapshotSchedule")
 
 RETENTION_LOCK_VERSION = "2.13"
 CONTEXT_API_VERSION = "2.38"
@@ -347,7 +345,7 @@ def check_pg_on_offload(module, array):
             array.get_arrays(context_names=[module.params["context"]]).items
         )[0].name
     else:
-        array_name = list(array.get_arrays().items)[0].name
+        array_name = get_local_array_name(array)
     remote_pg = array_name + ":" + module.params["name"]
     if LooseVersion(CONTEXT_API_VERSION) <= LooseVersion(api_version):
         res = array.get_remote_protection_groups(
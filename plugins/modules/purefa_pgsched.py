@@ -191,6 +191,8 @@ RETURN = r"""
 
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.purestorage.flasharray.plugins.module_utils.purefa import (
+    HAS_PYPURECLIENT,
+    LazyModel,
     get_array,
     purefa_argument_spec,
 )
@@ -199,17 +201,13 @@ from ansible_collections.purestorage.flasharray.plugins.module_utils.api_helpers
     check_response,
 )
 
-HAS_PURESTORAGE = True
-try:
-    from pypureclient.flasharray import (
-        ProtectionGroup,
-        ReplicationSchedule,
-        SnapshotSchedule,
-        RetentionPolicy,
-        TimeWindow,
-    )
-except ImportError:
-    HAS_PURESTORAGE = False
+HAS_PURESTORAGE = HAS_PYPURECLIENT
+
+ProtectionGroup = LazyModel("ProtectionGroup")
+ReplicationSchedule = LazyModel("ReplicationSchedule")
+SnapshotSchedule = LazyModel("SnapshotSchedule")
+RetentionPolicy = LazyModel("RetentionPolicy")
+TimeWindow = LazyModel("TimeWindow")
 
 
 CONTEXT_API_VERSION = "2.38"
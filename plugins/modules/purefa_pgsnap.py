@@ -205,22 +205,11 @@ snapshot:
     returned: success
 """
 
-HAS_PURESTORAGE = True
-try:
-    from pypureclient.flasharray import (
-        ProtectionGroupSnapshot,
-        ProtectionGroupSnapshotPatch,
-        VolumePost,
-        Reference,
-        FixedReference,
-        DestroyedPatchPost,
-    )
-except ImportError:
-    HAS_PURESTORAGE = False
-
 import re
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.purestorage.flasharray.plugins.module_utils.purefa import (
+    HAS_PYPURECLIENT,
+    LazyModel,
     get_array,
     purefa_argument_spec,
 )
@@ -231,6 +220,15 @@ from ansible_collections.purestorage.flasharray.plugins.module_utils.api_helpers
     check_response,
 )
 
+HAS_PURESTORAGE = HAS_PYPURECLIENT
+
+ProtectionGroupSnapshot = LazyModel("ProtectionGroupSnapshot")
+ProtectionGroupSnapshotPatch = LazyModel("ProtectionGroupSnapshotPatch")
+VolumePost = LazyModel("VolumePost")
+Reference = LazyModel("Reference")
+FixedReference = LazyModel("FixedReference")
+DestroyedPatchPost = LazyModel("DestroyedPatchPost")
+
 from datetime import datetime
 
 THROTTLE_API = "2.25"
@@ -269,9 +267,10 @@ def get_pgroup(module, array):
 def get_pgroupvolume(module, array):
     """Return Protection Group Volume or None"""
     api_version = array.get_rest_version()
+    context_api = LooseVersion(CONTEXT_API_VERSION) <= LooseVersion(api_version)
     try:
         volumes = []
-        if LooseVersion(CONTEXT_API_VERSION) <= LooseVersion(api_version):
+        if context_api:
             pgroup = list(
                 array.get_protection_groups(
                     names=[module.params["name"]],
@@ -283,7 +282,7 @@ def get_pgroupvolume(module, array):
                 array.get_protection_groups(names=[module.params["name"]]).items
             )[0]
         if pgroup.host_count > 0:  # We have a host PG
-            if LooseVersion(CONTEXT_API_VERSION) <= LooseVersion(api_version):
+            if context_api:
                 host_dict = list(
                     array.get_protection_groups_hosts(
                         context_names=[module.params["context"]],
@@ -297,7 +296,7 @@ def get_pgroupvolume(module, array):
                     ).items
                 )
             for host in host_dict:
-                if LooseVersion(CONTEXT_API_VERSION) <= LooseVersion(api_version):
+                if context_api:
                     hostvols = list(
                         array.get_connections(
                             context_names=[module.params["context"]],
@@ -311,7 +310,7 @@ def get_pgroupvolume(module, array):
                 for hvol in hostvols:
                     volumes.append(hvol.volume.name)
         elif pgroup.host_group_count > 0:  # We have a hostgroup PG
-            if LooseVersion(CONTEXT_API_VERSION) <= LooseVersion(api_version):
+            if context_api:
                 hgroup_dict = list(
                     array.get_protection_groups_host_groups(
                         context_names=[module.params["context"]],
@@ -326,7 +325,7 @@ def get_pgroupvolume(module, array):
                 )
             # First check if there are any volumes in the host groups
             for hgentry in hgroup_dict:
-                if LooseVersion(CONTEXT_API_VERSION) <= LooseVersion(api_version):
+                if context_api:
                     hgvols = list(
                         array.get_connections(
                             context_names=[module.params["context"]],
@@ -343,7 +342,7 @@ def get_pgroupvolume(module, array):
                     volumes.append(hgvol.volume.name)
             # Second check for host specific volumes
             for hgroup in hgroup_dict:
-                if LooseVersion(CONTEXT_API_VERSION) <= LooseVersion(api_version):
+                if context_api:
                     hg_hosts = list(
                         array.get_host_groups_hosts(
                             context_names=[module.params["context"]],
@@ -357,7 +356,7 @@ def get_pgroupvolume(module, array):
                         ).items
                     )
                 for hg_host in hg_hosts:
-                    if LooseVersion(CONTEXT_API_VERSION) <= LooseVersion(api_version):
+                    if context_api:
                         host_vols = list(
                             array.get_connections(
                                 context_names=[module.params["context"]],
@@ -373,7 +372,7 @@ def get_pgroupvolume(module, array):
                     for host_vol in host_vols:
                         volumes.append(host_vol.volume.name)
         else:  # We have a volume PG
-            if LooseVersion(CONTEXT_API_VERSION) <= LooseVersion(api_version):
+            if context_api:
                 vol_dict = list(
                     array.get_protection_groups_volumes(
                         context_names=[module.params["context"]],
@@ -441,6 +440,7 @@ def get_pgsnapshot(module, array):
 def create_pgsnapshot(module, array):
     """Create Protection Group Snapshot"""
     api_version = array.get_rest_version()
+    context_api = LooseVersion(CONTEXT_API_VERSION) <= LooseVersion(api_version)
     snap_data = None
     changed = True
     if not module.check_mode:
@@ -473,7 +473,7 @@ def create_pgsnapshot(module, array):
                     protection_group_snapshot=suffix,
                 )
         else:
-            if LooseVersion(CONTEXT_API_VERSION) <= LooseVersion(api_version):
+            if context_api:
                 remote_target = (
                     list(
                         array.get_protection_groups(
@@ -492,7 +492,7 @@ def create_pgsnapshot(module, array):
                 )
             if remote_target:
                 if module.params["now"]:
-                    if LooseVersion(CONTEXT_API_VERSION) <= LooseVersion(api_version):
+                    if context_api:
                         res = array.post_protection_group_snapshots(
                             source_names=[module.params["name"]],
                             apply_retention=module.params["apply_retention"],
@@ -510,7 +510,7 @@ def create_pgsnapshot(module, array):
                             protection_group_snapshot=suffix,
                         )
                 else:
-                    if LooseVersion(CONTEXT_API_VERSION) <= LooseVersion(api_version):
+                    if context_api:
                         res = array.post_protection_group_snapshots(
                             source_names=[module.params["name"]],
                             apply_retention=module.params["apply_retention"],
@@ -528,7 +528,7 @@ def create_pgsnapshot(module, array):
                             replicate=module.params["remote"],
                         )
             else:
-                if LooseVersion(CONTEXT_API_VERSION) <= LooseVersion(api_version):
+                if context_api:
                     res = array.post_protection_group_snapshots(
                         source_names=[module.params["name"]],
                         apply_retention=module.params["apply_retention"],
@@ -557,9 +557,10 @@ def create_pgsnapshot(module, array):
 def restore_pgsnapvolume(module, array):
     """Restore a Protection Group Snapshot Volume"""
     api_version = array.get_rest_version()
+    context_api = LooseVersion(CONTEXT_API_VERSION) <= LooseVersion(api_version)
     changed = True
     if module.params["suffix"] == "latest":
-        if LooseVersion(CONTEXT_API_VERSION) <= LooseVersion(api_version):
+        if context_api:
             latest_snapshot = list(
                 array.get_protection_group_snapshots(
                     names=[module.params["name"]],
@@ -601,7 +602,7 @@ def restore_pgsnapvolume(module, array):
         else:
             source_pod_name = ""
         if source_pod_name != target_pod_name:
-            if LooseVersion(CONTEXT_API_VERSION) <= LooseVersion(api_version):
+            if context_api:
                 if (
                     list(
                         array.get_pods(
@@ -624,7 +625,7 @@ def restore_pgsnapvolume(module, array):
                 add_to_pgs = []
                 for add_pg in module.params["add_to_pgs"]:
                     add_to_pgs.append(FixedReference(name=add_pg))
-                if LooseVersion(CONTEXT_API_VERSION) <= LooseVersion(api_version):
+                if context_api:
                     res = array.post_volumes(
                         names=[module.params["target"]],
                         volume=VolumePost(source=Reference(name=source_volume)),
@@ -644,7 +645,7 @@ def restore_pgsnapvolume(module, array):
                         add_to_protection_groups=add_to_pgs,
                     )
             else:
-                if LooseVersion(CONTEXT_API_VERSION) <= LooseVersion(api_version):
+                if context_api:
                     if module.params["overwrite"]:
                         res = array.post_volumes(
                             names=[module.params["target"]],
@@ -691,10 +692,11 @@ def delete_offload_snapshot(module, array):
     """Delete Offloaded Protection Group Snapshot"""
     changed = False
     api_version = array.get_rest_version()
+    context_api = LooseVersion(CONTEXT_API_VERSION) <= LooseVersion(api_version)
     snapname = module.params["name"] + "." + module.params["suffix"]
     if ":" in module.params["name"] and module.params["offload"]:
         if _check_offload(module, array):
-            if LooseVersion(CONTEXT_API_VERSION) <= LooseVersion(api_version):
+            if context_api:
                 res = array.get_remote_protection_group_snapshots(
                     names=[snapname],
                     on=module.params["offload"],
@@ -714,7 +716,7 @@ def delete_offload_snapshot(module, array):
             if not module.check_mode:
                 if not rpg_destroyed:
                     changed = True
-                    if LooseVersion(CONTEXT_API_VERSION) <= LooseVersion(api_version):
+                    if context_api:
                         res = array.patch_remote_protection_group_snapshots(
                             names=[snapname],
                             on=module.params["offload"],
@@ -737,9 +739,7 @@ def delete_offload_snapshot(module, array):
                         f"Failed to delete offloaded snapshot {snapname} on target {module.params['offload']}",
                     )
                     if module.params["eradicate"]:
-                        if LooseVersion(CONTEXT_API_VERSION) <= LooseVersion(
-                            api_version
-                        ):
+                        if context_api:
                             res = array.delete_remote_protection_group_snapshots(
                                 names=[snapname],
                                 on=module.params["offload"],
@@ -757,9 +757,7 @@ def delete_offload_snapshot(module, array):
                 else:
                     if module.params["eradicate"]:
                         changed = True
-                        if LooseVersion(CONTEXT_API_VERSION) <= LooseVersion(
-                            api_version
-                        ):
+                        if context_api:
                             res = array.delete_remote_protection_group_snapshots(
                                 names=[snapname],
                                 on=module.params["offload"],
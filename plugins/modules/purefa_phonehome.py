@@ -21,6 +21,9 @@ version_added: '1.0.0'
 short_description: Enable or Disable Everpure FlashArray Phonehome
 description:
 - Enablke or Disable Phonehome for a Everpure FlashArray.
+- When run with C(ansible_connection=ansible.netcommon.httpapi) and
+  C(ansible_network_os=purestorage.flasharray.purefa) the REST calls are
+  sent through the persistent session of the purefa httpapi plugin.
 author:
 - Everpure Ansible Team (@sdodsley) <pure-ansible-team@purestorage.com>
 options:
@@ -57,14 +60,10 @@ EXAMPLES = r"""
 RETURN = r"""
 """
 
-HAS_PURESTORAGE = True
-try:
-    from pypureclient.flasharray import SupportPatch
-except ImportError:
-    HAS_PURESTORAGE = False
-
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.purestorage.flasharray.plugins.module_utils.purefa import (
+    HAS_PYPURECLIENT,
+    LazyModel,
     get_array,
     purefa_argument_spec,
 )
@@ -74,6 +73,13 @@ from ansible_collections.purestorage.flasharray.plugins.module_utils.version imp
 from ansible_collections.purestorage.flasharray.plugins.module_utils.api_helpers import (
     check_response,
 )
+from ansible_collections.purestorage.flasharray.plugins.module_utils.httpapi import (
+    get_persistent_client,
+)
+
+HAS_PURESTORAGE = HAS_PYPURECLIENT
+
+SupportPatch = LazyModel("SupportPatch")
 
 EXCLUDES_API_VERSION = "2.47"
 
@@ -94,7 +100,7 @@ def main():
     if not HAS_PURESTORAGE:
         module.fail_json(msg="py-pure-client sdk is required to for this module")
 
-    array = get_array(module)
+    array = get_persistent_client(module) or get_array(module)
     api_version = array.get_rest_version()
     support = list(array.get_support().items)[0]
     phonehome = support.phonehome_enabled
@@ -218,21 +218,10 @@ EXAMPLES = r"""
 RETURN = r"""
 """
 
-HAS_PURESTORAGE = True
-try:
-    from pypureclient.flasharray import (
-        PodPost,
-        PodPatch,
-        Reference,
-        ContainerDefaultProtection,
-        DefaultProtectionReference,
-        ProtectionGroup,
-    )
-except ImportError:
-    HAS_PURESTORAGE = False
-
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.purestorage.flasharray.plugins.module_utils.purefa import (
+    HAS_PYPURECLIENT,
+    LazyModel,
     get_array,
     purefa_argument_spec,
 )
@@ -251,6 +240,15 @@ from ansible_collections.purestorage.flasharray.plugins.module_utils.api_helpers
     post_with_throttle_and_context,
 )
 
+HAS_PURESTORAGE = HAS_PYPURECLIENT
+
+PodPost = LazyModel("PodPost")
+PodPatch = LazyModel("PodPatch")
+Reference = LazyModel("Reference")
+ContainerDefaultProtection = LazyModel("ContainerDefaultProtection")
+DefaultProtectionReference = LazyModel("DefaultProtectionReference")
+ProtectionGroup = LazyModel("ProtectionGroup")
+
 DEFAULT_API_VERSION = "2.16"
 POD_QUOTA_VERSION = "2.23"
 THROTTLE_VERSION = "2.31"
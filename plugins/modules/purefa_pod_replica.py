@@ -93,14 +93,10 @@ EXAMPLES = """
 RETURN = """
 """
 
-HAS_PURESTORAGE = True
-try:
-    from pypureclient.flasharray import PodReplicaLinkPatch
-except ImportError:
-    HAS_PURESTORAGE = False
-
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.purestorage.flasharray.plugins.module_utils.purefa import (
+    HAS_PYPURECLIENT,
+    LazyModel,
     get_array,
     purefa_argument_spec,
 )
@@ -112,6 +108,10 @@ from ansible_collections.purestorage.flasharray.plugins.module_utils.api_helpers
     check_response,
 )
 
+HAS_PURESTORAGE = HAS_PYPURECLIENT
+
+PodReplicaLinkPatch = LazyModel("PodReplicaLinkPatch")
+
 CONTEXT_VERSION = "2.38"
 
 
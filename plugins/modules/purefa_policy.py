@@ -466,36 +466,10 @@ EXAMPLES = r"""
 RETURN = r"""
 """
 
-HAS_PURESTORAGE = True
-try:
-    from pypureclient.flasharray import (
-        PolicyPatch,
-        PolicyRuleQuotaPatch,
-        PolicyPost,
-        PolicyrulenfsclientpostRules,
-        PolicyRuleNfsClientPost,
-        PolicyNfsPatch,
-        PolicySmbPatch,
-        PolicyrulesmbclientpostRules,
-        PolicyRuleSmbClientPost,
-        PolicyrulesnapshotpostRules,
-        PolicyrulequotapatchRules,
-        PolicyRuleSnapshotPost,
-        DirectoryPolicyPost,
-        DirectorypolicypostPolicies,
-        PolicyRuleQuotaPost,
-        PolicyrulequotapostRules,
-        PolicyMemberPost,
-        PolicymemberpostMembers,
-        PolicyPassword,
-        ReferenceWithType,
-        Reference,
-    )
-except ImportError:
-    HAS_PURESTORAGE = False
-
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.purestorage.flasharray.plugins.module_utils.purefa import (
+    HAS_PYPURECLIENT,
+    LazyModel,
     get_array,
     purefa_argument_spec,
 )
@@ -515,6 +489,30 @@ from ansible_collections.purestorage.flasharray.plugins.module_utils.api_helpers
     check_response,
 )
 
+HAS_PURESTORAGE = HAS_PYPURECLIENT
+
+PolicyPatch = LazyModel("PolicyPatch")
+PolicyRuleQuotaPatch = LazyModel("PolicyRuleQuotaPatch")
+PolicyPost = LazyModel("PolicyPost")
+PolicyrulenfsclientpostRules = LazyModel("PolicyrulenfsclientpostRules")
+PolicyRuleNfsClientPost = LazyModel("PolicyRuleNfsClientPost")
+PolicyNfsPatch = LazyModel("PolicyNfsPatch")
+PolicySmbPatch = LazyModel("PolicySmbPatch")
+PolicyrulesmbclientpostRules = LazyModel("PolicyrulesmbclientpostRules")
+PolicyRuleSmbClientPost = LazyModel("PolicyRuleSmbClientPost")
+PolicyrulesnapshotpostRules = LazyModel("PolicyrulesnapshotpostRules")
+PolicyrulequotapatchRules = LazyModel("PolicyrulequotapatchRules")
+PolicyRuleSnapshotPost = LazyModel("PolicyRuleSnapshotPost")
+DirectoryPolicyPost = LazyModel("DirectoryPolicyPost")
+DirectorypolicypostPolicies = LazyModel("DirectorypolicypostPolicies")
+PolicyRuleQuotaPost = LazyModel("PolicyRuleQuotaPost")
+PolicyrulequotapostRules = LazyModel("PolicyrulequotapostRules")
+PolicyMemberPost = LazyModel("PolicyMemberPost")
+PolicymemberpostMembers = LazyModel("PolicymemberpostMembers")
+PolicyPassword = LazyModel("PolicyPassword")
+ReferenceWithType = LazyModel("ReferenceWithType")
+Reference = LazyModel("Reference")
+
 MIN_REQUIRED_API_VERSION = "2.3"
 MIN_QUOTA_API_VERSION = "2.7"
 MIN_SUFFIX_API_VERSION = "2.9"
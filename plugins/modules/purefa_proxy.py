@@ -23,6 +23,9 @@ author:
 short_description: Configure FlashArray phonehome HTTPs proxy settings
 description:
 - Set or erase configuration for the HTTPS phonehome proxy settings.
+- When run with C(ansible_connection=ansible.netcommon.httpapi) and
+  C(ansible_network_os=purestorage.flasharray.purefa) the REST calls are
+  sent through the persistent session of the purefa httpapi plugin.
 options:
   state:
     description:
@@ -67,21 +70,23 @@ EXAMPLES = r"""
 RETURN = r"""
 """
 
-
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.purestorage.flasharray.plugins.module_utils.purefa import (
+    HAS_PYPURECLIENT,
+    LazyModel,
     get_array,
     purefa_argument_spec,
 )
 from ansible_collections.purestorage.flasharray.plugins.module_utils.api_helpers import (
     check_response,
 )
+from ansible_collections.purestorage.flasharray.plugins.module_utils.httpapi import (
+    get_persistent_client,
+)
+
+HAS_PURESTORAGE = HAS_PYPURECLIENT
 
-HAS_PURESTORAGE = True
-try:
-    from pypureclient.flasharray import SupportPatch
-except ImportError:
-    HAS_PURESTORAGE = False
+SupportPatch = LazyModel("SupportPatch")
 
 
 def delete_proxy(module, array):
@@ -136,7 +141,7 @@ def main():
         module.fail_json(msg="py-pure-client sdk is required for this module")
 
     state = module.params["state"]
-    array = get_array(module)
+    array = get_persistent_client(module) or get_array(module)
 
     if state == "absent":
         delete_proxy(module, array)
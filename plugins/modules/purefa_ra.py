@@ -66,6 +66,8 @@ RETURN = r"""
 
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.purestorage.flasharray.plugins.module_utils.purefa import (
+    HAS_PYPURECLIENT,
+    LazyModel,
     get_array,
     purefa_argument_spec,
 )
@@ -76,11 +78,10 @@ from ansible_collections.purestorage.flasharray.plugins.module_utils.api_helpers
     check_response,
 )
 
-HAS_PURESTORAGE = True
-try:
-    from pypureclient.flasharray import SupportPatch
-except ImportError:
-    HAS_PURESTORAGE = False
+HAS_PURESTORAGE = HAS_PYPURECLIENT
+
+SupportPatch = LazyModel("SupportPatch")
+
 
 DURATION_API = "2.35"
 
@@ -135,14 +135,10 @@ EXAMPLES = r"""
 RETURN = r"""
 """
 
-HAS_PURESTORAGE = True
-try:
-    from pypureclient.flasharray import RealmPatch, RealmPost, ContainerQos
-except ImportError:
-    HAS_PURESTORAGE = False
-
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.purestorage.flasharray.plugins.module_utils.purefa import (
+    HAS_PYPURECLIENT,
+    LazyModel,
     get_array,
     purefa_argument_spec,
 )
@@ -157,6 +153,12 @@ from ansible_collections.purestorage.flasharray.plugins.module_utils.api_helpers
     check_response,
 )
 
+HAS_PURESTORAGE = HAS_PYPURECLIENT
+
+RealmPatch = LazyModel("RealmPatch")
+RealmPost = LazyModel("RealmPost")
+ContainerQos = LazyModel("ContainerQos")
+
 MINIMUM_API_VERSION = "2.36"
 
 
@@ -107,20 +107,11 @@ EXAMPLES = r"""
 RETURN = r"""
 """
 
-HAS_PURESTORAGE = True
-try:
-    from pypureclient.flasharray import (
-        Saml2Sso,
-        Saml2SsoPost,
-        Saml2SsoSp,
-        Saml2SsoIdp,
-        ReferenceNoId,
-    )
-except ImportError:
-    HAS_PURESTORAGE = False
 
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.purestorage.flasharray.plugins.module_utils.purefa import (
+    HAS_PYPURECLIENT,
+    LazyModel,
     get_array,
     purefa_argument_spec,
 )
@@ -131,6 +122,14 @@ from ansible_collections.purestorage.flasharray.plugins.module_utils.api_helpers
     check_response,
 )
 
+HAS_PURESTORAGE = HAS_PYPURECLIENT
+
+Saml2Sso = LazyModel("Saml2Sso")
+Saml2SsoPost = LazyModel("Saml2SsoPost")
+Saml2SsoSp = LazyModel("Saml2SsoSp")
+Saml2SsoIdp = LazyModel("Saml2SsoIdp")
+ReferenceNoId = LazyModel("ReferenceNoId")
+
 MIN_REQUIRED_API_VERSION = "2.11"
 
 
@@ -26,6 +26,9 @@ description:
 - If username/password are set this will always force a change as there is
   no way to see if the password is different from the current SMTP configuration.
 - Everpure Ansible Team (@sdodsley) <pure-ansible-team@purestorage.com>
+- When run with C(ansible_connection=ansible.netcommon.httpapi) and
+  C(ansible_network_os=purestorage.flasharray.purefa) the REST calls are
+  sent through the persistent session of the purefa httpapi plugin.
 options:
   state:
     description:
@@ -102,20 +105,23 @@ EXAMPLES = r"""
 RETURN = r"""
 """
 
-HAS_PURESTORAGE = True
-try:
-    from pypureclient.flasharray import SmtpServer
-except ImportError:
-    HAS_PURESTORAGE = False
-
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.purestorage.flasharray.plugins.module_utils.purefa import (
+    HAS_PYPURECLIENT,
+    LazyModel,
     get_array,
     purefa_argument_spec,
 )
 from ansible_collections.purestorage.flasharray.plugins.module_utils.api_helpers import (
     check_response,
 )
+from ansible_collections.purestorage.flasharray.plugins.module_utils.httpapi import (
+    get_persistent_client,
+)
+
+HAS_PURESTORAGE = HAS_PYPURECLIENT
+
+SmtpServer = LazyModel("SmtpServer")
 
 
 def delete_smtp(module, array):
@@ -253,7 +259,7 @@ def main():
         module.fail_json(msg="py-pure-client sdk is required for this module")
 
     state = module.params["state"]
-    array = get_array(module)
+    array = get_persistent_client(module) or get_array(module)
 
     if state == "absent":
         delete_smtp(module, array)
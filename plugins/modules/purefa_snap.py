@@ -167,22 +167,11 @@ suffix:
     returned: success
 """
 
-HAS_PURESTORAGE = True
-try:
-    from pypureclient.flasharray import (
-        RemoteVolumeSnapshotPost,
-        VolumeSnapshotPost,
-        DestroyedPatchPost,
-        VolumeSnapshotPatch,
-        VolumePost,
-        Reference,
-    )
-except ImportError:
-    HAS_PURESTORAGE = False
-
 import re
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.purestorage.flasharray.plugins.module_utils.purefa import (
+    HAS_PYPURECLIENT,
+    LazyModel,
     get_array,
     purefa_argument_spec,
 )
@@ -191,9 +180,19 @@ from ansible_collections.purestorage.flasharray.plugins.module_utils.version imp
 )
 from ansible_collections.purestorage.flasharray.plugins.module_utils.api_helpers import (
     check_response,
+    get_local_array_name,
 )
 from datetime import datetime
 
+HAS_PURESTORAGE = HAS_PYPURECLIENT
+
+RemoteVolumeSnapshotPost = LazyModel("RemoteVolumeSnapshotPost")
+VolumeSnapshotPost = LazyModel("VolumeSnapshotPost")
+DestroyedPatchPost = LazyModel("DestroyedPatchPost")
+VolumeSnapshotPatch = LazyModel("VolumeSnapshotPatch")
+VolumePost = LazyModel("VolumePost")
+Reference = LazyModel("Reference")
+
 THROTTLE_API = "2.25"
 SNAPSHOT_SUFFIX_API = "2.28"
 CONTEXT_API_VERSION = "2.38"
@@ -235,7 +234,7 @@ def _check_offload_snapshot(module, array):
             array.get_arrays(context_names=[module.params["context"]]).items
         )[0].name
     else:
-        source_array = list(array.get_arrays().items)[0].name
+        source_array = get_local_array_name(array)
     snapname = (
         source_array + ":" + module.params["name"] + "." + module.params["suffix"]
     )
@@ -298,7 +297,7 @@ def get_deleted_snapshot(module, array):
     api_version = array.get_rest_version()
     snapname = module.params["name"] + "." + module.params["suffix"]
     if module.params["offload"]:
-        source_array = list(array.get_arrays().items)[0].name
+        source_array = get_local_array_name(array)
         snapname = module.params["name"] + "." + module.params["suffix"]
         full_snapname = source_array + ":" + snapname
         if _check_offload(module, array):
@@ -493,7 +492,7 @@ def recover_snapshot(module, array):
                 array.get_arrays(context_names=[module.params["context"]]).items
             )[0].name
         else:
-            source_array = list(array.get_arrays().items)[0].name
+            source_array = get_local_array_name(array)
         snapname = source_array + module.params["name"] + "." + module.params["suffix"]
         changed = True
         if not module.check_mode:
@@ -562,7 +561,7 @@ def delete_snapshot(module, array):
     changed = False
     snapname = module.params["name"] + "." + module.params["suffix"]
     if module.params["offload"] and _check_offload(module, array):
-        source_array = list(array.get_arrays().items)[0].name
+        source_array = get_local_array_name(array)
         full_snapname = source_array + ":" + snapname
         changed = True
         if not module.check_mode:
@@ -677,7 +676,7 @@ def eradicate_snapshot(module, array):
                     array.get_arrays(context_names=[module.params["context"]]).items
                 )[0].name
             else:
-                source_array = list(array.get_arrays().items)[0].name
+                source_array = get_local_array_name(array)
             full_snapname = source_array + ":" + snapname
             if LooseVersion(CONTEXT_API_VERSION) <= LooseVersion(api_version):
                 res = array.delete_remote_volume_snapshots(
@@ -125,6 +125,8 @@ RETURN = r"""
 
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.purestorage.flasharray.plugins.module_utils.purefa import (
+    HAS_PYPURECLIENT,
+    LazyModel,
     get_array,
     purefa_argument_spec,
 )
@@ -132,17 +134,13 @@ from ansible_collections.purestorage.flasharray.plugins.module_utils.api_helpers
     check_response,
 )
 
-HAS_PURESTORAGE = True
-try:
-    from pypureclient.flasharray import (
-        SnmpManagerPost,
-        SnmpManagerPatch,
-        SnmpV2c,
-        SnmpV3Patch,
-        SnmpV3Post,
-    )
-except ImportError:
-    HAS_PURESTORAGE = False
+HAS_PURESTORAGE = HAS_PYPURECLIENT
+
+SnmpManagerPost = LazyModel("SnmpManagerPost")
+SnmpManagerPatch = LazyModel("SnmpManagerPatch")
+SnmpV2c = LazyModel("SnmpV2c")
+SnmpV3Patch = LazyModel("SnmpV3Patch")
+SnmpV3Post = LazyModel("SnmpV3Post")
 
 
 def test_manager(module, array):
@@ -104,16 +104,11 @@ try:
 except ImportError:
     HAS_NETADDR = False
 
-try:
-    from pypureclient.flasharray import SubnetPatch, SubnetPost
-
-    HAS_PURESTORAGE = True
-except ImportError:
-    HAS_PURESTORAGE = False
-
 import re
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.purestorage.flasharray.plugins.module_utils.purefa import (
+    HAS_PYPURECLIENT,
+    LazyModel,
     get_array,
     purefa_argument_spec,
 )
@@ -121,6 +116,11 @@ from ansible_collections.purestorage.flasharray.plugins.module_utils.api_helpers
     check_response,
 )
 
+HAS_PURESTORAGE = HAS_PYPURECLIENT
+
+SubnetPatch = LazyModel("SubnetPatch")
+SubnetPost = LazyModel("SubnetPost")
+
 
 def _get_subnet(module, array):
     """Return subnet or None"""
@@ -100,16 +100,10 @@ EXAMPLES = r"""
 RETURN = r"""
 """
 
-
-HAS_PURESTORAGE = True
-try:
-    from pypureclient.flasharray import SyslogServer
-except ImportError:
-    HAS_PURESTORAGE = False
-
-
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.purestorage.flasharray.plugins.module_utils.purefa import (
+    HAS_PYPURECLIENT,
+    LazyModel,
     get_array,
     purefa_argument_spec,
 )
@@ -118,6 +112,10 @@ from ansible_collections.purestorage.flasharray.plugins.module_utils.api_helpers
     check_response,
 )
 
+HAS_PURESTORAGE = HAS_PYPURECLIENT
+
+SyslogServer = LazyModel("SyslogServer")
+
 CONTEXT_API_VERSION = "2.38"
 
 
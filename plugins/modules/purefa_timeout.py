@@ -22,6 +22,9 @@ short_description: Configure Everpure FlashArray GUI idle timeout
 description:
 - Configure GUI idle timeout for Everpure FlashArrays.
 - This does not affect existing GUI sessions.
+- When run with C(ansible_connection=ansible.netcommon.httpapi) and
+  C(ansible_network_os=purestorage.flasharray.purefa) the REST calls are
+  sent through the persistent session of the purefa httpapi plugin.
 author:
 - Everpure Ansible Team (@sdodsley) <pure-ansible-team@purestorage.com>
 options:
@@ -66,14 +69,10 @@ EXAMPLES = r"""
 RETURN = r"""
 """
 
-HAS_PURESTORAGE = True
-try:
-    from pypureclient.flasharray import Arrays
-except ImportError:
-    HAS_PURESTORAGE = False
-
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.purestorage.flasharray.plugins.module_utils.purefa import (
+    HAS_PYPURECLIENT,
+    LazyModel,
     get_array,
     purefa_argument_spec,
 )
@@ -81,6 +80,13 @@ from ansible_collections.purestorage.flasharray.plugins.module_utils.api_helpers
     get_with_context,
     check_response,
 )
+from ansible_collections.purestorage.flasharray.plugins.module_utils.httpapi import (
+    get_persistent_client,
+)
+
+HAS_PURESTORAGE = HAS_PYPURECLIENT
+
+Arrays = LazyModel("Arrays")
 
 CONTEXT_VERSION = "2.38"
 
@@ -134,7 +140,7 @@ def main():
     module.params["timeout"] = module.params["timeout"] * 60000
     if not HAS_PURESTORAGE:
         module.fail_json(msg="py-pure-client sdk is required for this module")
-    array = get_array(module)
+    array = get_persistent_client(module) or get_array(module)
     res = get_with_context(array, "get_arrays", CONTEXT_VERSION, module)
     current_timeout = list(res.items)[0].idle_timeout
     if state == "present" and current_timeout != module.params["timeout"]:
@@ -152,16 +152,11 @@ EXAMPLES = r"""
 RETURN = r"""
 """
 
-
-HAS_PURESTORAGE = True
-try:
-    from pypureclient.flasharray import AdminPost, AdminPatch, AdminRole
-except ImportError:
-    HAS_PURESTORAGE = False
-
 import re
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.purestorage.flasharray.plugins.module_utils.purefa import (
+    HAS_PYPURECLIENT,
+    LazyModel,
     get_array,
     purefa_argument_spec,
 )
@@ -172,6 +167,12 @@ from ansible_collections.purestorage.flasharray.plugins.module_utils.api_helpers
     check_response,
 )
 
+HAS_PURESTORAGE = HAS_PYPURECLIENT
+
+AdminPost = LazyModel("AdminPost")
+AdminPatch = LazyModel("AdminPatch")
+AdminRole = LazyModel("AdminRole")
+
 
 def get_user(module, array):
     """Return Local User Account or None"""
@@ -185,19 +185,10 @@ EXAMPLES = r"""
 RETURN = r"""
 """
 
-HAS_PURESTORAGE = True
-try:
-    from pypureclient.flasharray import (
-        VolumeGroupPost,
-        VolumeGroupPatch,
-        Qos,
-        PriorityAdjustment,
-    )
-except ImportError:
-    HAS_PURESTORAGE = False
-
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.purestorage.flasharray.plugins.module_utils.purefa import (
+    HAS_PYPURECLIENT,
+    LazyModel,
     get_array,
     purefa_argument_spec,
 )
@@ -212,6 +203,13 @@ from ansible_collections.purestorage.flasharray.plugins.module_utils.api_helpers
     check_response,
 )
 
+HAS_PURESTORAGE = HAS_PYPURECLIENT
+
+VolumeGroupPost = LazyModel("VolumeGroupPost")
+VolumeGroupPatch = LazyModel("VolumeGroupPatch")
+Qos = LazyModel("Qos")
+PriorityAdjustment = LazyModel("PriorityAdjustment")
+
 PRIORITY_API_VERSION = "2.11"
 CONTEXT_API_VERSION = "2.38"
 MIN_BWS = 1048576
@@ -89,20 +89,10 @@ EXAMPLES = """
 RETURN = """
 """
 
-HAS_PURESTORAGE = True
-try:
-    from pypureclient.flasharray import (
-        NetworkInterfacePatch,
-        NetworkInterfacePost,
-        ReferenceNoId,
-        NetworkinterfacepatchEth,
-        NetworkinterfacepostEth,
-    )
-except ImportError:
-    HAS_PURESTORAGE = False
-
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.purestorage.flasharray.plugins.module_utils.purefa import (
+    HAS_PYPURECLIENT,
+    LazyModel,
     get_array,
     purefa_argument_spec,
 )
@@ -110,6 +100,14 @@ from ansible_collections.purestorage.flasharray.plugins.module_utils.api_helpers
     check_response,
 )
 
+HAS_PURESTORAGE = HAS_PYPURECLIENT
+
+NetworkInterfacePatch = LazyModel("NetworkInterfacePatch")
+NetworkInterfacePost = LazyModel("NetworkInterfacePost")
+ReferenceNoId = LazyModel("ReferenceNoId")
+NetworkinterfacepatchEth = LazyModel("NetworkinterfacepatchEth")
+NetworkinterfacepostEth = LazyModel("NetworkinterfacepostEth")
+
 
 def _get_subnet(module, array):
     """Return subnet or None"""
@@ -80,14 +80,10 @@ vnc:
         type: str
 """
 
-HAS_PURESTORAGE = True
-try:
-    from pypureclient.flasharray import App
-except ImportError:
-    HAS_PURESTORAGE = False
-
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.purestorage.flasharray.plugins.module_utils.purefa import (
+    HAS_PYPURECLIENT,
+    LazyModel,
     get_array,
     purefa_argument_spec,
 )
@@ -98,6 +94,10 @@ from ansible_collections.purestorage.flasharray.plugins.module_utils.api_helpers
     check_response,
 )
 
+HAS_PURESTORAGE = HAS_PYPURECLIENT
+
+App = LazyModel("App")
+
 MAX_API_VERSION = "2.36"
 
 
@@ -321,23 +321,12 @@ volume:
             type: int
 """
 
-HAS_PURESTORAGE = True
-try:
-    from pypureclient.flasharray import (
-        Qos,
-        VolumePost,
-        VolumePatch,
-        PriorityAdjustment,
-        Reference,
-        ReferenceType,
-    )
-except ImportError:
-    HAS_PURESTORAGE = False
-
 import re
 import time
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.purestorage.flasharray.plugins.module_utils.purefa import (
+    HAS_PYPURECLIENT,
+    LazyModel,
     get_array,
     purefa_argument_spec,
 )
@@ -350,8 +339,18 @@ from ansible_collections.purestorage.flasharray.plugins.module_utils.version imp
 )
 from ansible_collections.purestorage.flasharray.plugins.module_utils.api_helpers import (
     check_response,
+    get_local_array_name,
 )
 
+HAS_PURESTORAGE = HAS_PYPURECLIENT
+
+Qos = LazyModel("Qos")
+VolumePost = LazyModel("VolumePost")
+VolumePatch = LazyModel("VolumePatch")
+PriorityAdjustment = LazyModel("PriorityAdjustment")
+Reference = LazyModel("Reference")
+ReferenceType = LazyModel("ReferenceType")
+
 PURE_OUI = "naa.624a9370"
 PRIORITY_API_VERSION = "2.11"
 DEFAULT_API_VERSION = "2.16"
@@ -904,7 +903,7 @@ def create_multi_volume(module, array, single=False):
                 api_version
             ) and module.params["context"] not in [
                 "",
-                list(array.get_arrays().items)[0].name,
+                get_local_array_name(array),
             ]:
                 module.fail_json(
                     msg="Cannot specify a remote fleet member and a protection group"
@@ -949,8 +948,7 @@ def create_multi_volume(module, array, single=False):
             res = {}
             if (
                 LooseVersion(CONTEXT_API_VERSION) <= LooseVersion(api_version)
-                and module.params["context"]
-                not in ["", list(array.get_arrays().items)[0].name]
+                and module.params["context"] not in ["", get_local_array_name(array)]
                 and module.params["with_default_protection"]
             ):
                 module.fail_json(
@@ -1887,7 +1885,7 @@ def main():
         and not module.params["context"]
     ):
         # If no context is provided set the context to the local array name
-        module.params["context"] = list(array.get_arrays().items)[0].name
+        module.params["context"] = get_local_array_name(array)
 
     if module.params["bw_qos"]:
         bw_qos = int(human_to_bytes(module.params["bw_qos"]))
@@ -108,14 +108,9 @@ EXAMPLES = r"""
 RETURN = r"""
 """
 
-try:
-    from pypureclient.flasharray import TagBatch
-except ImportError:
-    HAS_PYPURECLIENT = False
-
-
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.purestorage.flasharray.plugins.module_utils.purefa import (
+    LazyModel,
     get_array,
     purefa_argument_spec,
 )
@@ -124,6 +119,8 @@ from ansible_collections.purestorage.flasharray.plugins.module_utils.api_helpers
     check_response,
 )
 
+TagBatch = LazyModel("TagBatch")
+
 CONTEXT_API_VERSION = "2.38"
 
 
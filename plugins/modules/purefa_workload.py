@@ -166,22 +166,11 @@ EXAMPLES = r"""
 RETURN = r"""
 """
 
-HAS_PURESTORAGE = True
-try:
-    from pypureclient.flasharray import (
-        WorkloadConfigurationReference,
-        WorkloadPatch,
-        WorkloadPost,
-        WorkloadPlacementRecommendation,
-        VolumePost,
-        ConnectionPost,
-    )
-except ImportError:
-    HAS_PURESTORAGE = False
-
 import time
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.purestorage.flasharray.plugins.module_utils.purefa import (
+    HAS_PYPURECLIENT,
+    LazyModel,
     get_array,
     purefa_argument_spec,
 )
@@ -192,6 +181,15 @@ from ansible_collections.purestorage.flasharray.plugins.module_utils.api_helpers
     check_response,
 )
 
+HAS_PURESTORAGE = HAS_PYPURECLIENT
+
+WorkloadConfigurationReference = LazyModel("WorkloadConfigurationReference")
+WorkloadPatch = LazyModel("WorkloadPatch")
+WorkloadPost = LazyModel("WorkloadPost")
+WorkloadPlacementRecommendation = LazyModel("WorkloadPlacementRecommendation")
+VolumePost = LazyModel("VolumePost")
+ConnectionPost = LazyModel("ConnectionPost")
+
 VERSION = 1.5
 USER_AGENT_BASE = "Ansible"
 MIN_REQUIRED_API_VERSION = "2.40"
@@ -0,0 +1,126 @@
+#!/usr/bin/env python
+# Copyright: (c) 2026, Pure Storage Ansible Team <pure-ansible-team@purestorage.com>
+# GNU General Public License v3.0+ (see COPYING.GPLv3 or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+"""Measure FlashArray module startup time up to the first REST request.
+
+Each module is run in a fresh interpreter, as Ansible does for every task.
+The time to import the module and the time until ``get_array`` constructs
+the py-pure-client ``Client`` are reported, along with the number of
+py-pure-client models packages loaded by then. The ``Client`` is replaced
+with a stub, so no array is contacted.
+
+Requires ansible-core and py-pure-client, with this collection installed
+somewhere on ``ANSIBLE_COLLECTIONS_PATH`` or ``sys.path``::
+
+    python tests/benchmarks/startup_benchmark.py purefa_volume purefa_host \\
+        --args '{"name": "bench"}' --runs 5
+"""
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+MARKER = "STARTUP_BENCHMARK:"
+
+CHILD = r"""
+import importlib, json, sys, time
+start = time.perf_counter()
+prefix = "ansible_collections.purestorage.flasharray.plugins."
+module = importlib.import_module(prefix + "modules." + sys.argv[1])
+imported = time.perf_counter()
+purefa = importlib.import_module(prefix + "module_utils.purefa")
+from ansible.module_utils import basic
+
+
+def report(first_request):
+    models = [
+        name for name in sys.modules
+        if name.startswith("pypureclient.") and name.endswith(".models")
+    ]
+    print(%(marker)r + json.dumps({
+        "import": imported - start,
+        "first_request": first_request,
+        "models_packages": len(models),
+    }))
+    sys.stdout.flush()
+    import os
+    os._exit(0)
+
+
+class Client(object):
+    def __init__(self, *args, **kwargs):
+        report(time.perf_counter() - start)
+
+
+purefa.flasharray = type("flasharray", (), {"Client": Client})
+args = {"fa_url": "benchmark.invalid", "api_token": "benchmark"}
+args.update(json.loads(sys.argv[2]))
+basic._ANSIBLE_ARGS = json.dumps({"ANSIBLE_MODULE_ARGS": args}).encode()
+try:
+    module.main()
+except BaseException:
+    pass
+report(None)
+""" % {"marker": MARKER}
+
+
+def run_module(name, module_args):
+    """Run one module in a new interpreter and return its timings"""
+    proc = subprocess.run(
+        [sys.executable, "-c", CHILD, name, json.dumps(module_args)],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        universal_newlines=True,
+        check=False,
+    )
+    for line in proc.stdout.splitlines():
+        if line.startswith(MARKER):
+            return json.loads(line[len(MARKER) :])
+    raise RuntimeError("%s did not report timings:\n%s" % (name, proc.stderr))
+
+
+def default_modules():
+    modules_dir = os.path.join(
+        os.path.dirname(os.path.abspath(__file__)), "..", "..", "plugins", "modules"
+    )
+    return sorted(
+        name[:-3]
+        for name in os.listdir(modules_dir)
+        if name.startswith("purefa_") and name.endswith(".py")
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("modules", nargs="*", help="Modules to measure (default all)")
+    parser.add_argument("--runs", type=int, default=3, help="Runs per module")
+    parser.add_argument(
+        "--args", default="{}", help="JSON module arguments added to every run"
+    )
+    options = parser.parse_args()
+    module_args = json.loads(options.args)
+
+    print(
+        "%-28s %12s %20s %8s"
+        % ("module", "import (ms)", "first request (ms)", "models")
+    )
+    for name in options.modules or default_modules():
+        results = [run_module(name, module_args) for dummy in range(options.runs)]
+        import_ms = min(result["import"] for result in results) * 1000
+        requests = [r["first_request"] for r in results if r["first_request"]]
+        first_request = "%.1f" % (min(requests) * 1000) if requests else "n/a"
+        print(
+            "%-28s %12.1f %20s %8d"
+            % (name, import_ms, first_request, results[0]["models_packages"])
+        )
+
+
+if __name__ == "__main__":
+    main()
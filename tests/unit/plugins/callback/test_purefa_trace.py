@@ -0,0 +1,173 @@
+# Copyright: (c) 2026, Pure Storage Ansible Team <pure-ansible-team@purestorage.com>
+# GNU General Public License v3.0+ (see COPYING.GPLv3 or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+"""Unit tests for purefa_trace callback plugin."""
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import csv
+import json
+import sys
+import types
+from unittest.mock import Mock, MagicMock
+
+
+class _CallbackBase(object):
+    """Minimal stand-in for the Ansible CallbackBase class."""
+
+    def __init__(self):
+        self._options = {"top": 10, "output_format": "json", "output_file": None}
+        self._display = Mock()
+
+    def get_option(self, name):
+        return self._options.get(name)
+
+
+# Mock external dependencies before importing the plugin
+callback_module = types.ModuleType("ansible.plugins.callback")
+callback_module.CallbackBase = _CallbackBase
+sys.modules["ansible"] = MagicMock()
+sys.modules["ansible.plugins"] = MagicMock()
+sys.modules["ansible.plugins.callback"] = callback_module
+
+from plugins.callback.purefa_trace import CallbackModule
+
+
+def _trace(array, time_ms, methods):
+    return {
+        "array": array,
+        "total_calls": sum(calls for calls, dummy in methods.values()),
+        "total_time_ms": time_ms,
+        "by_method": dict(
+            (name, {"calls": calls, "time_ms": method_ms})
+            for name, (calls, method_ms) in methods.items()
+        ),
+        "calls": [
+            {
+                "method": name,
+                "status": 200,
+                "latency_ms": method_ms / calls,
+                "items": 1,
+            }
+            for name, (calls, method_ms) in methods.items()
+            for dummy in range(calls)
+        ],
+    }
+
+
+def _result(task, host, action, result):
+    res = Mock()
+    res._task.get_name.return_value = task
+    res._task.action = action
+    res._host.get_name.return_value = host
+    res._result = result
+    return res
+
+
+def _callback():
+    callback = CallbackModule()
+    callback.v2_runner_on_ok(
+        _result(
+            "gather",
+            "localhost",
+            "purestorage.flasharray.purefa_info",
+            {
+                "_purefa_api_trace": _trace(
+                    "fa1", 30.0, {"get_volumes": (2, 20.0), "get_hosts": (1, 10.0)}
+                )
+            },
+        )
+    )
+    callback.v2_runner_on_failed(
+        _result(
+            "create",
+            "localhost",
+            "purestorage.flasharray.purefa_volume",
+            {
+                "results": [
+                    {
+                        "_purefa_api_trace": _trace(
+                            "fa2", 5.0, {"get_volumes": (1, 5.0)}
+                        )
+                    },
+                    {"skipped": True},
+                ]
+            },
+        )
+    )
+    callback.v2_runner_on_ok(_result("other", "localhost", "debug", {"msg": "x"}))
+    return callback
+
+
+class TestCallback:
+    """Tests for the purefa_trace callback."""
+
+    def test_collects_traces(self):
+        """Traces are collected from tasks and loop items only."""
+        callback = _callback()
+        assert [task["task"] for task in callback.tasks] == ["gather", "create"]
+
+    def test_collects_array_traces(self):
+        """A list of array traces adds one entry per array."""
+        callback = CallbackModule()
+        callback.v2_runner_on_ok(
+            _result(
+                "fleet",
+                "localhost",
+                "purestorage.flasharray.purefa_info",
+                {
+                    "_purefa_api_trace": [
+                        _trace("fa1", 10.0, {"get_arrays": (1, 10.0)}),
+                        _trace("fa2", 5.0, {"get_arrays": (1, 5.0)}),
+                    ]
+                },
+            )
+        )
+        assert callback.summarize()["arrays"] == {
+            "fa1": {"calls": 1, "time_ms": 10.0},
+            "fa2": {"calls": 1, "time_ms": 5.0},
+        }
+
+    def test_summarize(self):
+        """Totals are aggregated per module, endpoint and array."""
+        summary = _callback().summarize()
+        assert summary["endpoints"]["get_volumes"] == {"calls": 3, "time_ms": 25.0}
+        assert summary["arrays"]["fa1"] == {"calls": 3, "time_ms": 30.0}
+        assert summary["modules"]["purestorage.flasharray.purefa_volume"]["calls"] == 1
+        assert summary["slowest_tasks"][0]["task"] == "gather"
+
+    def test_top_limits_slowest_tasks(self):
+        """Only the configured number of slowest tasks is reported."""
+        callback = _callback()
+        callback._options["top"] = 1
+        assert len(callback.summarize()["slowest_tasks"]) == 1
+
+    def test_no_output_without_traces(self):
+        """Nothing is printed when no task was traced."""
+        callback = CallbackModule()
+        callback.v2_playbook_on_stats(Mock())
+        callback._display.banner.assert_not_called()
+
+    def test_json_output(self, tmp_path):
+        """JSON output holds the summary and every task trace."""
+        callback = _callback()
+        callback._options["output_file"] = str(tmp_path / "trace.json")
+        callback.v2_playbook_on_stats(Mock())
+        data = json.loads((tmp_path / "trace.json").read_text())
+        assert data["summary"]["arrays"]["fa2"]["calls"] == 1
+        assert len(data["tasks"]) == 2
+        callback._display.banner.assert_called_once_with("FLASHARRAY API TRACE")
+
+    def test_csv_output(self, tmp_path):
+        """CSV output has one row per REST call."""
+        callback = _callback()
+        callback._options["output_file"] = str(tmp_path / "trace.csv")
+        callback._options["output_format"] = "csv"
+        callback.v2_playbook_on_stats(Mock())
+        with open(str(tmp_path / "trace.csv")) as output:
+            rows = list(csv.DictReader(output))
+        assert len(rows) == 4
+        assert rows[0]["array"] == "fa1"
+        assert rows[-1]["module"] == "purestorage.flasharray.purefa_volume"
@@ -0,0 +1,81 @@
+# Copyright: (c) 2026, Pure Storage Ansible Team <pure-ansible-team@purestorage.com>
+# GNU General Public License v3.0+ (see COPYING.GPLv3 or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+"""Unit tests for purefa_expand filter plugin."""
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import sys
+from unittest.mock import MagicMock
+
+import pytest
+
+# Mock external dependencies before importing the plugin
+sys.modules["ansible"] = MagicMock()
+sys.modules["ansible.errors"] = MagicMock()
+sys.modules["ansible.errors"].AnsibleFilterError = ValueError
+
+from plugins.filter.purefa_expand import FilterModule, purefa_expand
+
+COLUMNAR = {
+    "columns": ["name", "serial", "size"],
+    "rows": [["vol1", "A", 1], ["vol2", "B", None]],
+}
+
+
+class TestPurefaExpand:
+    """Tests for the purefa_expand filter."""
+
+    def test_expands_subset(self):
+        """Rows become objects keyed by name."""
+        assert purefa_expand(COLUMNAR) == {
+            "vol1": {"serial": "A", "size": 1},
+            "vol2": {"serial": "B", "size": None},
+        }
+
+    def test_expands_every_subset(self):
+        """Columnar subsets of a purefa_info result are expanded."""
+        result = purefa_expand({"volumes": COLUMNAR, "capacity": {"free": 10}})
+        assert result["volumes"]["vol1"]["serial"] == "A"
+        assert result["capacity"] == {"free": 10}
+
+    def test_absent_keys_left_out(self):
+        """Keys listed as absent are not added to the objects."""
+        data = dict(COLUMNAR, absent=[[1, 2]])
+        assert purefa_expand(data) == {
+            "vol1": {"serial": "A", "size": 1},
+            "vol2": {"serial": "B"},
+        }
+
+    def test_expands_every_array(self):
+        """Results collected with arrays are expanded per array."""
+        result = purefa_expand(
+            {
+                "fa1": {"volumes": COLUMNAR, "capacity": {"free": 10}},
+                "fa2": {"volumes": {"columns": ["name"], "rows": []}},
+            }
+        )
+        assert result["fa1"]["volumes"]["vol2"] == {"serial": "B", "size": None}
+        assert result["fa1"]["capacity"] == {"free": 10}
+        assert result["fa2"] == {"volumes": {}}
+
+    def test_rejects_invalid_absent(self):
+        """Malformed absent entries are reported."""
+        with pytest.raises(ValueError, match="Invalid columnar"):
+            purefa_expand(dict(COLUMNAR, absent=[1]))
+
+    def test_rejects_non_dict(self):
+        """Only dictionaries can be expanded."""
+        with pytest.raises(ValueError, match="expects a dictionary"):
+            purefa_expand(["vol1"])
+
+    def test_rejects_invalid_rows(self):
+        """Rows without a name are reported."""
+        with pytest.raises(ValueError, match="Invalid columnar"):
+            purefa_expand({"columns": ["name"], "rows": [[]]})
+
+    def test_registered(self):
+        """The filter is registered under its name."""
+        assert FilterModule().filters()["purefa_expand"] is purefa_expand
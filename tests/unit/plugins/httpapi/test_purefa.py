@@ -0,0 +1,191 @@
+# Copyright: (c) 2026, Pure Storage Ansible Team <pure-ansible-team@purestorage.com>
+# GNU General Public License v3.0+ (see COPYING.GPLv3 or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+"""Unit tests for purefa httpapi plugin."""
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import io
+import json
+import sys
+import types
+from unittest.mock import Mock, MagicMock
+from urllib.error import HTTPError
+
+import pytest
+
+
+class _HttpApiBase(object):
+    """Minimal stand-in for the Ansible HttpApiBase class."""
+
+    def __init__(self, connection):
+        self.connection = connection
+        self._options = {"api_token": None, "api_version": None}
+
+    def get_option(self, name):
+        return self._options.get(name)
+
+
+class _AuthFailure(Exception):
+    pass
+
+
+# Mock external dependencies before importing the plugin
+httpapi_module = types.ModuleType("ansible.plugins.httpapi")
+httpapi_module.HttpApiBase = _HttpApiBase
+sys.modules["ansible"] = MagicMock()
+sys.modules["ansible.errors"] = MagicMock()
+sys.modules["ansible.errors"].AnsibleAuthenticationFailure = _AuthFailure
+sys.modules["ansible.plugins"] = MagicMock()
+sys.modules["ansible.plugins.httpapi"] = httpapi_module
+
+from plugins.httpapi.purefa import HttpApi
+
+
+def _response(body, code=200, headers=None):
+    response = Mock(headers=headers or {})
+    response.getcode.return_value = code
+    return response, io.BytesIO(json.dumps(body).encode("utf-8"))
+
+
+def _connection(token="session-token"):
+    """Connection whose login call sets the session token as netcommon does"""
+    connection = Mock(_auth=None)
+
+    def send(path, data, method="GET", headers=None):
+        if path == "/api/api_version":
+            return _response({"version": ["1.19", "2.9", "2.38", "2.4"]})
+        if path.endswith("/login"):
+            connection._auth = {"x-auth-token": token} if token else None
+            return _response({}, headers={"x-auth-token": token})
+        return _response({"items": [{"name": "fa1"}]})
+
+    connection.send.side_effect = send
+    connection.get_option.side_effect = lambda name: {
+        "remote_user": None,
+        "password": "password-token",
+    }[name]
+    return connection
+
+
+class TestVersion:
+    """Tests for REST version negotiation."""
+
+    def test_highest_2x_version(self):
+        """The highest 2.x version is chosen by numeric comparison."""
+        plugin = HttpApi(_connection())
+        assert plugin.get_api_version() == "2.38"
+        assert plugin.get_api_version() == "2.38"
+        assert plugin.connection.send.call_count == 1
+
+    def test_configured_version(self):
+        """A configured version is used without asking the array."""
+        plugin = HttpApi(_connection())
+        plugin._options["api_version"] = "2.26"
+        assert plugin.get_api_version() == "2.26"
+        plugin.connection.send.assert_not_called()
+
+
+class TestLogin:
+    """Tests for login and re-authentication."""
+
+    def test_login_with_api_token(self):
+        """The API token option is exchanged for a session token."""
+        plugin = HttpApi(_connection())
+        plugin._options["api_token"] = "api-token"
+        plugin.login(None, "password-token")
+        path, data = plugin.connection.send.call_args[0]
+        assert path == "/api/2.38/login"
+        assert plugin.connection.send.call_args[1]["headers"]["api-token"] == (
+            "api-token"
+        )
+        assert plugin.connection._auth == {"x-auth-token": "session-token"}
+
+    def test_login_falls_back_to_password(self):
+        """The connection password is used when no API token is set."""
+        plugin = HttpApi(_connection())
+        plugin.login(None, "password-token")
+        headers = plugin.connection.send.call_args[1]["headers"]
+        assert headers["api-token"] == "password-token"
+
+    def test_login_without_token(self):
+        """A missing API token fails authentication."""
+        plugin = HttpApi(_connection())
+        with pytest.raises(_AuthFailure, match="API token is required"):
+            plugin.login(None, None)
+
+    def test_login_without_session(self):
+        """A login that returns no session token fails authentication."""
+        plugin = HttpApi(_connection(token=None))
+        with pytest.raises(_AuthFailure, match="did not return a session token"):
+            plugin.login(None, "password-token")
+
+    def test_update_auth(self):
+        """The session token header is kept for later requests."""
+        plugin = HttpApi(_connection())
+        response = Mock(headers={"x-auth-token": "abc"})
+        assert plugin.update_auth(response, "") == {"x-auth-token": "abc"}
+        assert plugin.update_auth(Mock(headers={}), "") is None
+
+    def test_relogin_on_expired_session(self):
+        """A 401 with an active session logs in again and retries."""
+        plugin = HttpApi(_connection(token="new-token"))
+        plugin.connection._auth = {"x-auth-token": "expired"}
+        error = HTTPError("url", 401, "Unauthorized", {}, None)
+        assert plugin.handle_httperror(error) is True
+        assert plugin.connection._auth == {"x-auth-token": "new-token"}
+
+    def test_no_relogin_without_session(self):
+        """A 401 during login is returned instead of looping."""
+        plugin = HttpApi(_connection())
+        error = HTTPError("url", 401, "Unauthorized", {}, None)
+        assert plugin.handle_httperror(error) is error
+        plugin.connection.send.assert_not_called()
+
+    def test_other_errors_returned(self):
+        """Errors other than 401 are returned to the caller."""
+        plugin = HttpApi(_connection())
+        plugin.connection._auth = {"x-auth-token": "token"}
+        error = HTTPError("url", 404, "Not Found", {}, None)
+        assert plugin.handle_httperror(error) is error
+
+
+class TestSendRequest:
+    """Tests for send_request."""
+
+    def test_get(self):
+        """Requests are sent to the negotiated version with encoded params."""
+        plugin = HttpApi(_connection())
+        status, body = plugin.send_request(
+            "volumes", params={"names": "a,b", "destroyed": "false"}
+        )
+        assert status == 200
+        assert body == {"items": [{"name": "fa1"}]}
+        path = plugin.connection.send.call_args[0][0]
+        assert path == "/api/2.38/volumes?names=a%2Cb&destroyed=false"
+
+    def test_http_error_body(self):
+        """Error responses are decoded instead of raised."""
+        plugin = HttpApi(_connection())
+        plugin._options["api_version"] = "2.38"
+        body = json.dumps({"errors": [{"message": "not found"}]}).encode("utf-8")
+        plugin.connection.send.side_effect = HTTPError(
+            "url", 400, "Bad Request", {}, io.BytesIO(body)
+        )
+        status, data = plugin.send_request("volumes", method="PATCH", body={})
+        assert status == 400
+        assert data["errors"][0]["message"] == "not found"
+
+    def test_non_json_error(self):
+        """A non-JSON error body is returned as an error message."""
+        plugin = HttpApi(_connection())
+        plugin._options["api_version"] = "2.38"
+        plugin.connection.send.side_effect = HTTPError(
+            "url", 502, "Bad Gateway", {}, io.BytesIO(b"Bad Gateway")
+        )
+        assert plugin.send_request("volumes") == (
+            502,
+            {"errors": [{"message": "Bad Gateway"}]},
+        )
@@ -0,0 +1,313 @@
+# Copyright: (c) 2026, Pure Storage Ansible Team <pure-ansible-team@purestorage.com>
+# GNU General Public License v3.0+ (see COPYING.GPLv3 or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+"""Unit tests for purefa inventory plugin."""
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import sys
+import types
+from unittest.mock import Mock, MagicMock, patch
+
+import pytest
+
+
+class _PluginBase(object):
+    """Minimal stand-in for the Ansible inventory plugin base classes."""
+
+    def __init__(self):
+        self._options = {}
+        self._cache = {}
+        self.display = Mock()
+
+    def get_option(self, name):
+        return self._options.get(name)
+
+    @staticmethod
+    def _sanitize_group_name(name):
+        return name.replace("-", "_").replace(".", "_")
+
+    def _set_composite_vars(self, *args, **kwargs):
+        pass
+
+    def _add_host_to_composed_groups(self, *args, **kwargs):
+        pass
+
+    def _add_host_to_keyed_groups(self, *args, **kwargs):
+        pass
+
+
+class _Constructable(object):
+    pass
+
+
+class _Cacheable(object):
+    pass
+
+
+# Mock external dependencies before importing the plugin
+inventory_module = types.ModuleType("ansible.plugins.inventory")
+inventory_module.BaseInventoryPlugin = _PluginBase
+inventory_module.Constructable = _Constructable
+inventory_module.Cacheable = _Cacheable
+sys.modules["ansible"] = MagicMock()
+sys.modules["ansible.errors"] = MagicMock()
+sys.modules["ansible.errors"].AnsibleError = Exception
+sys.modules["ansible.plugins"] = MagicMock()
+sys.modules["ansible.plugins.inventory"] = inventory_module
+sys.modules["pypureclient"] = MagicMock()
+sys.modules["pypureclient.flasharray"] = MagicMock()
+sys.modules["ansible_collections"] = MagicMock()
+sys.modules["ansible_collections.purestorage"] = MagicMock()
+sys.modules["ansible_collections.purestorage.flasharray"] = MagicMock()
+sys.modules["ansible_collections.purestorage.flasharray.plugins"] = MagicMock()
+sys.modules["ansible_collections.purestorage.flasharray.plugins.module_utils"] = (
+    MagicMock()
+)
+mock_api_helpers = MagicMock()
+mock_api_helpers.iter_items.side_effect = lambda client, method, **kwargs: getattr(
+    client, method
+)(**kwargs).items
+sys.modules[
+    "ansible_collections.purestorage.flasharray.plugins.module_utils.api_helpers"
+] = mock_api_helpers
+from plugins.module_utils import error_handlers
+
+sys.modules[
+    "ansible_collections.purestorage.flasharray.plugins.module_utils.error_handlers"
+] = error_handlers
+
+from plugins.inventory import purefa as purefa_inventory
+from plugins.inventory.purefa import InventoryModule, collect_array
+
+
+def _named(name, **attrs):
+    obj = Mock(**attrs)
+    obj.name = name
+    return obj
+
+
+def _client(array_name="fa1"):
+    client = Mock()
+    client.get_arrays.return_value = Mock(status_code=200, items=[_named(array_name)])
+    client.get_connections.return_value = Mock(
+        status_code=200,
+        items=[
+            Mock(host=_named("host1"), volume=_named("vol1")),
+            Mock(host=None, volume=_named("vol2")),
+        ],
+    )
+    client.get_hosts.return_value = Mock(
+        status_code=200,
+        items=[
+            _named(
+                "host1",
+                host_group=_named("hg1"),
+                iqns=["iqn.1"],
+                wwns=[],
+                nqns=None,
+                personality=None,
+            )
+        ],
+    )
+    client.get_host_groups.return_value = Mock(
+        status_code=200, items=[_named("hg1", host_count=1)]
+    )
+    client.get_volumes.return_value = Mock(
+        items=[
+            _named("vol1", serial="ABC", provisioned=1024, pod=None, volume_group=None),
+            _named(
+                "pod1::vol2",
+                serial="DEF",
+                provisioned=2048,
+                pod=_named("pod1"),
+                volume_group=None,
+            ),
+        ],
+        continuation_token=None,
+    )
+    client.get_pods.return_value = Mock(
+        status_code=200,
+        items=[
+            _named("pod1", arrays=[_named(array_name)], promotion_status="promoted")
+        ],
+    )
+    return client
+
+
+class _Inventory(object):
+    def __init__(self):
+        self.hosts = {}
+        self.groups = {}
+
+    def add_host(self, host):
+        self.hosts.setdefault(host, {})
+
+    def add_group(self, group):
+        self.groups.setdefault(group, set())
+
+    def add_child(self, group, host):
+        self.groups[group].add(host)
+
+    def set_variable(self, host, key, value):
+        self.hosts[host][key] = value
+
+
+def _plugin(**options):
+    plugin = InventoryModule()
+    plugin._options = {
+        "objects": ["hosts", "hgroups", "volumes", "pods"],
+        "max_workers": 4,
+        "disable_warnings": False,
+        "cache": False,
+    }
+    plugin._options.update(options)
+    plugin.inventory = _Inventory()
+    plugin.templar = Mock()
+    plugin.templar.template.side_effect = lambda value: value
+    return plugin
+
+
+class TestCollectArray:
+    """Tests for collect_array."""
+
+    def test_all_objects(self):
+        """All object types are collected with their connections."""
+        data = collect_array(_client(), ["hosts", "hgroups", "volumes", "pods"])
+        assert data["name"] == "fa1"
+        assert data["hosts"][0]["volumes"] == ["vol1"]
+        assert data["hosts"][0]["host_group"] == "hg1"
+        assert data["hosts"][0]["nqns"] == []
+        assert data["volumes"][0]["hosts"] == ["host1"]
+        assert data["volumes"][1]["pod"] == "pod1"
+        assert data["pods"][0]["arrays"] == ["fa1"]
+
+    def test_only_requested_objects(self):
+        """Unrequested object types are not queried."""
+        client = _client()
+        data = collect_array(client, ["hgroups"])
+        assert "hosts" not in data and "volumes" not in data
+        client.get_connections.assert_not_called()
+        client.get_volumes.assert_not_called()
+        client.get_pods.assert_not_called()
+
+    def test_failed_call(self):
+        """A failed call is reported with the array error message."""
+        client = _client()
+        client.get_hosts.return_value = Mock(
+            status_code=403, items=None, errors=[Mock(message="Forbidden")]
+        )
+        with pytest.raises(Exception, match="get_hosts failed: Forbidden"):
+            collect_array(client, ["hosts"])
+
+
+class TestPopulate:
+    """Tests for InventoryModule.populate."""
+
+    def test_hosts_and_groups(self):
+        """Objects become hosts in array, type, host group and pod groups."""
+        plugin = _plugin()
+        plugin.populate(
+            [collect_array(_client(), ["hosts", "hgroups", "volumes", "pods"])]
+        )
+        inventory = plugin.inventory
+        assert inventory.hosts["fa1_host_host1"]["purefa_iqns"] == ["iqn.1"]
+        assert inventory.hosts["fa1_host_host1"]["purefa_type"] == "host"
+        assert "fa1_host_host1" in inventory.groups["purefa_hgroup_hg1"]
+        assert "fa1_host_host1" in inventory.groups["purefa_fa1"]
+        assert "fa1_volume_pod1__vol2" in inventory.groups["purefa_pod_pod1"]
+        assert "fa1_pod_pod1" in inventory.groups["purefa_pods"]
+        assert inventory.groups["purefa_hgroups"] == {"fa1_hgroup_hg1"}
+
+
+class TestParse:
+    """Tests for array queries and caching."""
+
+    def test_arrays_queried_concurrently_in_order(self):
+        """Every array is queried and results keep the configured order."""
+        plugin = _plugin(
+            arrays=[
+                {"fa_url": "fa1.example.com", "api_token": "t1"},
+                {"fa_url": "fa2.example.com", "api_token": "t2"},
+            ]
+        )
+        clients = {"fa1.example.com": _client("fa1"), "fa2.example.com": _client("fa2")}
+        with patch.object(purefa_inventory, "flasharray") as flasharray:
+            flasharray.Client.side_effect = lambda target, **kwargs: clients[target]
+            results = plugin._fetch()
+        assert [result["name"] for result in results] == ["fa1", "fa2"]
+
+    def test_failed_array_skipped(self):
+        """An array that cannot be queried is skipped with a warning."""
+        plugin = _plugin(
+            arrays=[
+                {"fa_url": "fa1.example.com", "api_token": "t1"},
+                {"fa_url": "fa2.example.com", "api_token": "t2"},
+            ]
+        )
+
+        def connect(target, **kwargs):
+            if target == "fa2.example.com":
+                raise ConnectionError("connection refused")
+            return _client("fa1")
+
+        with patch.object(purefa_inventory, "flasharray") as flasharray:
+            flasharray.Client.side_effect = connect
+            results = plugin._fetch()
+        assert results[0]["name"] == "fa1"
+        assert results[1] is None
+        assert "fa2.example.com" in plugin.display.warning.call_args[0][0]
+        plugin.populate(results)
+        assert "fa1_hgroup_hg1" in plugin.inventory.hosts
+
+    def test_failed_array_strict(self):
+        """With strict set, an array that cannot be queried is an error."""
+        plugin = _plugin(
+            strict=True, arrays=[{"fa_url": "fa1.example.com", "api_token": "t1"}]
+        )
+        with patch.object(purefa_inventory, "flasharray") as flasharray:
+            flasharray.Client.side_effect = ConnectionError("connection refused")
+            with pytest.raises(Exception, match="Failed to query FlashArray"):
+                plugin._fetch()
+
+    def test_invalid_max_workers(self):
+        """max_workers below 1 is rejected."""
+        plugin = _plugin(max_workers=0)
+        with pytest.raises(Exception, match="max_workers must be at least 1"):
+            plugin._fetch()
+
+    def test_partial_results_not_cached(self):
+        """Results with a skipped array are not cached."""
+        plugin = _plugin(cache=True)
+        plugin._read_config_data = Mock()
+        plugin.get_cache_key = Mock(return_value="key")
+        plugin._fetch = Mock(return_value=[collect_array(_client(), ["hgroups"]), None])
+        with patch.object(_PluginBase, "parse", create=True):
+            plugin.parse(plugin.inventory, None, "purefa.yml", cache=False)
+        assert "key" not in plugin._cache
+        assert "fa1_hgroup_hg1" in plugin.inventory.hosts
+
+    def test_cached_results_skip_queries(self):
+        """A warm cache populates the inventory without querying arrays."""
+        plugin = _plugin(cache=True)
+        plugin._cache["key"] = [collect_array(_client(), ["hgroups"])]
+        plugin._read_config_data = Mock()
+        plugin.get_cache_key = Mock(return_value="key")
+        plugin._fetch = Mock()
+        with patch.object(_PluginBase, "parse", create=True):
+            plugin.parse(plugin.inventory, None, "purefa.yml", cache=True)
+        plugin._fetch.assert_not_called()
+        assert "fa1_hgroup_hg1" in plugin.inventory.hosts
+
+    def test_cache_refreshed(self):
+        """A cache refresh queries arrays and stores the results."""
+        plugin = _plugin(cache=True)
+        plugin._read_config_data = Mock()
+        plugin.get_cache_key = Mock(return_value="key")
+        results = [collect_array(_client(), ["hgroups"])]
+        plugin._fetch = Mock(return_value=results)
+        with patch.object(_PluginBase, "parse", create=True):
+            plugin.parse(plugin.inventory, None, "purefa.yml", cache=False)
+        assert plugin._cache["key"] is results
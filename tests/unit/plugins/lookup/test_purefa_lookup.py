@@ -0,0 +1,248 @@
+# Copyright: (c) 2026, Pure Storage Ansible Team <pure-ansible-team@purestorage.com>
+# GNU General Public License v3.0+ (see COPYING.GPLv3 or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+"""Unit tests for purefa_lookup lookup plugin."""
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import json
+import os
+import sys
+import time
+import types
+from unittest.mock import Mock, MagicMock, patch
+
+import pytest
+
+
+class _LookupBase(object):
+    """Minimal stand-in for the Ansible LookupBase class."""
+
+    def __init__(self):
+        self._options = {}
+
+    def set_options(self, var_options=None, direct=None):
+        self._options = {
+            "fa_url": None,
+            "api_token": None,
+            "filter": None,
+            "names": None,
+            "fields": None,
+            "cache": True,
+            "cache_ttl": 600,
+        }
+        self._options.update(direct or {})
+
+    def get_option(self, name):
+        return self._options.get(name)
+
+
+# Mock external dependencies before importing the plugin
+lookup_module = types.ModuleType("ansible.plugins.lookup")
+lookup_module.LookupBase = _LookupBase
+sys.modules["ansible"] = MagicMock()
+sys.modules["ansible.errors"] = MagicMock()
+sys.modules["ansible.errors"].AnsibleError = RuntimeError
+sys.modules["ansible.plugins"] = MagicMock()
+sys.modules["ansible.plugins.lookup"] = lookup_module
+sys.modules["pypureclient"] = MagicMock()
+sys.modules["pypureclient.flasharray"] = MagicMock()
+sys.modules["ansible_collections"] = MagicMock()
+sys.modules["ansible_collections.purestorage"] = MagicMock()
+sys.modules["ansible_collections.purestorage.flasharray"] = MagicMock()
+sys.modules["ansible_collections.purestorage.flasharray.plugins"] = MagicMock()
+sys.modules["ansible_collections.purestorage.flasharray.plugins.module_utils"] = (
+    MagicMock()
+)
+mock_api_helpers = MagicMock()
+mock_api_helpers.DEFAULT_PAGE_SIZE = 2
+mock_api_helpers.iter_items.side_effect = lambda client, method, **kwargs: getattr(
+    client, method
+)(**kwargs).items
+sys.modules[
+    "ansible_collections.purestorage.flasharray.plugins.module_utils.api_helpers"
+] = mock_api_helpers
+
+from plugins.lookup import purefa_lookup
+from plugins.lookup.purefa_lookup import LookupModule, project
+
+
+def _volume(name, serial, physical):
+    vol = Mock(spec=["name", "serial", "space", "to_dict"])
+    vol.name = name
+    vol.serial = serial
+    vol.space = Mock(spec=["total_physical"], total_physical=physical)
+    vol.to_dict.return_value = {"name": name, "serial": serial}
+    return vol
+
+
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch):
+    """Keep lookup cache files in a temporary directory."""
+    monkeypatch.setattr(purefa_lookup.C, "DEFAULT_LOCAL_TMP", str(tmp_path))
+    return tmp_path
+
+
+@pytest.fixture
+def client():
+    """FlashArray client returning one page of volumes."""
+    client = Mock()
+    client.get_volumes.return_value = Mock(
+        status_code=200,
+        items=[_volume("db1", "ABC", 10)],
+        continuation_token=None,
+    )
+    with patch.object(purefa_lookup, "flasharray") as flasharray:
+        flasharray.Client.return_value = client
+        yield client
+
+
+class TestProject:
+    """Tests for project."""
+
+    def test_all_fields(self):
+        """Without fields the whole object is returned."""
+        assert project(_volume("db1", "ABC", 10), None) == {
+            "name": "db1",
+            "serial": "ABC",
+        }
+
+    def test_dotted_fields(self):
+        """Nested fields are selected with dotted paths."""
+        assert project(
+            _volume("db1", "ABC", 10), ["serial", "space.total_physical"]
+        ) == {"serial": "ABC", "space.total_physical": 10}
+
+
+class TestRun:
+    """Tests for LookupModule.run."""
+
+    def test_server_side_filter(self, client, cache_dir):
+        """The filter is sent to the array and fields are projected."""
+        result = LookupModule().run(
+            ["volumes"],
+            {},
+            fa_url="fa1",
+            api_token="token",
+            filter="name='db*'",
+            fields=["serial"],
+        )
+        assert result == [{"serial": "ABC"}]
+        client.get_volumes.assert_called_once_with(limit=2, filter="name='db*'")
+
+    def test_follows_continuation_token(self, client, cache_dir):
+        """Full pages are followed with the continuation token."""
+        client.get_volumes.side_effect = [
+            Mock(
+                status_code=200,
+                items=[_volume("db1", "A", 1), _volume("db2", "B", 2)],
+                continuation_token="next",
+            ),
+            Mock(status_code=200, items=[_volume("db3", "C", 3)]),
+        ]
+        result = LookupModule().run(
+            ["volumes"], {}, fa_url="fa1", api_token="token", fields=["name"]
+        )
+        assert [obj["name"] for obj in result] == ["db1", "db2", "db3"]
+        assert client.get_volumes.call_args[1]["continuation_token"] == "next"
+
+    def test_failed_continuation_page(self, client, cache_dir):
+        """A later page that fails is reported instead of truncating."""
+        client.get_volumes.side_effect = [
+            Mock(
+                status_code=200,
+                items=[_volume("db1", "A", 1), _volume("db2", "B", 2)],
+                continuation_token="next",
+            ),
+            ValueError("get_volumes failed: Internal error"),
+        ]
+        with pytest.raises(RuntimeError, match="Failed to query volumes"):
+            LookupModule().run(["volumes"], {}, fa_url="fa1", api_token="token")
+
+    def test_cached_for_the_play(self, client, cache_dir):
+        """A repeated query in the same play is served from the cache."""
+        variables = {"ansible_play_name": "play1"}
+        options = {"fa_url": "fa1", "api_token": "token", "fields": ["serial"]}
+        first = LookupModule().run(["volumes"], variables, **options)
+        second = LookupModule().run(["volumes"], variables, **options)
+        assert first == second == [{"serial": "ABC"}]
+        assert client.get_volumes.call_count == 1
+        LookupModule().run(["volumes"], {"ansible_play_name": "play2"}, **options)
+        assert client.get_volumes.call_count == 2
+
+    def test_cache_in_run_tmp(self, client, cache_dir):
+        """The cache is kept in the local temporary directory of the run."""
+        LookupModule().run(["volumes"], {}, fa_url="fa1", api_token="token")
+        assert len(list(cache_dir.glob("purefa_lookup/*.json"))) == 1
+
+    def test_cache_dir_exists(self, client, cache_dir):
+        """A cache directory created by a parallel lookup is reused."""
+        (cache_dir / "purefa_lookup").mkdir()
+        options = {"fa_url": "fa1", "api_token": "token"}
+        LookupModule().run(["volumes"], {}, **options)
+        LookupModule().run(["volumes"], {}, **options)
+        assert client.get_volumes.call_count == 1
+
+    def test_cache_dir_unusable(self, client, cache_dir):
+        """Results are not cached when the cache directory cannot be created."""
+        (cache_dir / "purefa_lookup").write_text("")
+        options = {"fa_url": "fa1", "api_token": "token"}
+        for dummy in range(2):
+            assert LookupModule().run(["volumes"], {}, **options)
+        assert client.get_volumes.call_count == 2
+
+    def test_cache_expires(self, client, cache_dir):
+        """Cached results older than cache_ttl are queried again."""
+        options = {"fa_url": "fa1", "api_token": "token", "cache_ttl": 60}
+        LookupModule().run(["volumes"], {}, **options)
+        for path in cache_dir.glob("purefa_lookup/*.json"):
+            os.utime(str(path), (time.time() - 120, time.time() - 120))
+        LookupModule().run(["volumes"], {}, **options)
+        assert client.get_volumes.call_count == 2
+
+    def test_cache_rewritten_whole(self, client, cache_dir):
+        """A shorter result replaces a longer cache file without leftovers."""
+        options = {"fa_url": "fa1", "api_token": "token", "cache_ttl": 60}
+        client.get_volumes.return_value = Mock(
+            status_code=200,
+            items=[_volume("db1", "ABC", 10), _volume("db2", "DEF", 20)],
+            continuation_token=None,
+        )
+        LookupModule().run(["volumes"], {}, **options)
+        for path in cache_dir.glob("purefa_lookup/*.json"):
+            os.utime(str(path), (time.time() - 120, time.time() - 120))
+        client.get_volumes.return_value = Mock(
+            status_code=200, items=[], continuation_token=None
+        )
+        LookupModule().run(["volumes"], {}, **options)
+        cache_files = list(cache_dir.glob("purefa_lookup/*"))
+        assert len(cache_files) == 1
+        assert json.loads(cache_files[0].read_text()) == []
+
+    def test_cache_disabled(self, client, cache_dir):
+        """With cache disabled every query contacts the array."""
+        for dummy in range(2):
+            LookupModule().run(
+                ["volumes"], {}, fa_url="fa1", api_token="token", cache=False
+            )
+        assert client.get_volumes.call_count == 2
+
+    def test_error_response(self, client, cache_dir):
+        """A failed query raises with the array error message."""
+        error = Mock()
+        error.message = "Invalid filter"
+        client.get_volumes.return_value = Mock(status_code=400, errors=[error])
+        with pytest.raises(RuntimeError, match="Invalid filter"):
+            LookupModule().run(["volumes"], {}, fa_url="fa1", api_token="token")
+
+    def test_unknown_object_type(self, client, cache_dir):
+        """Object types must name a list endpoint."""
+        with pytest.raises(RuntimeError, match="Unknown FlashArray object type"):
+            LookupModule().run(["volumes; rm"], {}, fa_url="fa1", api_token="token")
+
+    def test_missing_credentials(self, client, cache_dir):
+        """Credentials are required."""
+        with pytest.raises(RuntimeError, match="PUREFA_URL"):
+            LookupModule().run(["volumes"], {})
@@ -8,7 +8,9 @@ from __future__ import absolute_import, division, print_function
 __metaclass__ = type
 
 import sys
-from unittest.mock import Mock, MagicMock
+
+import pytest
+from unittest.mock import Mock, MagicMock, patch
 
 # Mock external dependencies before importing api_helpers
 sys.modules["pypureclient"] = MagicMock()
@@ -54,12 +56,30 @@ sys.modules[
 sys.modules[
     "ansible_collections.purestorage.flasharray.plugins.module_utils.version"
 ].LooseVersion = MockLooseVersion
+from plugins.module_utils import error_handlers
+
+sys.modules[
+    "ansible_collections.purestorage.flasharray.plugins.module_utils.error_handlers"
+] = error_handlers
 
+from plugins.module_utils.error_handlers import FlashArrayAPIError
 from plugins.module_utils.api_helpers import (
+    ApiCapabilities,
+    CachedClient,
+    RetryingClient,
+    TracingClient,
+    enable_api_retry,
+    enable_api_trace,
     check_response,
     get_cached_api_version,
     check_api_version,
     get_with_context,
+    get_api_capabilities,
+    get_fleet_contexts,
+    get_item_count,
+    get_items_across_contexts,
+    get_local_array_name,
+    iter_items,
 )
 
 
@@ -156,6 +176,43 @@ class TestGetCachedApiVersion:
         assert result == "2.40"
 
 
+class TestApiCapabilities:
+    """Tests for ApiCapabilities and get_api_capabilities."""
+
+    def test_flags_from_version(self):
+        """Feature flags reflect the minimum version of each feature."""
+        api_caps = ApiCapabilities.from_version("2.26")
+        assert api_caps.api_version == "2.26"
+        assert api_caps.shared_cap is True
+        assert api_caps.safe_mode is True
+        assert api_caps.subs is True
+        assert api_caps.context is False
+        assert api_caps.tags is False
+
+    def test_supports_compares_numerically(self):
+        """Versions compare by number, not as strings."""
+        api_caps = ApiCapabilities.from_version("2.9")
+        assert api_caps.supports("2.9")
+        assert api_caps.supports("2.10") is False
+        assert ApiCapabilities.from_version("2.10").supports("2.9")
+
+    def test_computed_once_per_client(self):
+        """The API version is requested once and the result reused."""
+        client = Mock()
+        client.get_rest_version.return_value = "2.39"
+        first = get_api_capabilities(client)
+        second = get_api_capabilities(client)
+        assert first is second
+        assert first.tags is True
+        client.get_rest_version.assert_called_once_with()
+
+    def test_immutable(self):
+        """Capabilities cannot be changed after they are computed."""
+        api_caps = ApiCapabilities.from_version("2.38")
+        with pytest.raises(AttributeError):
+            api_caps.tags = True
+
+
 class TestCheckApiVersion:
     """Tests for check_api_version function."""
 
@@ -288,3 +345,582 @@ class TestGetWithContext:
             destroyed=False,
             filter="name='vol*'",
         )
+
+
+class TestCachedClient:
+    """Tests for CachedClient memoization proxy."""
+
+    def test_repeated_get_is_cached(self, mock_array):
+        """Test that identical GET calls reach the array once."""
+        mock_array.get_arrays.return_value = Mock(
+            status_code=200, items=iter(["array1"])
+        )
+        client = CachedClient(mock_array)
+
+        first = client.get_arrays()
+        second = client.get_arrays()
+
+        mock_array.get_arrays.assert_called_once_with()
+        assert list(first.items) == list(second.items) == ["array1"]
+        assert client.cache_stats() == {"hits": 1, "misses": 1}
+
+    def test_directory_policies_cached(self, mock_array):
+        """Test directory policy memberships are read once for all subsets."""
+        mock_array.get_directories_policies.return_value = Mock(
+            status_code=200, items=iter([])
+        )
+        client = CachedClient(mock_array)
+
+        client.get_directories_policies()
+        client.get_directories_policies()
+
+        mock_array.get_directories_policies.assert_called_once_with()
+
+    def test_large_listings_not_cached(self, mock_array):
+        """Test that listings as large as the volume list are not cached."""
+        mock_array.get_volume_groups_volumes.return_value = Mock(
+            status_code=200, items=[]
+        )
+        client = CachedClient(mock_array)
+
+        client.get_volume_groups_volumes()
+        client.get_volume_groups_volumes()
+
+        assert mock_array.get_volume_groups_volumes.call_count == 2
+
+    def test_arguments_are_part_of_key(self, mock_array):
+        """Test that calls with different arguments are cached separately."""
+        mock_array.get_hardware.return_value = Mock(status_code=200, items=[])
+        client = CachedClient(mock_array)
+
+        client.get_hardware(filter="type='controller'")
+        client.get_hardware()
+        client.get_hardware(filter="type='controller'")
+
+        assert mock_array.get_hardware.call_count == 2
+        assert client.cache_stats() == {"hits": 1, "misses": 2}
+
+    def test_errors_are_not_cached(self, mock_array, mock_error_response):
+        """Test that failed calls are retried on the next request."""
+        mock_array.get_offloads.return_value = mock_error_response
+        client = CachedClient(mock_array)
+
+        client.get_offloads()
+        client.get_offloads()
+
+        assert mock_array.get_offloads.call_count == 2
+
+    def test_large_listings_pass_through(self, mock_array):
+        """Test that endpoints outside the allowlist are neither cached nor counted."""
+        items = iter(["conn1"])
+        mock_array.get_connections.return_value = Mock(status_code=200, items=items)
+        client = CachedClient(mock_array)
+
+        assert client.get_connections().items is items
+        client.get_connections()
+        client.get_rest_version()
+
+        assert mock_array.get_connections.call_count == 2
+        assert client.cache_stats() == {"hits": 0, "misses": 0}
+
+    def test_paginated_and_write_calls_pass_through(self, mock_array):
+        """Test that paginated GETs and non-GET calls are not cached."""
+        client = CachedClient(mock_array)
+
+        client.get_volumes(limit=10)
+        client.get_volumes(limit=10)
+        client.patch_volumes(names=["vol1"])
+        client.patch_volumes(names=["vol1"])
+
+        assert mock_array.get_volumes.call_count == 2
+        assert mock_array.patch_volumes.call_count == 2
+        assert client.cache_stats() == {"hits": 0, "misses": 0}
+
+
+class TestGetLocalArrayName:
+    """Tests for get_local_array_name function."""
+
+    def test_fetched_once(self):
+        """The arrays endpoint is queried once per client."""
+        client = Mock()
+        array_info = Mock()
+        array_info.name = "array1"
+        client.get_arrays.return_value = Mock(items=[array_info])
+        assert get_local_array_name(client) == "array1"
+        assert get_local_array_name(client) == "array1"
+        client.get_arrays.assert_called_once_with()
+
+    def test_seeded_name(self):
+        """A name seeded by get_array is used without a call."""
+        client = Mock()
+        client._local_array_name = "array2"
+        assert get_local_array_name(client) == "array2"
+        client.get_arrays.assert_not_called()
+
+
+class TestGetItemCount:
+    """Tests for get_item_count function."""
+
+    def test_returns_total_item_count(self, mock_array):
+        """Test that the count comes from a single-item page."""
+        mock_array.get_volumes.return_value = Mock(
+            status_code=200, total_item_count=12345
+        )
+
+        result = get_item_count(mock_array, "get_volumes", destroyed=False)
+
+        assert result == 12345
+        mock_array.get_volumes.assert_called_once_with(
+            limit=1, total_item_count=True, destroyed=False
+        )
+
+    def test_error_response_is_unknown(self, mock_array, mock_error_response):
+        """Test that a failed call is not reported as an empty collection."""
+        mock_array.get_volumes.return_value = mock_error_response
+
+        assert get_item_count(mock_array, "get_volumes") is None
+
+    def test_empty_collection_counts_zero(self, mock_array):
+        """Test that an empty collection counts as zero objects."""
+        mock_array.get_volumes.return_value = Mock(status_code=200, total_item_count=0)
+
+        assert get_item_count(mock_array, "get_volumes") == 0
+
+    def test_missing_total_is_unknown(self, mock_array):
+        """Test that a response without a total is not reported as zero."""
+        mock_array.get_volumes.return_value = Mock(
+            status_code=200, total_item_count=None
+        )
+
+        assert get_item_count(mock_array, "get_volumes") is None
+
+    def test_failed_count(self, mock_array, mock_error_response):
+        """Test that a failed call returns the given failed_count."""
+        mock_array.get_file_systems.return_value = mock_error_response
+
+        assert get_item_count(mock_array, "get_file_systems", failed_count=0) == 0
+        mock_array.get_file_systems.assert_called_once_with(
+            limit=1, total_item_count=True
+        )
+
+
+class TestIterItems:
+    """Tests for iter_items function."""
+
+    def test_follows_continuation_token(self, mock_array):
+        """Test that pages are requested until the token runs out."""
+        mock_array.get_volume_snapshots.side_effect = [
+            Mock(status_code=200, items=["snap1", "snap2"], continuation_token="t1"),
+            Mock(status_code=200, items=["snap3"], continuation_token=None),
+        ]
+
+        result = list(
+            iter_items(mock_array, "get_volume_snapshots", page_size=2, destroyed=False)
+        )
+
+        assert result == ["snap1", "snap2", "snap3"]
+        assert mock_array.get_volume_snapshots.call_args_list[0][1] == {
+            "limit": 2,
+            "destroyed": False,
+        }
+        assert mock_array.get_volume_snapshots.call_args_list[1][1] == {
+            "limit": 2,
+            "destroyed": False,
+            "continuation_token": "t1",
+        }
+
+    def test_stops_on_short_page(self, mock_array):
+        """Test that a page smaller than page_size ends iteration."""
+        mock_array.get_volumes.return_value = Mock(
+            status_code=200, items=["vol1"], continuation_token="t1"
+        )
+
+        assert list(iter_items(mock_array, "get_volumes", page_size=2)) == ["vol1"]
+        mock_array.get_volumes.assert_called_once_with(limit=2)
+
+    def test_is_lazy(self, mock_array):
+        """Test that the next page is only requested once it is needed."""
+        mock_array.get_volumes.return_value = Mock(
+            status_code=200, items=["vol1", "vol2"], continuation_token="t1"
+        )
+
+        items = iter_items(mock_array, "get_volumes", page_size=2)
+        next(items)
+
+        mock_array.get_volumes.assert_called_once_with(limit=2)
+
+    def test_error_response_raises(self, mock_array, mock_error_response):
+        """Test that an error response is not treated as an empty collection."""
+        mock_array.get_volumes.return_value = mock_error_response
+
+        with pytest.raises(
+            FlashArrayAPIError, match="get_volumes failed: Test error message"
+        ):
+            list(iter_items(mock_array, "get_volumes"))
+
+    def test_failed_second_page_raises(self, mock_array, mock_error_response):
+        """Test that a page failing part way through does not truncate."""
+        mock_array.get_volumes.side_effect = [
+            Mock(status_code=200, items=["vol1", "vol2"], continuation_token="t1"),
+            mock_error_response,
+        ]
+
+        items = iter_items(mock_array, "get_volumes", page_size=2)
+
+        assert [next(items), next(items)] == ["vol1", "vol2"]
+        with pytest.raises(FlashArrayAPIError) as err:
+            next(items)
+        assert err.value.status_code == 400
+
+
+def _context_item(name, context):
+    item = Mock()
+    item.name = name
+    item.context = Mock()
+    item.context.name = context
+    return item
+
+
+def _fleet_client(version="2.38"):
+    client = Mock()
+    client.get_rest_version.return_value = version
+    client._local_array_name = "fa1"
+    return client
+
+
+class TestFleetContexts:
+    """Tests for get_fleet_contexts and get_items_across_contexts."""
+
+    def test_fleet_members(self):
+        """Every fleet member is a context."""
+        client = _fleet_client()
+        members = [Mock(), Mock()]
+        members[0].member.name = "fa1"
+        members[1].member.name = "fa2"
+        client.get_fleets_members.return_value = Mock(status_code=200, items=members)
+        assert get_fleet_contexts(client) == ["fa1", "fa2"]
+
+    def test_not_in_fleet(self):
+        """Without a fleet only the local array is a context."""
+        client = _fleet_client()
+        client.get_fleets_members.return_value = Mock(status_code=200, items=[])
+        assert get_fleet_contexts(client) == ["fa1"]
+        assert get_fleet_contexts(_fleet_client("2.36")) == ["fa1"]
+
+    def test_batched_multi_context_call(self):
+        """All contexts are listed in one paged call and tagged per item."""
+        client = _fleet_client()
+        client.get_volumes.side_effect = [
+            Mock(
+                status_code=200,
+                items=[_context_item("v1", "fa1"), _context_item("v2", "fa2")],
+                continuation_token="next",
+            ),
+            Mock(
+                status_code=200,
+                items=[_context_item("v3", "fa2")],
+                continuation_token=None,
+            ),
+        ]
+        result = get_items_across_contexts(
+            client, "get_volumes", ["fa1", "fa2"], page_size=2, destroyed=False
+        )
+        assert [(context, item.name) for context, item in result] == [
+            ("fa1", "v1"),
+            ("fa2", "v2"),
+            ("fa2", "v3"),
+        ]
+        assert client.get_volumes.call_args_list[0][1] == {
+            "limit": 2,
+            "context_names": ["fa1", "fa2"],
+            "destroyed": False,
+        }
+        assert client.get_volumes.call_args[1]["continuation_token"] == "next"
+
+    def test_falls_back_to_concurrent_calls(self):
+        """Each context is listed separately when batching is rejected."""
+        client = _fleet_client()
+        item = Mock(spec=["name"])
+
+        def get_hosts(context_names, **kwargs):
+            if len(context_names) > 1:
+                return Mock(
+                    status_code=400,
+                    items=None,
+                    errors=[Mock(message="Multiple context_names are not supported")],
+                )
+            return Mock(status_code=200, items=[item], continuation_token=None)
+
+        client.get_hosts.side_effect = get_hosts
+        result = get_items_across_contexts(client, "get_hosts", ["fa1", "fa2"])
+        assert [context for context, dummy in result] == ["fa1", "fa2"]
+        assert client.get_hosts.call_count == 3
+
+    def test_other_errors_raised(self):
+        """Errors unrelated to multiple contexts are not turned into no items."""
+        client = _fleet_client()
+        client.get_hosts.return_value = Mock(
+            status_code=500,
+            items=None,
+            errors=[Mock(message="Internal error", context=None)],
+        )
+        with pytest.raises(FlashArrayAPIError, match="Internal error"):
+            get_items_across_contexts(client, "get_hosts", ["fa1", "fa2"])
+        assert client.get_hosts.call_count == 1
+
+    def test_failed_context_raised(self):
+        """A member that fails in the per-context fallback is reported."""
+        client = _fleet_client()
+
+        def get_hosts(context_names, **kwargs):
+            if len(context_names) > 1:
+                return Mock(
+                    status_code=400,
+                    items=None,
+                    errors=[Mock(message="Invalid context_names")],
+                )
+            if context_names == ["fa2"]:
+                return Mock(
+                    status_code=400, items=None, errors=[Mock(message="Unreachable")]
+                )
+            return Mock(status_code=200, items=[Mock()], continuation_token=None)
+
+        client.get_hosts.side_effect = get_hosts
+        with pytest.raises(FlashArrayAPIError, match="Unreachable"):
+            get_items_across_contexts(client, "get_hosts", ["fa1", "fa2"])
+
+    def test_single_context_tags_requested(self):
+        """Items without a context reference take the requested context."""
+        client = _fleet_client()
+        client.get_hosts.return_value = Mock(
+            status_code=200, items=[Mock(spec=["name"])], continuation_token=None
+        )
+        result = get_items_across_contexts(client, "get_hosts", ["fa2"])
+        assert [context for context, dummy in result] == ["fa2"]
+
+    def test_untagged_items_listed_per_context(self):
+        """Untagged items from a multi-context call are listed per context."""
+        client = _fleet_client()
+        untagged = Mock(spec=["name"])
+
+        def get_hosts(context_names, **kwargs):
+            return Mock(status_code=200, items=[untagged], continuation_token=None)
+
+        client.get_hosts.side_effect = get_hosts
+        result = get_items_across_contexts(client, "get_hosts", ["fa1", "fa2"])
+        assert [context for context, dummy in result] == ["fa1", "fa2"]
+        assert client.get_hosts.call_count == 3
+
+    def test_without_context_support(self):
+        """Below the context API version only the local array is listed."""
+        client = _fleet_client("2.36")
+        client.get_hosts.return_value = Mock(
+            status_code=200, items=[Mock()], continuation_token=None
+        )
+        result = get_items_across_contexts(client, "get_hosts", ["fa1", "fa2"])
+        assert [context for context, dummy in result] == ["fa1"]
+        assert "context_names" not in client.get_hosts.call_args[1]
+
+
+class TestTracingClient:
+    """Tests for TracingClient and enable_api_trace."""
+
+    def test_records_calls(self):
+        """Each call is recorded with status, item count and latency."""
+        client = Mock()
+        client.get_volumes.return_value = Mock(status_code=200, total_item_count=3)
+        client.patch_volumes.return_value = Mock(
+            status_code=400, total_item_count=None, items=[]
+        )
+        traced = TracingClient(client)
+        traced.get_volumes(names=["vol1"], destroyed=False)
+        traced.patch_volumes(names=["vol1"], volume={"password": "secret"})
+        report = traced.trace_report()
+        assert report["total_calls"] == 2
+        first, second = report["calls"]
+        assert first["method"] == "get_volumes"
+        assert first["status"] == 200
+        assert first["items"] == 3
+        assert "names=['vol1']" in first["args"]
+        assert second["status"] == 400
+        assert second["items"] == 0
+        assert "secret" not in second["args"]
+        assert "volume=<dict>" in second["args"]
+        assert report["by_method"]["get_volumes"]["calls"] == 1
+        assert len(report["slowest"]) == 2
+
+    def test_records_exceptions(self):
+        """Calls that raise are recorded without a status."""
+        client = Mock()
+        client.get_hosts.side_effect = ValueError("boom")
+        traced = TracingClient(client)
+        with pytest.raises(ValueError):
+            traced.get_hosts()
+        assert traced.trace_report()["calls"][0]["status"] is None
+
+    def test_passthrough_attributes(self):
+        """Non-callable attributes are passed through untraced."""
+        client = Mock()
+        client._local_array_name = "array1"
+        traced = TracingClient(client)
+        assert traced._local_array_name == "array1"
+        assert traced.trace_report()["total_calls"] == 0
+
+    def test_enable_api_trace_reports_on_exit(self):
+        """The trace is added to exit_json and fail_json results."""
+        module = Mock()
+        exit_json = module.exit_json
+        fail_json = module.fail_json
+        client = Mock()
+        client.get_arrays.return_value = Mock(status_code=200, total_item_count=1)
+        traced = enable_api_trace(module, client, "fa1")
+        traced.get_arrays()
+        module.exit_json(changed=False)
+        module.fail_json(msg="failed")
+        assert exit_json.call_args[1]["_purefa_api_trace"]["total_calls"] == 1
+        assert exit_json.call_args[1]["_purefa_api_trace"]["array"] == "fa1"
+        assert exit_json.call_args[1]["changed"] is False
+        assert fail_json.call_args[1]["msg"] == "failed"
+        assert "_purefa_api_trace" in fail_json.call_args[1]
+
+    def test_enable_api_trace_positional_fail_json(self):
+        """A positional fail_json message is passed through unchanged."""
+
+        class Module(object):
+            def exit_json(self, **kwargs):
+                raise SystemExit(kwargs)
+
+            def fail_json(self, msg, **kwargs):
+                raise SystemExit(msg, kwargs)
+
+        module = Module()
+        enable_api_trace(module, Mock(), "fa1")
+        with pytest.raises(SystemExit) as exc:
+            module.fail_json("Pure Storage FlashArray authentication failed")
+        msg, result = exc.value.args
+        assert msg == "Pure Storage FlashArray authentication failed"
+        assert result["_purefa_api_trace"]["array"] == "fa1"
+
+
+@patch("plugins.module_utils.api_helpers.time.sleep")
+class TestRetryingClient:
+    """Tests for RetryingClient."""
+
+    def test_retries_throttled_get(self, mock_sleep):
+        """Throttled reads are retried, honouring Retry-After."""
+        client = Mock()
+        ok = Mock(status_code=200)
+        client.get_volumes.side_effect = [
+            Mock(status_code=429, headers={"Retry-After": "2"}),
+            ok,
+        ]
+        retrying = RetryingClient(client, retries=3)
+        assert retrying.get_volumes(names=["vol1"]) is ok
+        mock_sleep.assert_called_once_with(2.0)
+        client.get_volumes.assert_called_with(names=["vol1"])
+        assert retrying.retry_stats() == {
+            "retries": 1,
+            "by_method": {"get_volumes": 1},
+        }
+
+    def test_retry_after_http_date(self, mock_sleep):
+        """A Retry-After date is converted to seconds and capped."""
+        client = Mock()
+        ok = Mock(status_code=200)
+        client.get_volumes.side_effect = [
+            Mock(
+                status_code=503,
+                headers={"Retry-After": "Fri, 31 Dec 9999 23:59:59 GMT"},
+            ),
+            Mock(
+                status_code=503,
+                headers={"Retry-After": "Wed, 21 Oct 2015 07:28:00 GMT"},
+            ),
+            ok,
+        ]
+        assert RetryingClient(client, retries=3).get_volumes() is ok
+        assert [call[0][0] for call in mock_sleep.call_args_list] == [30.0, 0]
+
+    def test_retries_connection_errors(self, mock_sleep):
+        """Connection resets are retried with capped backoff."""
+        client = Mock()
+        ok = Mock(status_code=200)
+        client.get_hosts.side_effect = [ConnectionResetError(), TimeoutError(), ok]
+        retrying = RetryingClient(client, retries=3)
+        assert retrying.get_hosts() is ok
+        assert mock_sleep.call_count == 2
+        assert all(0 <= call[0][0] <= 2 for call in mock_sleep.call_args_list)
+
+    def test_gives_up_after_retries(self, mock_sleep):
+        """The last response or error is returned once retries run out."""
+        client = Mock()
+        client.get_hosts.return_value = Mock(status_code=503, headers={})
+        assert RetryingClient(client, retries=2).get_hosts().status_code == 503
+        assert client.get_hosts.call_count == 3
+        client.get_pods.side_effect = ConnectionError()
+        with pytest.raises(ConnectionError):
+            RetryingClient(client, retries=1).get_pods()
+
+    def test_unsafe_writes_not_retried(self, mock_sleep):
+        """Writes are only retried when listed as safe."""
+        client = Mock()
+        client.post_volumes.return_value = Mock(status_code=429, headers={})
+        client.patch_dns.side_effect = [ConnectionError(), Mock(status_code=200)]
+        retrying = RetryingClient(client, retries=3)
+        assert retrying.post_volumes(names=["vol1"]).status_code == 429
+        assert client.post_volumes.call_count == 1
+        assert retrying.patch_dns().status_code == 200
+        assert client.patch_dns.call_count == 2
+
+    def test_enable_api_retry_reports_on_exit(self, mock_sleep):
+        """Retry counters are added to the module result after a retry."""
+        module = Mock()
+        exit_json = module.exit_json
+        client = Mock()
+        client.get_hosts.side_effect = [ConnectionError(), Mock(status_code=200)]
+        retrying = enable_api_retry(module, client, 3)
+        client._local_array_name = "array1"
+        assert retrying._local_array_name == "array1"
+        retrying.get_hosts()
+        module.exit_json(changed=False)
+        assert exit_json.call_args[1]["api_retry_stats"] == {
+            "retries": 1,
+            "by_method": {"get_hosts": 1},
+        }
+
+    def test_enable_api_retry_quiet_without_retries(self, mock_sleep):
+        """Nothing is added to the result when no call was retried."""
+        module = Mock()
+        exit_json = module.exit_json
+        enable_api_retry(module, Mock(), 3)
+        module.exit_json(changed=False)
+        exit_json.assert_called_once_with(changed=False)
+
+    def test_enable_api_retry_always_report(self, mock_sleep):
+        """Zero counters are added when reporting is requested."""
+        module = Mock()
+        exit_json = module.exit_json
+        enable_api_retry(module, Mock(), 3, always_report=True)
+        module.exit_json(changed=False)
+        assert exit_json.call_args[1]["api_retry_stats"] == {
+            "retries": 0,
+            "by_method": {},
+        }
+
+    def test_enable_api_retry_positional_fail_json(self, mock_sleep):
+        """A positional fail_json message is passed through unchanged."""
+
+        class Module(object):
+            def exit_json(self, **kwargs):
+                raise SystemExit(kwargs)
+
+            def fail_json(self, msg, **kwargs):
+                raise SystemExit(msg, kwargs)
+
+        module = Module()
+        enable_api_retry(module, Mock(), 3, always_report=True)
+        with pytest.raises(SystemExit) as exc:
+            module.fail_json("Failed to create volume")
+        msg, result = exc.value.args
+        assert msg == "Failed to create volume"
+        assert result["api_retry_stats"]["retries"] == 0
@@ -0,0 +1,156 @@
+# Copyright: (c) 2026, Pure Storage Ansible Team <pure-ansible-team@purestorage.com>
+# GNU General Public License v3.0+ (see COPYING.GPLv3 or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+"""Unit tests for httpapi module utilities."""
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import sys
+from unittest.mock import Mock, MagicMock, patch
+
+# Mock external dependencies before importing httpapi
+sys.modules["ansible"] = MagicMock()
+sys.modules["ansible.module_utils"] = MagicMock()
+sys.modules["ansible.module_utils.connection"] = MagicMock()
+
+from plugins.module_utils import httpapi
+from plugins.module_utils.httpapi import (
+    PersistentClient,
+    RestResponse,
+    get_persistent_client,
+)
+
+
+class TestRestResponse:
+    """Tests for RestResponse."""
+
+    def test_items_are_attribute_objects(self):
+        """Nested dicts become attribute objects like SDK models."""
+        res = RestResponse(
+            200,
+            {
+                "items": [{"name": "vol1", "space": {"total_physical": 10}}],
+                "total_item_count": 1,
+            },
+        )
+        assert res.status_code == 200
+        assert res.items[0].name == "vol1"
+        assert res.items[0].space.total_physical == 10
+        assert res.items[0].to_dict() == {
+            "name": "vol1",
+            "space": {"total_physical": 10},
+        }
+        assert res.total_item_count == 1
+        assert res.continuation_token is None
+
+    def test_errors(self):
+        """Error bodies expose errors with a message attribute."""
+        res = RestResponse(400, {"errors": [{"message": "bad request"}]})
+        assert res.items == []
+        assert res.errors[0].message == "bad request"
+
+
+class TestPersistentClient:
+    """Tests for PersistentClient."""
+
+    def test_get_encodes_params(self):
+        """List and bool parameters are encoded for the query string."""
+        connection = Mock()
+        connection.send_request.return_value = (200, {"items": []})
+        client = PersistentClient(connection)
+        client.get("volumes", names=["a", "b"], destroyed=False, filter=None)
+        connection.send_request.assert_called_once_with(
+            "volumes",
+            method="GET",
+            params={"names": "a,b", "destroyed": "false"},
+            body=None,
+        )
+
+    def test_patch_serializes_model(self):
+        """Bodies with to_dict are serialized."""
+        connection = Mock()
+        connection.send_request.return_value = (200, {})
+        body = Mock()
+        body.to_dict.return_value = {"banner": "hello"}
+        PersistentClient(connection).patch("arrays", body=body)
+        assert connection.send_request.call_args[1]["body"] == {"banner": "hello"}
+
+    def test_rest_version_cached(self):
+        """The API version is requested from the connection once."""
+        connection = Mock()
+        connection.get_api_version.return_value = "2.38"
+        client = PersistentClient(connection)
+        assert client.get_rest_version() == "2.38"
+        assert client.get_rest_version() == "2.38"
+        connection.get_api_version.assert_called_once_with()
+
+
+class TestSdkMethods:
+    """Tests for the py-pure-client methods of PersistentClient."""
+
+    def test_get_method(self):
+        """Supported get methods map to their REST path."""
+        connection = Mock()
+        connection.send_request.return_value = (
+            200,
+            {"items": [{"name": "fa1", "banner": "hi"}]},
+        )
+        res = PersistentClient(connection).get_arrays(context_names=["fa1"])
+        assert res.items[0].banner == "hi"
+        connection.send_request.assert_called_once_with(
+            "arrays", method="GET", params={"context_names": "fa1"}, body=None
+        )
+
+    def test_patch_method_body(self):
+        """The SDK body argument is sent as the request body."""
+        connection = Mock()
+        connection.send_request.return_value = (200, {})
+        body = Mock()
+        body.to_dict.return_value = {"banner": ""}
+        PersistentClient(connection).patch_arrays(array=body)
+        connection.send_request.assert_called_once_with(
+            "arrays", method="PATCH", params=None, body={"banner": ""}
+        )
+
+    def test_settings_methods(self):
+        """Settings endpoints map to their REST paths and body arguments."""
+        connection = Mock()
+        connection.send_request.return_value = (200, {})
+        client = PersistentClient(connection)
+        cases = [
+            ("patch_arrays_eula", "eula", "arrays/eula"),
+            ("patch_admins_settings", "admin_settings", "admins/settings"),
+            ("patch_smtp_servers", "smtp", "smtp-servers"),
+            ("patch_support", "support", "support"),
+        ]
+        for method, body_arg, path in cases:
+            connection.send_request.reset_mock()
+            getattr(client, method)(**{body_arg: {"enabled": True}})
+            connection.send_request.assert_called_once_with(
+                path, method="PATCH", params=None, body={"enabled": True}
+            )
+
+    def test_unsupported_method(self):
+        """Methods outside SDK_METHODS are not silently sent."""
+        client = PersistentClient(Mock())
+        assert not hasattr(client, "get_volumes")
+        assert not hasattr(client, "_cached_api_version")
+
+
+class TestGetPersistentClient:
+    """Tests for get_persistent_client."""
+
+    def test_no_socket(self):
+        """Modules without a persistent connection fall back."""
+        module = Mock(_socket_path=None)
+        assert get_persistent_client(module) is None
+
+    def test_socket(self):
+        """A socket path returns a client bound to the connection."""
+        module = Mock(_socket_path="/tmp/socket")
+        with patch.object(httpapi, "Connection") as connection:
+            client = get_persistent_client(module)
+        connection.assert_called_once_with("/tmp/socket")
+        assert isinstance(client, PersistentClient)
@@ -0,0 +1,186 @@
+# Copyright: (c) 2026, Pure Storage Ansible Team <pure-ansible-team@purestorage.com>
+# GNU General Public License v3.0+ (see COPYING.GPLv3 or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+"""Unit tests for purefa module utilities."""
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+from unittest.mock import MagicMock, Mock, patch
+
+import pytest
+
+from plugins.module_utils import purefa
+from plugins.module_utils.purefa import (
+    LazyModel,
+    get_array,
+    purefa_argument_spec,
+)
+
+
+class PureError(Exception):
+    """Stand-in for pypureclient.exceptions.PureError."""
+
+
+class FakeFlasharray(object):
+    """Stand-in for pypureclient.flasharray, which lazily imports its models.
+
+    Like the real package, a name it cannot import raises ImportError.
+    """
+
+    def __getattr__(self, name):
+        raise ImportError("cannot import name %r" % name)
+
+
+def _module(**params):
+    module = Mock()
+    module.params = {
+        "fa_url": "fa.example.com",
+        "api_token": "secret-token",
+        "disable_warnings": False,
+    }
+    module.params.update(params)
+    module.fail_json.side_effect = SystemExit
+    return module
+
+
+def _client(status_code=200):
+    client = Mock()
+    array_info = Mock()
+    array_info.name = "array1"
+    client.get_arrays.return_value = Mock(status_code=status_code, items=[array_info])
+    client.get_rest_version.return_value = "2.38"
+    return client
+
+
+class TestGetArray:
+    """Tests for get_array credential checks."""
+
+    @patch.object(purefa, "HAS_PYPURECLIENT", True)
+    def test_checks_credentials(self):
+        """Credentials are checked and the array name seeded on every call."""
+        client = _client()
+        with patch.object(purefa, "flasharray", MagicMock(), create=True) as fa:
+            fa.Client.return_value = client
+            assert get_array(_module()) is client
+            get_array(_module())
+        assert client.get_arrays.call_count == 2
+        assert client._local_array_name == "array1"
+
+    @patch.object(purefa, "HAS_PYPURECLIENT", True)
+    def test_failed_check(self):
+        """A failed credential check fails the module."""
+        module = _module()
+        with patch.object(purefa, "flasharray", MagicMock(), create=True) as fa:
+            fa.Client.return_value = _client(status_code=401)
+            with pytest.raises(SystemExit):
+                get_array(module)
+        assert "authentication failed" in module.fail_json.call_args[1]["msg"]
+
+    @patch.object(purefa, "HAS_PYPURECLIENT", True)
+    @patch.object(purefa, "PureError", PureError, create=True)
+    def test_rejected_token(self):
+        """A token rejected when the client logs in fails the module."""
+        module = _module()
+        with patch.object(purefa, "flasharray", MagicMock(), create=True) as fa:
+            fa.Client.side_effect = PureError("invalid token")
+            with pytest.raises(SystemExit):
+                get_array(module)
+        assert "authentication failed" in module.fail_json.call_args[1]["msg"]
+
+    @patch.object(purefa, "HAS_PYPURECLIENT", True)
+    @patch.object(purefa, "PureError", PureError, create=True)
+    def test_connection_error(self):
+        """An unreachable array is reported with its own error."""
+        module = _module()
+        with patch.object(purefa, "flasharray", MagicMock(), create=True) as fa:
+            fa.Client.side_effect = ConnectionError("Name or service not known")
+            with pytest.raises(SystemExit):
+                get_array(module)
+        msg = module.fail_json.call_args[1]["msg"]
+        assert "Name or service not known" in msg
+        assert "authentication failed" not in msg
+
+    @patch.object(purefa, "HAS_PYPURECLIENT", True)
+    @patch.object(purefa, "PureError", PureError, create=True)
+    def test_version_negotiation_error(self):
+        """A PureError that is not a rejected login keeps its own text."""
+        module = _module()
+        error = PureError(
+            "Failed to retrieve supported REST versions from target array "
+            "fa.example.com. status code: 503"
+        )
+        with patch.object(purefa, "flasharray", MagicMock(), create=True) as fa:
+            fa.Client.side_effect = error
+            with pytest.raises(SystemExit):
+                get_array(module)
+        msg = module.fail_json.call_args[1]["msg"]
+        assert "Failed to retrieve supported REST versions" in msg
+        assert "authentication failed" not in msg
+
+
+class TestLazyModel:
+    """Tests for LazyModel."""
+
+    def test_resolved_on_first_use(self):
+        """The SDK package is imported only when the model is used."""
+        sdk = MagicMock()
+        model = LazyModel("VolumePatch")
+        with patch.object(purefa.importlib, "import_module", return_value=sdk) as imp:
+            imp.assert_not_called()
+            model(destroyed=True)
+            model(destroyed=False)
+        imp.assert_called_once_with("pypureclient.flasharray")
+        sdk.VolumePatch.assert_called_with(destroyed=False)
+
+    def test_attribute_access(self):
+        """Class attributes are read from the resolved model."""
+        sdk = MagicMock()
+        sdk.Volume.name = "name-property"
+        with patch.object(purefa.importlib, "import_module", return_value=sdk):
+            assert LazyModel("Volume").name == "name-property"
+
+    def test_missing_model(self):
+        """A model missing from an old py-pure-client is reported as such."""
+        sdk = FakeFlasharray()
+        with patch.object(purefa.importlib, "import_module", return_value=sdk):
+            with patch.object(LazyModel, "module", None):
+                with pytest.raises(ImportError, match="py-pure-client is too old"):
+                    LazyModel("FleetPatch")(name="fleet1")
+
+    def test_missing_attribute(self):
+        """A package without the model attribute is reported the same way."""
+        sdk = Mock(spec=[])
+        with patch.object(purefa.importlib, "import_module", return_value=sdk):
+            with patch.object(LazyModel, "module", None):
+                with pytest.raises(ImportError, match="py-pure-client is too old"):
+                    LazyModel("FleetPatch")(name="fleet1")
+
+    def test_missing_model_fails_module(self):
+        """A missing model fails the module passed to get_array."""
+        sdk = FakeFlasharray()
+        module = _module()
+        with patch.object(purefa.importlib, "import_module", return_value=sdk):
+            with patch.object(LazyModel, "module", module):
+                with pytest.raises(SystemExit):
+                    LazyModel("FleetPatch")(name="fleet1")
+        assert "FleetPatch" in module.fail_json.call_args[1]["msg"]
+
+    @patch.object(purefa, "HAS_PYPURECLIENT", True)
+    def test_get_array_binds_module(self):
+        """get_array gives LazyModel the module to fail."""
+        module = _module()
+        with patch.object(LazyModel, "module", None):
+            with patch.object(purefa, "flasharray", MagicMock(), create=True) as fa:
+                fa.Client.return_value = _client()
+                get_array(module)
+            assert LazyModel.module is module
+
+
+class TestArgumentSpec:
+    """Tests for purefa_argument_spec."""
+
+    def test_api_retries_default(self):
+        """Retrying transient REST errors is opt-in."""
+        assert purefa_argument_spec()["api_retries"]["default"] == 0
@@ -32,6 +32,9 @@ sys.modules[
 sys.modules[
     "ansible_collections.purestorage.flasharray.plugins.module_utils.api_helpers"
 ] = MagicMock()
+sys.modules[
+    "ansible_collections.purestorage.flasharray.plugins.module_utils.httpapi"
+] = MagicMock(get_persistent_client=Mock(return_value=None))
 
 from plugins.modules.purefa_arrayname import main, update_name
 
@@ -32,6 +32,9 @@ sys.modules[
 sys.modules[
     "ansible_collections.purestorage.flasharray.plugins.module_utils.api_helpers"
 ] = MagicMock()
+sys.modules[
+    "ansible_collections.purestorage.flasharray.plugins.module_utils.httpapi"
+] = MagicMock()
 
 from plugins.modules.purefa_banner import main, set_banner, delete_banner
 
@@ -155,3 +158,51 @@ class TestMain:
         mock_module.fail_json.assert_called_once()
         call_args = mock_module.fail_json.call_args[1]
         assert "py-pure-client sdk is required" in call_args["msg"]
+
+    @patch("plugins.modules.purefa_banner.get_with_context")
+    @patch("plugins.modules.purefa_banner.get_array")
+    @patch("plugins.modules.purefa_banner.get_persistent_client")
+    @patch("plugins.modules.purefa_banner.AnsibleModule")
+    def test_main_uses_persistent_client(
+        self,
+        mock_ansible_module,
+        mock_get_persistent_client,
+        mock_get_array,
+        mock_get_with_context,
+    ):
+        """Test main sends requests through the httpapi session when present"""
+        mock_module = Mock()
+        mock_module.params = {"banner": "Welcome", "state": "present", "context": ""}
+        mock_ansible_module.return_value = mock_module
+        client = Mock()
+        mock_get_persistent_client.return_value = client
+        mock_get_with_context.return_value = Mock(items=[Mock(banner="Welcome")])
+
+        main()
+
+        mock_get_array.assert_not_called()
+        assert mock_get_with_context.call_args[0][:2] == (client, "get_arrays")
+        mock_module.exit_json.assert_called_once_with(changed=False)
+
+    @patch("plugins.modules.purefa_banner.get_with_context")
+    @patch("plugins.modules.purefa_banner.get_array")
+    @patch("plugins.modules.purefa_banner.get_persistent_client")
+    @patch("plugins.modules.purefa_banner.AnsibleModule")
+    def test_main_falls_back_to_get_array(
+        self,
+        mock_ansible_module,
+        mock_get_persistent_client,
+        mock_get_array,
+        mock_get_with_context,
+    ):
+        """Test main connects directly without a persistent connection"""
+        mock_module = Mock()
+        mock_module.params = {"banner": "Welcome", "state": "absent", "context": ""}
+        mock_ansible_module.return_value = mock_module
+        mock_get_persistent_client.return_value = None
+        mock_get_with_context.return_value = Mock(items=[Mock(banner="")])
+
+        main()
+
+        mock_get_array.assert_called_once_with(mock_module)
+        assert mock_get_with_context.call_args[0][0] is mock_get_array.return_value
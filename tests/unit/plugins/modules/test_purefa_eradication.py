@@ -51,6 +51,10 @@ sys.modules[
 ] = MagicMock()
 
 # Import after mocking
+sys.modules[
+    "ansible_collections.purestorage.flasharray.plugins.module_utils.httpapi"
+] = MagicMock(get_persistent_client=Mock(return_value=None))
+
 from plugins.modules.purefa_eradication import main
 
 
@@ -8,9 +8,12 @@ from __future__ import absolute_import, division, print_function
 __metaclass__ = type
 
 import sys
+import types
 from unittest.mock import Mock, patch, MagicMock
 from packaging.version import Version as LooseVersion
 
+import pytest
+
 # Mock external dependencies before importing module
 sys.modules["grp"] = MagicMock()
 sys.modules["pwd"] = MagicMock()
@@ -36,6 +39,22 @@ mock_version_module.LooseVersion = LooseVersion
 sys.modules[
     "ansible_collections.purestorage.flasharray.plugins.module_utils.version"
 ] = mock_version_module
+# Use the real api_helpers so the client wrappers behave as in production
+from plugins.module_utils import error_handlers
+
+sys.modules[
+    "ansible_collections.purestorage.flasharray.plugins.module_utils.error_handlers"
+] = error_handlers
+from plugins.module_utils import api_helpers
+
+sys.modules[
+    "ansible_collections.purestorage.flasharray.plugins.module_utils.api_helpers"
+] = api_helpers
+# The purefa_expand filter is used to check the columnar round trip
+errors_module = types.ModuleType("ansible.errors")
+errors_module.AnsibleFilterError = ValueError
+sys.modules.setdefault("ansible.errors", errors_module)
+from plugins.filter.purefa_expand import purefa_expand
 
 from plugins.modules.purefa_info import (
     main,
@@ -52,6 +71,11 @@ from plugins.modules.purefa_info import (
     generate_vol_dict,
     generate_host_dict,
     generate_del_pgroups_dict,
+    _project_fields,
+    _to_columnar,
+    FILTER_SUBSETS,
+    KEYED_SUBSETS,
+    _collect_remote_snaps,
     generate_pgroups_dict,
     generate_rl_dict,
     generate_del_pods_dict,
@@ -78,6 +102,9 @@ from plugins.modules.purefa_info import (
     generate_realms_dict,
     generate_config_dict,
     generate_filesystems_dict,
+    _get_connections_index,
+    _get_pgroup_transfers,
+    _run_collectors,
     generate_pgsnaps_dict,
     generate_dir_snaps_dict,
     generate_policies_dict,
@@ -169,10 +196,8 @@ class TestGeneratePerfDict:
 class TestGenerateAdminDict:
     """Test cases for generate_admin_dict function"""
 
-    @patch("plugins.modules.purefa_info.LooseVersion")
-    def test_generate_admin_dict_success(self, mock_loose_version):
+    def test_generate_admin_dict_success(self):
         """Test admin dict generation"""
-        mock_loose_version.side_effect = float
         mock_array = Mock()
         mock_array.get_rest_version.return_value = "2.38"
 
@@ -206,10 +231,8 @@ class TestGenerateAdminDict:
         assert result["pureuser"]["locked"] is False
         assert result["pureuser"]["role"] == "array_admin"
 
-    @patch("plugins.modules.purefa_info.LooseVersion")
-    def test_generate_admin_dict_remote_user(self, mock_loose_version):
+    def test_generate_admin_dict_remote_user(self):
         """Test admin dict generation for remote user"""
-        mock_loose_version.side_effect = float
         mock_array = Mock()
         mock_array.get_rest_version.return_value = "2.38"
 
@@ -425,15 +448,37 @@ class TestMain:
         call_args = mock_module.fail_json.call_args[1]
         assert "gather_subset" in call_args["msg"]
 
-    @patch("plugins.modules.purefa_info.LooseVersion")
+    @patch("plugins.modules.purefa_info.get_array")
+    @patch("plugins.modules.purefa_info.AnsibleModule")
+    def test_main_invalid_max_workers(self, mock_ansible_module, mock_get_array):
+        """Test main rejects a worker count below 1"""
+        for workers in (0, -2):
+            mock_module = Mock()
+            mock_module.params = {
+                "gather_subset": ["minimum"],
+                "parallel": True,
+                "max_workers": workers,
+            }
+            mock_module.fail_json.side_effect = SystemExit("fail_json called")
+            mock_ansible_module.return_value = mock_module
+
+            try:
+                main()
+            except SystemExit:
+                pass
+
+            assert "max_workers must be at least 1" in (
+                mock_module.fail_json.call_args[1]["msg"]
+            )
+        mock_get_array.assert_not_called()
+
     @patch("plugins.modules.purefa_info.generate_default_dict")
     @patch("plugins.modules.purefa_info.get_array")
     @patch("plugins.modules.purefa_info.AnsibleModule")
     def test_main_minimum_subset(
-        self, mock_ansible_module, mock_get_array, mock_gen_default, mock_loose_version
+        self, mock_ansible_module, mock_get_array, mock_gen_default
     ):
         """Test main with minimum subset"""
-        mock_loose_version.side_effect = float
         mock_module = Mock()
         mock_module.params = {
             "gather_subset": ["minimum"],
@@ -448,22 +493,46 @@ class TestMain:
 
         main()
 
-        mock_gen_default.assert_called_once_with(mock_array)
+        mock_gen_default.assert_called_once()
+        assert mock_gen_default.call_args[0][0]._client is mock_array
         mock_module.exit_json.assert_called_once()
         call_args = mock_module.exit_json.call_args[1]
         assert call_args["changed"] is False
         assert "purefa_info" in call_args
         assert "default" in call_args["purefa_info"]
 
-    @patch("plugins.modules.purefa_info.LooseVersion")
+    @patch("plugins.modules.purefa_info.generate_default_dict")
+    @patch("plugins.modules.purefa_info.get_array")
+    @patch("plugins.modules.purefa_info.AnsibleModule")
+    def test_main_failed_listing(
+        self, mock_ansible_module, mock_get_array, mock_gen_default
+    ):
+        """Test main fails when a paged listing returns an error"""
+        mock_module = Mock()
+        mock_module.params = {"gather_subset": ["minimum"]}
+        mock_module.fail_json.side_effect = SystemExit("fail_json called")
+        mock_ansible_module.return_value = mock_module
+        mock_get_array.return_value = Mock()
+        error = Mock(status_code=500, errors=[Mock(message="Internal error")])
+        mock_gen_default.side_effect = error_handlers.FlashArrayAPIError(
+            "get_volumes", error
+        )
+
+        with pytest.raises(SystemExit):
+            main()
+
+        mock_module.fail_json.assert_called_once_with(
+            msg="get_volumes failed: Internal error", status_code=500
+        )
+        mock_module.exit_json.assert_not_called()
+
     @patch("plugins.modules.purefa_info.generate_perf_dict")
     @patch("plugins.modules.purefa_info.get_array")
     @patch("plugins.modules.purefa_info.AnsibleModule")
     def test_main_performance_subset(
-        self, mock_ansible_module, mock_get_array, mock_gen_perf, mock_loose_version
+        self, mock_ansible_module, mock_get_array, mock_gen_perf
     ):
         """Test main with performance subset"""
-        mock_loose_version.side_effect = float
         mock_module = Mock()
         mock_module.params = {
             "gather_subset": ["performance"],
@@ -478,20 +547,19 @@ class TestMain:
 
         main()
 
-        mock_gen_perf.assert_called_once_with(mock_array)
+        mock_gen_perf.assert_called_once()
+        assert mock_gen_perf.call_args[0][0]._client is mock_array
         mock_module.exit_json.assert_called_once()
         call_args = mock_module.exit_json.call_args[1]
         assert "performance" in call_args["purefa_info"]
 
-    @patch("plugins.modules.purefa_info.LooseVersion")
     @patch("plugins.modules.purefa_info.generate_admin_dict")
     @patch("plugins.modules.purefa_info.get_array")
     @patch("plugins.modules.purefa_info.AnsibleModule")
     def test_main_admins_subset(
-        self, mock_ansible_module, mock_get_array, mock_gen_admin, mock_loose_version
+        self, mock_ansible_module, mock_get_array, mock_gen_admin
     ):
         """Test main with admins subset"""
-        mock_loose_version.side_effect = float
         mock_module = Mock()
         mock_module.params = {
             "gather_subset": ["admins"],
@@ -506,37 +574,113 @@ class TestMain:
 
         main()
 
-        mock_gen_admin.assert_called_once_with(mock_array)
+        mock_gen_admin.assert_called_once()
+        assert mock_gen_admin.call_args[0][0]._client is mock_array
         mock_module.exit_json.assert_called_once()
         call_args = mock_module.exit_json.call_args[1]
         assert "admins" in call_args["purefa_info"]
 
+    @patch("plugins.modules.purefa_info.generate_certs_dict")
+    @patch("plugins.modules.purefa_info.generate_admin_dict")
+    @patch("plugins.modules.purefa_info.generate_perf_dict")
+    @patch("plugins.modules.purefa_info.get_array")
+    @patch("plugins.modules.purefa_info.AnsibleModule")
+    def test_main_parallel_matches_serial(
+        self,
+        mock_ansible_module,
+        mock_get_array,
+        mock_gen_perf,
+        mock_gen_admin,
+        mock_gen_certs,
+    ):
+        """Test parallel collection returns the same info as serial"""
+        mock_array = Mock()
+        mock_array.get_rest_version.return_value = "2.38"
+        mock_get_array.return_value = mock_array
+        mock_gen_perf.return_value = {"reads_per_sec": 500}
+        mock_gen_admin.return_value = {"pureuser": {"type": "local"}}
+        mock_gen_certs.return_value = {"management": {"status": "self-signed"}}
+
+        outputs = []
+        for parallel in [False, True]:
+            mock_module = Mock()
+            mock_module.params = {
+                "gather_subset": ["certs", "performance", "admins"],
+                "parallel": parallel,
+                "max_workers": 2,
+            }
+            mock_ansible_module.return_value = mock_module
+            main()
+            outputs.append(mock_module.exit_json.call_args[1]["purefa_info"])
+
+        assert outputs[0] == outputs[1]
+        assert list(outputs[1]) == ["performance", "admins", "certs"]
+
+
+class TestRunCollectors:
+    """Test cases for _run_collectors function"""
+
+    def test_run_collectors_ordered(self):
+        """Test results keep collector order with and without workers"""
+        collectors = [
+            ("first", lambda value: value * 2, (1,)),
+            ("placeholder", None, ()),
+            ("second", lambda: "done", ()),
+        ]
+
+        for max_workers in [None, 3]:
+            result = _run_collectors(collectors, max_workers)
+
+            assert list(result) == ["first", "placeholder", "second"]
+            assert result == {"first": 2, "placeholder": None, "second": "done"}
+
 
 class TestGenerateDefaultDict:
     """Test cases for generate_default_dict function"""
 
-    @patch("plugins.modules.purefa_info.LooseVersion")
-    def test_generate_default_dict_success(self, mock_loose_version):
+    def test_generate_default_dict_success(self):
         """Test default dict generation with low API version to skip complex branches"""
         # Return low version to skip encryption and other complex branches
-        mock_loose_version.side_effect = lambda x: float(x) if x != "1.0" else 1.0
         mock_array = Mock()
         mock_array.get_rest_version.return_value = "2.0"
 
-        # Mock various array calls - these use getattr(..., "items", [])
-        mock_array.get_virtual_machines.return_value = Mock(items=[Mock(), Mock()])
-        mock_array.get_virtual_machine_snapshots.return_value = Mock(items=[Mock()])
-        mock_array.get_policies_snapshot.return_value = Mock(items=[Mock()])
-        mock_array.get_policies_nfs.return_value = Mock(items=[])
-        mock_array.get_policies_smb.return_value = Mock(items=[])
-        mock_array.get_file_systems.return_value = Mock(items=[])
-        mock_array.get_directories.return_value = Mock(items=[Mock()])
-        mock_array.get_directory_exports.return_value = Mock(items=[])
-        mock_array.get_directory_snapshots.return_value = Mock(items=[])
-        # These calls use list(array.get_*().items)
-        mock_array.get_volume_groups.return_value = Mock(items=[])
-        mock_array.get_array_connections.return_value = Mock(items=[])
-        mock_array.get_pods.return_value = Mock(items=[])
+        # Object counts only read total_item_count
+        mock_array.get_virtual_machines.return_value = Mock(
+            status_code=200, total_item_count=2
+        )
+        mock_array.get_virtual_machine_snapshots.return_value = Mock(
+            status_code=200, total_item_count=1
+        )
+        mock_array.get_policies_snapshot.return_value = Mock(
+            status_code=200, total_item_count=1
+        )
+        mock_array.get_policies_nfs.return_value = Mock(
+            status_code=200, total_item_count=0
+        )
+        mock_array.get_policies_smb.return_value = Mock(
+            status_code=200, total_item_count=0
+        )
+        # Arrays without file services fail to list file systems
+        mock_array.get_file_systems.return_value = Mock(
+            status_code=400, total_item_count=None
+        )
+        mock_array.get_directories.return_value = Mock(
+            status_code=200, total_item_count=1
+        )
+        mock_array.get_directory_exports.return_value = Mock(
+            status_code=200, total_item_count=0
+        )
+        mock_array.get_directory_snapshots.return_value = Mock(
+            status_code=200, total_item_count=0
+        )
+        # A failed count is reported as unknown rather than zero
+        mock_array.get_volume_groups.return_value = Mock(
+            status_code=400, total_item_count=None
+        )
+        mock_array.get_array_connections.return_value = Mock(
+            status_code=200, total_item_count=0
+        )
+        mock_array.get_pods.return_value = Mock(status_code=200, total_item_count=0)
         mock_array.get_array_connections_connection_key.return_value = Mock(
             items=[Mock(connection_key="ABC123")]
         )
@@ -546,12 +690,18 @@ class TestGenerateDefaultDict:
         mock_array_data = Mock(version="6.3.0")
         mock_array_data.name = "test-array"  # Set name separately
         mock_array.get_arrays.return_value = Mock(items=[mock_array_data])
-        mock_array.get_hosts.return_value = Mock(items=[])
-        mock_array.get_volume_snapshots.return_value = Mock(items=[])
-        mock_array.get_volumes.return_value = Mock(items=[])
-        mock_array.get_protection_groups.return_value = Mock(items=[])
-        mock_array.get_host_groups.return_value = Mock(items=[])
-        mock_array.get_admins.return_value = Mock(items=[])
+        mock_array.get_hosts.return_value = Mock(status_code=200, total_item_count=0)
+        mock_array.get_volume_snapshots.return_value = Mock(
+            status_code=200, total_item_count=200000
+        )
+        mock_array.get_volumes.return_value = Mock(status_code=200, total_item_count=0)
+        mock_array.get_protection_groups.return_value = Mock(
+            status_code=200, total_item_count=0
+        )
+        mock_array.get_host_groups.return_value = Mock(
+            status_code=200, total_item_count=0
+        )
+        mock_array.get_admins.return_value = Mock(status_code=200, total_item_count=0)
         mock_array.get_support.return_value = Mock(
             items=[Mock(remote_assist_status="enabled")]
         )
@@ -564,7 +714,14 @@ class TestGenerateDefaultDict:
         assert result["api_versions"] == "2.0"
         assert result["snapshot_policies"] == 1
         assert result["directories"] == 1
+        assert result["filesystems"] == 0
+        assert result["volume_groups"] is None
+        assert result["nfs_policies"] == 0
+        assert result["snapshots"] == 200000
         assert result["array_name"] == "test-array"
+        mock_array.get_volume_snapshots.assert_called_once_with(
+            limit=1, total_item_count=True
+        )
 
 
 class TestGenerateCapacityDict:
@@ -611,6 +768,413 @@ class TestGenerateCapacityDict:
         assert result["data_reduction"] == 2.5
 
 
+class TestProjectFields:
+    """Test cases for _project_fields function"""
+
+    def test_objects_projected_per_object(self):
+        """Subsets keyed by object name keep the fields of each object"""
+        info = {"vol1": {"serial": "A", "size": 1}, "vol2": {"serial": "B"}}
+        assert _project_fields(info, ["size"], True) == {
+            "vol1": {"size": 1},
+            "vol2": {},
+        }
+
+    def test_keyed_subset_with_scalar_entry(self):
+        """Entries of a keyed subset that are not objects are kept"""
+        info = {"vol1": {"serial": "A", "size": 1}, "note": "partial"}
+        assert _project_fields(info, ["size"], True) == {
+            "vol1": {"size": 1},
+            "note": "partial",
+        }
+
+    def test_flat_subset_projected_at_top_level(self):
+        """Other subsets keep the listed top level keys"""
+        info = {"array_name": "fa1", "purity_version": "6.5.0", "hosts": 2}
+        assert _project_fields(info, ["array_name", "missing"], False) == {
+            "array_name": "fa1"
+        }
+
+    def test_flat_subset_of_objects(self):
+        """Subsets not keyed by object name are projected at the top level"""
+        info = {"smtp_servers": {"host": "mail"}, "ntp_servers": {"a": 1}}
+        assert _project_fields(info, ["smtp_servers"], False) == {
+            "smtp_servers": {"host": "mail"}
+        }
+
+    def test_keyed_subsets(self):
+        """Every filterable subset is keyed by object name"""
+        assert set(FILTER_SUBSETS) <= set(KEYED_SUBSETS)
+        assert "capacity" not in KEYED_SUBSETS
+
+
+class TestToColumnar:
+    """Test cases for _to_columnar function"""
+
+    def test_objects_become_rows(self):
+        """Objects become rows under a shared header, name first"""
+        info = {"vol1": {"serial": "A", "size": 1}, "vol2": {"size": 2, "pod": "p"}}
+        assert _to_columnar(info, True) == {
+            "columns": ["name", "serial", "size", "pod"],
+            "rows": [["vol1", "A", 1, None], ["vol2", None, 2, "p"]],
+            "absent": [[0, 3], [1, 1]],
+        }
+
+    def test_no_absent_when_rows_complete(self):
+        """Absent keys are only listed when an object lacks a key"""
+        info = {"vol1": {"size": 1}, "vol2": {"size": None}}
+        assert _to_columnar(info, True) == {
+            "columns": ["name", "size"],
+            "rows": [["vol1", 1], ["vol2", None]],
+        }
+
+    def test_round_trip(self):
+        """Expanding the columnar form restores heterogeneous objects exactly"""
+        info = {
+            "vol1": {"serial": "A", "size": 1},
+            "vol2": {"size": None, "pod": "p"},
+            "vol3": {},
+            "vol4": {"serial": None, "pod": None, "tags": ["t1"]},
+        }
+        assert purefa_expand(_to_columnar(info, True)) == info
+
+    def test_round_trip_per_array(self):
+        """Results keyed by array name are expanded array by array"""
+        info = {
+            "fa1": {"volumes": {"vol1": {"size": 1}, "vol2": {"pod": "p"}}},
+            "fa2": {"volumes": {"vol3": {"size": 3}}, "capacity": {"free": 10}},
+        }
+        columnar = dict(
+            (
+                array_name,
+                dict(
+                    (key, _to_columnar(value, key in KEYED_SUBSETS))
+                    for key, value in array_info.items()
+                ),
+            )
+            for array_name, array_info in info.items()
+        )
+        assert purefa_expand(columnar) == info
+
+    def test_other_subsets_unchanged(self):
+        """Subsets not keyed by object name are returned as they are"""
+        assert _to_columnar({"array_name": "fa1"}, False) == {"array_name": "fa1"}
+        nested = {"eradication_config": {"manual_eradication": "enabled"}}
+        assert _to_columnar(nested, False) == nested
+
+    def test_empty_keyed_subset(self):
+        """An empty keyed subset still has columns and rows"""
+        columnar = _to_columnar({}, True)
+        assert columnar == {"columns": ["name"], "rows": []}
+        assert purefa_expand(columnar) == {}
+
+
+class TestMainFilters:
+    """Test cases for the filters and fields options of main"""
+
+    @patch("plugins.modules.purefa_info.get_array")
+    @patch("plugins.modules.purefa_info.AnsibleModule")
+    def test_unsupported_filter_subset(self, mock_ansible_module, mock_get_array):
+        """Filters can only be set for subsets that support them"""
+        mock_module = Mock()
+        mock_module.params = {
+            "gather_subset": ["capacity"],
+            "filters": {"capacity": "name='x'"},
+        }
+        mock_module.fail_json.side_effect = SystemExit("fail_json called")
+        mock_ansible_module.return_value = mock_module
+
+        try:
+            main()
+        except SystemExit:
+            pass
+
+        assert "filters can only be set" in mock_module.fail_json.call_args[1]["msg"]
+        mock_get_array.assert_not_called()
+
+    @patch("plugins.modules.purefa_info.generate_capacity_dict")
+    @patch("plugins.modules.purefa_info.get_array")
+    @patch("plugins.modules.purefa_info.AnsibleModule")
+    def test_fields_projected(
+        self, mock_ansible_module, mock_get_array, mock_gen_capacity
+    ):
+        """Only the requested fields of a subset are returned"""
+        mock_module = Mock()
+        mock_module.params = {
+            "gather_subset": ["capacity"],
+            "fields": {"capacity": "free_space"},
+        }
+        mock_ansible_module.return_value = mock_module
+        mock_get_array.return_value = Mock(**{"get_rest_version.return_value": "2.38"})
+        mock_gen_capacity.return_value = {"free_space": 10, "total_capacity": 20}
+
+        main()
+
+        assert mock_module.exit_json.call_args[1]["purefa_info"] == {
+            "capacity": {"free_space": 10}
+        }
+
+    @patch("plugins.modules.purefa_info.generate_del_pgroups_dict")
+    @patch("plugins.modules.purefa_info.generate_pgroups_dict")
+    @patch("plugins.modules.purefa_info.get_array")
+    @patch("plugins.modules.purefa_info.AnsibleModule")
+    def test_fields_skip_secondary_lookups(
+        self, mock_ansible_module, mock_get_array, mock_gen_pgroups, mock_gen_del
+    ):
+        """Members and transfers are only listed for requested keys"""
+        mock_module = Mock()
+        mock_module.params = {
+            "gather_subset": ["pgroups", "hosts"],
+            "fields": {
+                "pgroups": ["hosts"],
+                "deleted_pgroups": ["targets"],
+                "hosts": ["wwn"],
+            },
+        }
+        mock_ansible_module.return_value = mock_module
+        mock_array = Mock(**{"get_rest_version.return_value": "2.38"})
+        mock_array.get_hosts.return_value = Mock(items=[])
+        mock_array.get_protection_groups_hosts.return_value = Mock(items=[])
+        mock_array.get_protection_groups_targets.return_value = Mock(items=[])
+        mock_get_array.return_value = mock_array
+        mock_gen_pgroups.return_value = {}
+        mock_gen_del.return_value = {}
+
+        main()
+
+        mock_array.get_protection_groups_hosts.assert_called_once_with()
+        mock_array.get_protection_groups_targets.assert_called_once_with()
+        mock_array.get_protection_groups_volumes.assert_not_called()
+        mock_array.get_protection_groups_host_groups.assert_not_called()
+        mock_array.get_protection_group_snapshots_transfer.assert_not_called()
+        mock_array.get_connections.assert_not_called()
+        assert mock_gen_pgroups.call_args[0][3] == ["hosts"]
+
+
+class TestMainArrays:
+    """Test cases for collecting several arrays with the arrays option"""
+
+    @staticmethod
+    def _module(**params):
+        mock_module = Mock()
+        mock_module.params = {
+            "gather_subset": ["minimum"],
+            "arrays": [
+                {"fa_url": "fa1.example.com", "api_token": "t1"},
+                {"fa_url": "fa2.example.com", "api_token": "t2"},
+                {"fa_url": "fa3.example.com", "api_token": "t3"},
+            ],
+            "array_workers": 2,
+            "api_retries": 0,
+        }
+        mock_module.params.update(params)
+        mock_module.fail_json.side_effect = SystemExit("fail_json called")
+        return mock_module
+
+    @staticmethod
+    def _client(name):
+        client = Mock()
+        client._local_array_name = name
+        client.get_rest_version.return_value = "2.38"
+        return client
+
+    @patch("plugins.modules.purefa_info.generate_default_dict")
+    @patch("plugins.modules.purefa_info.connect_array")
+    @patch("plugins.modules.purefa_info.get_array")
+    @patch("plugins.modules.purefa_info.AnsibleModule")
+    def test_failures_isolated_per_array(
+        self, mock_ansible_module, mock_get_array, mock_connect, mock_gen_default
+    ):
+        """Each array is keyed by name and failures do not affect the others"""
+        mock_module = self._module()
+        mock_ansible_module.return_value = mock_module
+
+        def connect(module, fa_url, api_token):
+            if fa_url == "fa2.example.com":
+                return None
+            if fa_url == "fa3.example.com":
+                raise ConnectionError("connection refused")
+            return self._client("array1")
+
+        mock_connect.side_effect = connect
+        mock_gen_default.return_value = {"api_versions": "2.38"}
+
+        main()
+
+        mock_get_array.assert_not_called()
+        call_args = mock_module.exit_json.call_args[1]
+        assert call_args["purefa_info"] == {
+            "array1": {"default": {"api_versions": "2.38"}}
+        }
+        assert "Authentication failed" in call_args["failed_arrays"]["fa2.example.com"]
+        assert call_args["failed_arrays"]["fa3.example.com"] == "connection refused"
+
+    @patch("plugins.modules.purefa_info.connect_array")
+    @patch("plugins.modules.purefa_info.AnsibleModule")
+    def test_all_arrays_failed(self, mock_ansible_module, mock_connect):
+        """The module fails when no array could be collected"""
+        mock_module = self._module()
+        mock_ansible_module.return_value = mock_module
+        mock_connect.return_value = None
+
+        try:
+            main()
+        except SystemExit:
+            pass
+
+        call_args = mock_module.fail_json.call_args[1]
+        assert len(call_args["failed_arrays"]) == 3
+        mock_module.exit_json.assert_not_called()
+
+    @patch("plugins.modules.purefa_info.generate_default_dict")
+    @patch("plugins.modules.purefa_info.connect_array")
+    @patch("plugins.modules.purefa_info.AnsibleModule")
+    def test_duplicate_array_name(
+        self, mock_ansible_module, mock_connect, mock_gen_default
+    ):
+        """An array reporting an already collected name does not replace it"""
+        mock_module = self._module()
+        mock_ansible_module.return_value = mock_module
+
+        def connect(module, fa_url, api_token):
+            client = self._client("array2" if fa_url == "fa2.example.com" else "array1")
+            client._target = fa_url
+            return client
+
+        mock_connect.side_effect = connect
+        mock_gen_default.side_effect = lambda array: {"url": array._client._target}
+
+        main()
+
+        call_args = mock_module.exit_json.call_args[1]
+        assert call_args["purefa_info"] == {
+            "array1": {"default": {"url": "fa1.example.com"}},
+            "array2": {"default": {"url": "fa2.example.com"}},
+        }
+        assert call_args["failed_arrays"] == {
+            "fa3.example.com": "Array name array1 is already used by fa1.example.com"
+        }
+
+    @patch("plugins.modules.purefa_info.generate_default_dict")
+    @patch("plugins.modules.purefa_info.connect_array")
+    @patch("plugins.modules.purefa_info.AnsibleModule")
+    def test_retry_stats_per_array(
+        self, mock_ansible_module, mock_connect, mock_gen_default
+    ):
+        """Retries are reported per array for the arrays that retried"""
+        mock_module = self._module(api_retries=2)
+        mock_module.params["arrays"] = mock_module.params["arrays"][:2]
+        mock_ansible_module.return_value = mock_module
+        mock_connect.side_effect = lambda module, fa_url, api_token: self._client(
+            "array1" if fa_url == "fa1.example.com" else "array2"
+        )
+        throttled = Mock(status_code=429, headers={"Retry-After": "0"})
+
+        def gen_default(array):
+            if array._client._client._local_array_name == "array1":
+                array._client._client.get_arrays.side_effect = [
+                    throttled,
+                    Mock(status_code=200, items=[]),
+                ]
+                array.get_arrays()
+            return {}
+
+        mock_gen_default.side_effect = gen_default
+
+        main()
+
+        call_args = mock_module.exit_json.call_args[1]
+        assert call_args["api_retry_stats"] == {
+            "array1": {"retries": 1, "by_method": {"get_arrays": 1}}
+        }
+
+    @patch("plugins.modules.purefa_info.generate_default_dict")
+    @patch("plugins.modules.purefa_info.connect_array")
+    @patch("plugins.modules.purefa_info.AnsibleModule")
+    def test_no_retry_stats_without_retries(
+        self, mock_ansible_module, mock_connect, mock_gen_default
+    ):
+        """Nothing is reported when no call was retried"""
+        mock_module = self._module(api_retries=2)
+        mock_ansible_module.return_value = mock_module
+        mock_connect.side_effect = lambda module, fa_url, api_token: self._client(
+            fa_url
+        )
+        mock_gen_default.return_value = {}
+
+        main()
+
+        assert "api_retry_stats" not in mock_module.exit_json.call_args[1]
+
+    @patch("plugins.modules.purefa_info.generate_default_dict")
+    @patch("plugins.modules.purefa_info.connect_array")
+    @patch("plugins.modules.purefa_info.AnsibleModule")
+    def test_trace_per_array(self, mock_ansible_module, mock_connect, mock_gen_default):
+        """With debug_timing each array is traced, including failed ones"""
+        mock_module = self._module(debug_timing=True)
+        mock_ansible_module.return_value = mock_module
+
+        def connect(module, fa_url, api_token):
+            client = self._client(fa_url.split(".")[0])
+            client.get_arrays.return_value = Mock(status_code=200, items=[])
+            if fa_url == "fa3.example.com":
+                client.get_arrays.side_effect = ConnectionError("connection reset")
+            return client
+
+        def gen_default(array):
+            array.get_arrays()
+            return {}
+
+        mock_connect.side_effect = connect
+        mock_gen_default.side_effect = gen_default
+
+        main()
+
+        call_args = mock_module.exit_json.call_args[1]
+        traces = call_args["_purefa_api_trace"]
+        assert [trace["array"] for trace in traces] == [
+            "fa1.example.com",
+            "fa2.example.com",
+            "fa3.example.com",
+        ]
+        assert traces[0]["by_method"]["get_arrays"]["calls"] == 1
+        assert "fa3.example.com" in call_args["failed_arrays"]
+
+    @patch("plugins.modules.purefa_info.generate_default_dict")
+    @patch("plugins.modules.purefa_info.connect_array")
+    @patch("plugins.modules.purefa_info.AnsibleModule")
+    def test_arrays_exclusive_with_fa_url(
+        self, mock_ansible_module, mock_connect, mock_gen_default
+    ):
+        """arrays cannot be combined with fa_url or api_token"""
+        mock_ansible_module.return_value = self._module()
+        mock_connect.side_effect = lambda module, fa_url, api_token: self._client(
+            fa_url
+        )
+        mock_gen_default.return_value = {}
+
+        main()
+
+        assert mock_ansible_module.call_args[1]["mutually_exclusive"] == [
+            ["arrays", "fa_url"],
+            ["arrays", "api_token"],
+        ]
+
+    @patch("plugins.modules.purefa_info.connect_array")
+    @patch("plugins.modules.purefa_info.AnsibleModule")
+    def test_invalid_array_workers(self, mock_ansible_module, mock_connect):
+        """array_workers below 1 is rejected before connecting"""
+        mock_module = self._module(array_workers=0)
+        mock_ansible_module.return_value = mock_module
+
+        with pytest.raises(SystemExit):
+            main()
+
+        assert mock_module.fail_json.call_args[1]["msg"] == (
+            "array_workers must be at least 1, got: 0"
+        )
+        mock_connect.assert_not_called()
+
+
 class TestGenerateSnapDict:
     """Test cases for generate_snap_dict function"""
 
@@ -634,7 +1198,9 @@ class TestGenerateSnapDict:
         mock_snap.created = 1609459200000
         mock_snap.space = mock_space
 
-        mock_array.get_volume_snapshots.return_value = Mock(items=[mock_snap])
+        mock_array.get_volume_snapshots.return_value = Mock(
+            status_code=200, items=[mock_snap]
+        )
         mock_array.get_offloads.return_value = Mock(items=[])
         mock_array.get_volume_snapshots_tags.return_value = Mock(items=[])
 
@@ -644,6 +1210,151 @@ class TestGenerateSnapDict:
         assert result["vol1.snap1"]["is_local"] is True
 
 
+class TestCollectRemoteSnaps:
+    """Test cases for _collect_remote_snaps function"""
+
+    @staticmethod
+    def _remote_snap(name, source):
+        snap = Mock(suffix="snap1", provisioned=1024, created=1609459200000)
+        snap.name = name
+        snap.source = Mock()
+        snap.source.name = source
+        return snap
+
+    @staticmethod
+    def _transfer(name):
+        transfer = Mock(
+            data_transferred=512,
+            completed=1609459300000,
+            physical_bytes_written=256,
+            progress=1.0,
+        )
+        transfer.name = name
+        return transfer
+
+    def test_transfers_fetched_in_bulk_per_offload(self):
+        """Transfer stats are listed once per offload target and joined by name"""
+        mock_array = Mock()
+        offloads = []
+        for name in ("s3", "nfs"):
+            offload = Mock()
+            offload.name = name
+            offloads.append(offload)
+        mock_array.get_offloads.return_value = Mock(items=offloads)
+        snaps = {
+            "s3": [
+                self._remote_snap("fa1:vol1.snap1", "vol1"),
+                self._remote_snap("fa1:vol2.snap1", "vol2"),
+            ],
+            "nfs": [self._remote_snap("fa1:vol1.snap1", "vol1")],
+        }
+        mock_array.get_remote_volume_snapshots.side_effect = lambda on, **kwargs: Mock(
+            status_code=200, items=snaps[on], continuation_token=None
+        )
+        mock_array.get_remote_volume_snapshots_transfer.side_effect = (
+            lambda on, **kwargs: Mock(
+                status_code=200,
+                items=[self._transfer("fa1:vol1.snap1")],
+                continuation_token=None,
+            )
+        )
+
+        result = _collect_remote_snaps(mock_array, False)
+
+        assert [name for name, dummy in result] == [
+            "vol1.snap1",
+            "vol2.snap1",
+            "vol1.snap1",
+        ]
+        assert result[0][1]["data_transferred"] == 512
+        assert result[0][1]["completed"] == "2021-01-01 00:01:40 UTC"
+        assert result[1][1]["progress"] is None
+        assert mock_array.get_remote_volume_snapshots_transfer.call_count == 2
+        assert (
+            mock_array.get_remote_volume_snapshots_transfer.call_args[1]["destroyed"]
+            is False
+        )
+
+    def test_unreachable_offload_skipped(self):
+        """An offload target that cannot be listed contributes nothing"""
+        mock_array = Mock()
+        offload = Mock()
+        offload.name = "s3"
+        mock_array.get_offloads.return_value = Mock(items=[offload])
+        mock_array.get_remote_volume_snapshots.return_value = Mock(
+            status_code=400, items=None, errors=[Mock(message="Unreachable")]
+        )
+
+        assert _collect_remote_snaps(mock_array, True) == []
+        mock_array.get_remote_volume_snapshots_transfer.assert_not_called()
+
+    def test_remote_snaps_listed_in_one_call_before_paging(self):
+        """Arrays that cannot page remote snapshots are asked for them all"""
+        mock_array = Mock()
+        mock_array.get_rest_version.return_value = "2.37"
+        offload = Mock()
+        offload.name = "s3"
+        mock_array.get_offloads.return_value = Mock(items=[offload])
+        snaps = [
+            self._remote_snap("fa1:vol1.snap{0}".format(index), "vol1")
+            for index in range(1500)
+        ]
+        mock_array.get_remote_volume_snapshots.return_value = Mock(
+            status_code=200, items=snaps, continuation_token=None
+        )
+        mock_array.get_remote_volume_snapshots_transfer.return_value = Mock(
+            status_code=200, items=[], continuation_token=None
+        )
+
+        result = _collect_remote_snaps(mock_array, False)
+
+        assert len(result) == 1500
+        mock_array.get_remote_volume_snapshots.assert_called_once_with(
+            on="s3", destroyed=False
+        )
+        mock_array.get_remote_volume_snapshots_transfer.assert_called_once_with(
+            on="s3", destroyed=False
+        )
+
+    def test_remote_snaps_paged_from_paging_version(self):
+        """Arrays that return a continuation token are paged through"""
+        mock_array = Mock()
+        mock_array.get_rest_version.return_value = "2.38"
+        offload = Mock()
+        offload.name = "s3"
+        mock_array.get_offloads.return_value = Mock(items=[offload])
+        mock_array.get_remote_volume_snapshots.return_value = Mock(
+            status_code=200,
+            items=[self._remote_snap("fa1:vol1.snap1", "vol1")],
+            continuation_token=None,
+        )
+        mock_array.get_remote_volume_snapshots_transfer.return_value = Mock(
+            status_code=200, items=[], continuation_token=None
+        )
+
+        _collect_remote_snaps(mock_array, False)
+
+        assert mock_array.get_remote_volume_snapshots.call_args[1]["limit"] == 1000
+
+    def test_failed_transfer_listing_skips_offload(self):
+        """An offload target whose transfers cannot be listed is skipped"""
+        mock_array = Mock()
+        mock_array.get_rest_version.return_value = "2.38"
+        offload = Mock()
+        offload.name = "s3"
+        mock_array.get_offloads.return_value = Mock(items=[offload])
+        mock_array.get_remote_volume_snapshots.return_value = Mock(
+            status_code=200,
+            items=[self._remote_snap("fa1:vol1.snap1", "vol1")],
+            continuation_token=None,
+        )
+        mock_array.get_remote_volume_snapshots_transfer.return_value = Mock(
+            status_code=400, items=None, errors=[Mock(message="Unreachable")]
+        )
+
+        assert _collect_remote_snaps(mock_array, False) == []
+
+
 class TestGenerateDelSnapDict:
     """Test cases for generate_del_snap_dict function"""
 
@@ -666,7 +1377,9 @@ class TestGenerateDelSnapDict:
         mock_snap.time_remaining = 86400000
         mock_snap.space = mock_space
 
-        mock_array.get_volume_snapshots.return_value = Mock(items=[mock_snap])
+        mock_array.get_volume_snapshots.return_value = Mock(
+            status_code=200, items=[mock_snap]
+        )
         mock_array.get_offloads.return_value = Mock(items=[])
         mock_array.get_volume_snapshots_tags.return_value = Mock(items=[])
 
@@ -719,7 +1432,7 @@ class TestGenerateDelVolDict:
         mock_vol.priority = 50
         mock_vol.priority_adjustment = mock_priority
 
-        mock_array.get_volumes.return_value = Mock(items=[mock_vol])
+        mock_array.get_volumes.return_value = Mock(status_code=200, items=[mock_vol])
         mock_array.get_volumes_tags.return_value = Mock(items=[])
 
         result = generate_del_vol_dict(mock_array)
@@ -771,7 +1484,7 @@ class TestGenerateVolDict:
         mock_vol.priority_adjustment = mock_priority
         mock_vol.protocol_endpoint = None
 
-        mock_array.get_volumes.return_value = Mock(items=[mock_vol])
+        mock_array.get_volumes.return_value = Mock(status_code=200, items=[mock_vol])
         mock_array.get_connections.return_value = Mock(items=[])
         mock_array.get_volumes_tags.return_value = Mock(items=[])
 
@@ -781,6 +1494,67 @@ class TestGenerateVolDict:
         assert result["test_vol"]["serial"] == "ABCD1234567890EF"
         assert result["test_vol"]["size"] == 10737418240
 
+    def test_generate_vol_dict_filter_and_fields(self):
+        """Test the filter is sent to the array and unneeded calls are skipped"""
+        mock_array = Mock()
+        mock_array.get_rest_version.return_value = "2.38"
+        mock_vol = Mock()
+        mock_vol.name = "db1"
+        mock_vol.created = 1609459200000
+        mock_vol.serial = "ABCD1234567890EF"
+        mock_vol.priority_adjustment.priority_adjustment_operator = "+"
+        mock_vol.priority_adjustment.priority_adjustment_value = 10
+        mock_array.get_volumes.return_value = Mock(
+            status_code=200, items=[mock_vol], continuation_token=None
+        )
+        mock_array.get_connections.return_value = Mock(items=[])
+
+        result = generate_vol_dict(
+            mock_array,
+            performance=True,
+            query_filter="name='db*'",
+            fields=["serial"],
+        )
+
+        assert "db1" in result
+        assert mock_array.get_volumes.call_args[1]["filter"] == "name='db*'"
+        mock_array.get_connections.assert_not_called()
+        mock_array.get_volumes_tags.assert_not_called()
+        mock_array.get_volumes_performance.assert_not_called()
+
+    def test_generate_vol_dict_single_connections_sweep(self):
+        """Test connections are fetched once regardless of volume count"""
+        mock_array = Mock()
+        mock_array.get_rest_version.return_value = "2.38"
+
+        mock_vols = []
+        mock_connections = []
+        for index in range(50):
+            mock_vol = Mock()
+            mock_vol.name = "vol" + str(index)
+            mock_vol.subtype = "regular"
+            mock_vol.created = 1609459200000
+            mock_vol.serial = "ABCD1234567890EF"
+            mock_vol.priority_adjustment = Mock(
+                priority_adjustment_operator="+", priority_adjustment_value=0
+            )
+            mock_vols.append(mock_vol)
+            mock_connection = Mock(lun=index, host_group=None)
+            mock_connection.volume.name = mock_vol.name
+            mock_connection.host.name = "host" + str(index % 2)
+            mock_connections.append(mock_connection)
+
+        mock_array.get_volumes.return_value = Mock(status_code=200, items=mock_vols)
+        mock_array.get_connections.return_value = Mock(items=mock_connections)
+        mock_array.get_volumes_tags.return_value = Mock(items=[])
+
+        result = generate_vol_dict(mock_array, performance=False)
+
+        mock_array.get_connections.assert_called_once_with()
+        assert len(result) == 50
+        assert result["vol7"]["hosts"] == [{"host": "host1", "lun": 7}]
+        assert result["vol7"]["host_groups"] == []
+
 
 class TestGenerateHostDict:
     """Test cases for generate_host_dict function"""
@@ -869,6 +1643,77 @@ class TestGeneratePgroupsDict:
         assert "pg1" in result
         assert result["pg1"]["snap_enabled"] is True
 
+    def test_generate_pgroups_dict_batched_members(self):
+        """Test pgroup members are listed once and grouped by pgroup"""
+        mock_array = Mock()
+        mock_array.get_rest_version.return_value = "2.38"
+
+        mock_pgroups = []
+        mock_pg_vols = []
+        for index in range(3):
+            mock_pgroup = Mock()
+            mock_pgroup.name = "pg" + str(index)
+            mock_pgroup.retention_lock = "unlocked"
+            mock_pgroup.eradication_config = Mock(manual_eradication="enabled")
+            mock_pgroups.append(mock_pgroup)
+            mock_pg_vol = Mock()
+            mock_pg_vol.group.name = mock_pgroup.name
+            mock_pg_vol.member.name = "vol" + str(index)
+            mock_pg_vol.member.destroyed = bool(index == 2)
+            mock_pg_vols.append(mock_pg_vol)
+
+        mock_array.get_protection_groups.return_value = Mock(items=mock_pgroups)
+        mock_array.get_protection_group_snapshots_transfer.return_value = Mock(
+            status_code=200, items=[]
+        )
+        mock_array.get_protection_groups_volumes.return_value = Mock(items=mock_pg_vols)
+        mock_array.get_protection_groups_hosts.return_value = Mock(items=[])
+        mock_array.get_protection_groups_host_groups.return_value = Mock(items=[])
+        mock_array.get_protection_groups_targets.return_value = Mock(items=[])
+        mock_array.get_protection_groups_tags.return_value = Mock(items=[])
+
+        result = generate_pgroups_dict(mock_array)
+
+        mock_array.get_protection_groups.assert_called_once_with(destroyed=False)
+        mock_array.get_protection_groups_volumes.assert_called_once_with()
+        mock_array.get_protection_groups_targets.assert_called_once_with()
+        assert result["pg1"]["volumes"] == ["vol1"]
+        assert result["pg1"]["deleted_volumes"] == []
+        assert result["pg2"]["deleted_volumes"] == ["vol2"]
+        assert result["pg0"]["hosts"] == []
+        assert result["pg0"]["retention_lock"] == "unlocked"
+        assert result["pg0"]["manual_eradication"] == "enabled"
+
+    def test_get_pgroup_transfers_bucketed_by_pgroup(self):
+        """Test snapshot transfers are fetched once and bucketed by pgroup"""
+        mock_array = Mock()
+        mock_transfers = []
+        for snap in ["pg1.1", "pg1.2", "pod1::pg2.daily", "array2:pg3.1"]:
+            mock_transfer = Mock(progress=1.0, destroyed=False)
+            mock_transfer.name = snap
+            mock_transfers.append(mock_transfer)
+        mock_array.get_protection_group_snapshots_transfer.return_value = Mock(
+            status_code=200, items=iter(mock_transfers)
+        )
+
+        result = _get_pgroup_transfers(mock_array)
+
+        mock_array.get_protection_group_snapshots_transfer.assert_called_once_with(
+            limit=1000
+        )
+        assert sorted(result) == ["array2:pg3", "pg1", "pod1::pg2"]
+        assert sorted(result["pg1"]) == ["pg1.1", "pg1.2"]
+        assert result["pod1::pg2"]["pod1::pg2.daily"]["progress"] == 1.0
+
+    def test_get_pgroup_transfers_error(self):
+        """Test snapshot transfer errors return no buckets"""
+        mock_array = Mock()
+        mock_array.get_protection_group_snapshots_transfer.return_value = Mock(
+            status_code=400, errors=[Mock(message="error")]
+        )
+
+        assert _get_pgroup_transfers(mock_array) == {}
+
 
 class TestGenerateDelPgroupsDict:
     """Test cases for generate_del_pgroups_dict function"""
@@ -1064,6 +1909,38 @@ class TestGenerateHgroupsDict:
         assert "hg1" in result
         assert result["hg1"]["destroyed"] is False
 
+    def test_generate_hgroups_dict_shared_connections(self):
+        """Test host groups dict uses a prebuilt connection index"""
+        mock_array = Mock()
+        mock_array.get_rest_version.return_value = "2.38"
+
+        mock_hgroup = Mock()
+        mock_hgroup.name = "hg1"
+        mock_hgroup.is_local = True
+        mock_hgroup.space = Mock()
+
+        mock_connections = []
+        for host in ["host1", "host2"]:
+            mock_connection = Mock(lun=1, nsid=None)
+            mock_connection.host.name = host
+            mock_connection.host_group.name = "hg1"
+            mock_connection.volume.name = "vol1"
+            mock_connections.append(mock_connection)
+
+        mock_array.get_host_groups.return_value = Mock(items=[mock_hgroup])
+        mock_array.get_host_groups_tags.return_value = Mock(items=[])
+        mock_array.get_connections.return_value = Mock(items=mock_connections)
+        mock_array.get_host_groups_hosts.return_value = Mock(items=[])
+        mock_array.get_host_groups_protection_groups.return_value = Mock(items=[])
+
+        connections = _get_connections_index(mock_array)
+        result = generate_hgroups_dict(mock_array, False, connections)
+
+        mock_array.get_connections.assert_called_once_with()
+        assert sorted(connections["hosts"]) == ["host1", "host2"]
+        assert len(connections["volumes"]["vol1"]) == 2
+        assert result["hg1"]["vols"] == [{"name": "vol1", "lun": 1, "nsid": None}]
+
 
 class TestGenerateVgroupsDict:
     """Test cases for generate_vgroups_dict function"""
@@ -1145,6 +2022,22 @@ class TestGenerateDelVgroupsDict:
 
         assert "deleted_vg" in result
 
+    def test_shared_members(self):
+        """Members listed once are used instead of another listing"""
+        mock_array = Mock()
+        mock_array.get_rest_version.return_value = "2.38"
+        mock_vgroup = Mock(spec=["name", "space", "qos"])
+        mock_vgroup.name = "deleted_vg"
+        mock_array.get_volume_groups.return_value = Mock(items=[mock_vgroup])
+        mock_array.get_volume_groups_tags.return_value = Mock(items=[])
+
+        result = generate_del_vgroups_dict(
+            mock_array, {"deleted_vg": ["vol1"], "vg1": ["vol2"]}
+        )
+
+        assert result["deleted_vg"]["volumes"] == ["vol1"]
+        mock_array.get_volume_groups_volumes.assert_not_called()
+
 
 class TestGenerateAppsDict:
     """Test cases for generate_apps_dict function"""
@@ -1438,7 +2331,7 @@ class TestGenerateAlertsDict:
         mock_alert.updated = 1609459200000
         mock_alert.created = 1609459200000
 
-        mock_array.get_alerts.return_value = Mock(items=[mock_alert])
+        mock_array.get_alerts.return_value = Mock(status_code=200, items=[mock_alert])
 
         result = generate_alerts_dict(mock_array)
 
@@ -1493,6 +2386,83 @@ class TestGenerateFleetDict:
         assert "test-fleet" in result
         assert "members" in result["test-fleet"]
 
+    @staticmethod
+    def _fleet_array():
+        mock_array = Mock()
+        mock_array.get_rest_version.return_value = "2.38"
+        mock_fleet = Mock()
+        mock_fleet.name = "test-fleet"
+        mock_array.get_fleets.return_value = Mock(items=[mock_fleet])
+        members = []
+        for name, status in (
+            ("fa1", "connected"),
+            ("fa2", "connected"),
+            ("fa3", "disconnected"),
+        ):
+            member = Mock(spec=["member", "status", "status_details"])
+            member.member.name = name
+            member.status = status
+            member.status_details = None
+            members.append(member)
+        mock_array.get_fleets_members.return_value = Mock(
+            status_code=200, items=members
+        )
+
+        def listing(*names):
+            items = []
+            for name, context in names:
+                item = Mock()
+                item.name = name
+                item.context.name = context
+                items.append(item)
+            return Mock(status_code=200, items=items, continuation_token=None)
+
+        mock_array.get_volumes.return_value = listing(("vol1", "fa1"), ("vol2", "fa2"))
+        mock_array.get_hosts.return_value = listing(("host1", "fa2"))
+        return mock_array
+
+    def test_generate_fleet_dict_no_member_objects(self):
+        """Member objects are only listed when requested"""
+        mock_array = self._fleet_array()
+
+        result = generate_fleet_dict(mock_array)
+
+        assert "volumes" not in result["test-fleet"]["members"]["fa1"]
+        mock_array.get_volumes.assert_not_called()
+
+    def test_generate_fleet_dict_member_objects(self):
+        """Volumes and hosts of connected members are listed in one call each"""
+        mock_array = self._fleet_array()
+
+        result = generate_fleet_dict(mock_array, True)
+
+        fleet_members = result["test-fleet"]["members"]
+        assert fleet_members["fa1"]["volumes"] == ["vol1"]
+        assert fleet_members["fa2"]["volumes"] == ["vol2"]
+        assert fleet_members["fa1"]["hosts"] == []
+        assert fleet_members["fa2"]["hosts"] == ["host1"]
+        assert "volumes" not in fleet_members["fa3"]
+        mock_array.get_volumes.assert_called_once_with(
+            limit=1000, context_names=["fa1", "fa2"], destroyed=False
+        )
+
+    def test_generate_fleet_dict_member_failure(self):
+        """A member whose objects cannot be listed records the error"""
+        mock_array = self._fleet_array()
+        failed = Mock(status_code=500, errors=[Mock(message="Member unreachable")])
+        volumes = mock_array.get_volumes.return_value
+        mock_array.get_volumes.side_effect = lambda **kwargs: (
+            volumes if kwargs["context_names"] == ["fa1"] else failed
+        )
+
+        result = generate_fleet_dict(mock_array, True)
+
+        fleet_members = result["test-fleet"]["members"]
+        assert fleet_members["fa1"]["volumes"] == ["vol1"]
+        assert "volumes" not in fleet_members["fa2"]
+        assert "Member unreachable" in fleet_members["fa2"]["errors"]["volumes"]
+        assert fleet_members["fa2"]["hosts"] == ["host1"]
+
 
 class TestGeneratePresetDict:
     """Test cases for generate_preset_dict function"""
@@ -1599,8 +2569,7 @@ class TestGenerateRealmsDict:
 class TestGenerateConfigDict:
     """Test cases for generate_config_dict function"""
 
-    @patch("plugins.modules.purefa_info.LooseVersion", side_effect=LooseVersion)
-    def test_generate_config_dict_success(self, mock_lv):
+    def test_generate_config_dict_success(self):
         """Test generate_config_dict returns expected config info"""
         mock_module = Mock()
         mock_array = Mock()
@@ -1738,8 +2707,7 @@ class TestGenerateConfigDict:
 class TestGenerateFilesystemsDict:
     """Test cases for generate_filesystems_dict function"""
 
-    @patch("plugins.modules.purefa_info.LooseVersion", side_effect=LooseVersion)
-    def test_generate_filesystems_dict_success(self, mock_lv):
+    def test_generate_filesystems_dict_success(self):
         """Test generate_filesystems_dict returns expected filesystem info"""
         mock_array = Mock()
         mock_array.get_rest_version.return_value = "2.38"
@@ -1786,6 +2754,55 @@ class TestGenerateFilesystemsDict:
         assert result["fs1"]["destroyed"] is False
         assert "directories" in result["fs1"]
 
+    def test_generate_filesystems_dict_bulk_directories(self):
+        """Test directory endpoints are each called once and joined by name"""
+        mock_array = Mock()
+        mock_array.get_rest_version.return_value = "2.38"
+
+        mock_fs = Mock()
+        mock_fs.name = "fs1"
+        mock_fs.destroyed = False
+        mock_array.get_file_systems.return_value = Mock(items=[mock_fs])
+
+        mock_dirs = []
+        for d_name in ["dir1", "dir2"]:
+            mock_dir = Mock()
+            mock_dir.name = "fs1:" + d_name
+            mock_dir.directory_name = d_name
+            mock_dir.destroyed = False
+            mock_dir.file_system.name = "fs1"
+            mock_dirs.append(mock_dir)
+        mock_array.get_directories.return_value = Mock(items=mock_dirs)
+
+        mock_policy = Mock(enabled=True)
+        mock_policy.member.name = "fs1:dir2"
+        mock_policy.policy.name = "snap1"
+        mock_policy.policy.resource_type = "policies-snapshot"
+        mock_array.get_directories_policies.return_value = Mock(items=[mock_policy])
+
+        mock_export = Mock(enabled=True, export_name="export1")
+        mock_export.directory.name = "fs1:dir1"
+        mock_export.policy.name = "nfs1"
+        mock_export.policy.resource_type = "policies-nfs"
+        mock_array.get_directory_exports.return_value = Mock(items=[mock_export])
+
+        mock_perf = Mock(reads_per_sec=10)
+        mock_perf.name = "fs1:dir1"
+        mock_array.get_directories_performance.return_value = Mock(items=[mock_perf])
+
+        result = generate_filesystems_dict(mock_array, performance=True)
+
+        mock_array.get_directories.assert_called_once_with()
+        mock_array.get_directories_policies.assert_called_once_with()
+        mock_array.get_directory_exports.assert_called_once_with()
+        mock_array.get_directories_performance.assert_called_once_with()
+        directories = result["fs1"]["directories"]
+        assert directories["dir1"]["exports"][0]["export_name"] == "export1"
+        assert directories["dir1"]["policies"] == []
+        assert directories["dir1"]["performance"]["reads_per_sec"] == 10
+        assert directories["dir2"]["policies"][0]["policy"]["name"] == "snap1"
+        assert directories["dir2"]["performance"] == []
+
 
 class TestGeneratePgsnapsDict:
     """Test cases for generate_pgsnaps_dict function"""
@@ -1804,7 +2821,9 @@ class TestGeneratePgsnapsDict:
         mock_snap.suffix = "snap1"
         mock_snap.space = Mock(snapshots=5000, used_provisioned=3000)
         mock_snap.eradication_config = Mock(manual_eradication="all-enabled")
-        mock_array.get_protection_group_snapshots.return_value = Mock(items=[mock_snap])
+        mock_array.get_protection_group_snapshots.return_value = Mock(
+            status_code=200, items=[mock_snap]
+        )
 
         result = generate_pgsnaps_dict(mock_array)
 
@@ -1817,8 +2836,7 @@ class TestGeneratePgsnapsDict:
 class TestGenerateDirSnapsDict:
     """Test cases for generate_dir_snaps_dict function"""
 
-    @patch("plugins.modules.purefa_info.LooseVersion", side_effect=LooseVersion)
-    def test_generate_dir_snaps_dict_success(self, mock_lv):
+    def test_generate_dir_snaps_dict_success(self):
         """Test generate_dir_snaps_dict returns expected snapshot info"""
         mock_array = Mock()
         mock_array.get_rest_version.return_value = "2.38"
@@ -1890,6 +2908,74 @@ class TestGeneratePoliciesDict:
         assert result["snap-policy1"]["type"] == "snapshot"
         assert result["snap-policy1"]["enabled"] is True
 
+    def test_generate_policies_dict_fields(self):
+        """Test members and rules are not listed when not requested"""
+        mock_array = Mock()
+        mock_array.get_rest_version.return_value = "2.38"
+        mock_policy = Mock()
+        mock_policy.name = "snap-policy1"
+        mock_policy.policy_type = "snapshot"
+        mock_policy.enabled = True
+        mock_array.get_policies.return_value = Mock(items=[mock_policy])
+
+        result = generate_policies_dict(
+            mock_array,
+            quota_available=False,
+            autodir_available=False,
+            nfs_user_mapping=False,
+            fields=["enabled"],
+        )
+
+        assert result["snap-policy1"]["enabled"] is True
+        mock_array.get_directories_policies.assert_not_called()
+        mock_array.get_policies_snapshot_rules.assert_not_called()
+
+    def test_generate_policies_dict_batched_rules(self):
+        """Test rule endpoints are listed once and grouped by policy"""
+        mock_array = Mock()
+        mock_array.get_rest_version.return_value = "2.38"
+
+        mock_policies = []
+        mock_nfs_policies = []
+        mock_rules = []
+        for index in range(3):
+            mock_policy = Mock(policy_type="nfs", enabled=True)
+            mock_policy.name = "nfs" + str(index)
+            mock_policies.append(mock_policy)
+            mock_nfs_policy = Mock(user_mapping_enabled=bool(index))
+            mock_nfs_policy.name = mock_policy.name
+            mock_nfs_policies.append(mock_nfs_policy)
+            mock_rule = Mock(access="root-squash", permission="rw", nfs_version=[])
+            mock_rule.client = "client" + str(index)
+            mock_rule.policy.name = mock_policy.name
+            mock_rules.append(mock_rule)
+        mock_array.get_policies.return_value = Mock(items=mock_policies)
+        mock_array.get_directories_policies.return_value = Mock(items=[])
+        mock_array.get_policies_nfs.return_value = Mock(items=mock_nfs_policies)
+        mock_array.get_policies_nfs_client_rules.return_value = Mock(items=mock_rules)
+
+        result = generate_policies_dict(
+            mock_array,
+            quota_available=True,
+            autodir_available=True,
+            nfs_user_mapping=True,
+        )
+
+        mock_array.get_directories_policies.assert_called_once_with()
+        mock_array.get_policies_nfs.assert_called_once_with()
+        mock_array.get_policies_nfs_client_rules.assert_called_once_with()
+        mock_array.get_policies_smb_client_rules.assert_not_called()
+        mock_array.get_policies_quota_rules.assert_not_called()
+        assert result["nfs2"]["user_mapping_enabled"] is True
+        assert result["nfs2"]["rules"] == [
+            {
+                "access": "root-squash",
+                "permission": "rw",
+                "client": "client2",
+                "nfs_version": [],
+            }
+        ]
+
 
 class TestGenerateClientsDict:
     """Test cases for generate_clients_dict function"""
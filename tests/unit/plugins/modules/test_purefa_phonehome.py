@@ -35,6 +35,9 @@ sys.modules[
 sys.modules[
     "ansible_collections.purestorage.flasharray.plugins.module_utils.api_helpers"
 ] = MagicMock()
+sys.modules[
+    "ansible_collections.purestorage.flasharray.plugins.module_utils.httpapi"
+] = MagicMock(get_persistent_client=Mock(return_value=None))
 
 from plugins.modules.purefa_phonehome import main
 
@@ -97,6 +100,39 @@ class TestMain:
         mock_array.patch_support.assert_called()
         mock_module.exit_json.assert_called_once_with(changed=True)
 
+    @patch("plugins.modules.purefa_phonehome.check_response")
+    @patch("plugins.modules.purefa_phonehome.LooseVersion")
+    @patch("plugins.modules.purefa_phonehome.get_array")
+    @patch("plugins.modules.purefa_phonehome.get_persistent_client")
+    @patch("plugins.modules.purefa_phonehome.AnsibleModule")
+    @patch("plugins.modules.purefa_phonehome.HAS_PURESTORAGE", True)
+    def test_enable_phonehome_persistent_client(
+        self,
+        mock_ansible_module,
+        mock_get_persistent_client,
+        mock_get_array,
+        mock_loose_version,
+        mock_check_response,
+    ):
+        """Test phonehome is set through the httpapi session when present"""
+        mock_module = Mock()
+        mock_module.check_mode = False
+        mock_module.params = {"state": "present", "excludes": None}
+        mock_ansible_module.return_value = mock_module
+
+        client = Mock()
+        client.get_rest_version.return_value = "2.38"
+        client.get_support.return_value = Mock(items=[Mock(phonehome_enabled=False)])
+        client.patch_support.return_value = Mock(status_code=200)
+        mock_get_persistent_client.return_value = client
+        mock_loose_version.side_effect = float
+
+        main()
+
+        mock_get_array.assert_not_called()
+        client.patch_support.assert_called()
+        mock_module.exit_json.assert_called_once_with(changed=True)
+
     @patch("plugins.modules.purefa_phonehome.check_response")
     @patch("plugins.modules.purefa_phonehome.LooseVersion")
     @patch("plugins.modules.purefa_phonehome.get_array")
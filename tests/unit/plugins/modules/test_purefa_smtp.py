@@ -47,6 +47,9 @@ mock_version_module.LooseVersion = LooseVersion
 sys.modules[
     "ansible_collections.purestorage.flasharray.plugins.module_utils.version"
 ] = mock_version_module
+sys.modules[
+    "ansible_collections.purestorage.flasharray.plugins.module_utils.httpapi"
+] = MagicMock(get_persistent_client=Mock(return_value=None))
 
 from plugins.modules.purefa_smtp import (
     delete_smtp,